@@ -0,0 +1,67 @@
+import argparse
+import json
+import os
+import sys
+import timeit
+# the repository root, so the scripts run from any directory
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from jsonbind.core import Serialization, Backends
+from jsonbind.special import List, Object
+
+
+class Row(Object):
+    def __init__(self):
+        super(Row, self).__init__(id=0, name="", score=0.0, active=False, tags=[], meta=Object(source="", version=0))
+
+
+def create_payloads(size: int) -> dict:
+    rows = List.create_type(Row)()
+    for i in range(size):
+        row = Row()
+        row.id = i
+        row.name = "row number %d" % i
+        row.score = i / 7
+        row.active = i % 2 == 0
+        row.tags = ["tag%d" % (i % 5), "tag%d" % (i % 3)]
+        row.meta.source = "benchmark"
+        row.meta.version = i % 10
+        rows.append(row)
+    return {"rows": rows,
+            "numbers": [i * 1.5 for i in range(size * 10)],
+            "text": ["lorem ipsum dolor sit amet %d" % i * 4 for i in range(size)],
+            "nested": {"level%d" % i: {"values": list(range(20)), "child": {"name": "child %d" % i}} for i in range(size)}}
+
+
+def run(size: int, repeat: int) -> list:
+    results = list()
+    payloads = create_payloads(size)
+    for payload_name, payload in payloads.items():
+        python_type = payload.__class__
+        for backend in Backends.available_backends():
+            json_string = Serialization.serialize(payload, backend=backend)
+            dumps_time = min(timeit.repeat(lambda: Serialization.serialize(payload, backend=backend),
+                                           number=1, repeat=repeat))
+            loads_time = min(timeit.repeat(lambda: Serialization.deserialize(json_string, python_type, backend=backend),
+                                           number=1, repeat=repeat))
+            results.append({"payload": payload_name,
+                            "backend": backend,
+                            "bytes": len(json_string),
+                            "dumps_seconds": dumps_time,
+                            "loads_seconds": loads_time})
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="compares the json backends on representative payloads")
+    parser.add_argument("--size", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="print machine readable results")
+    args = parser.parse_args()
+    results = run(size=args.size, repeat=args.repeat)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print("%-10s %-8s %12s %12s %12s" % ("payload", "backend", "bytes", "dumps (ms)", "loads (ms)"))
+        for result in results:
+            print("%-10s %-8s %12d %12.2f %12.2f" % (result["payload"], result["backend"], result["bytes"],
+                                                    result["dumps_seconds"] * 1000, result["loads_seconds"] * 1000))
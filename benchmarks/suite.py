@@ -0,0 +1,237 @@
+import argparse
+import datetime
+import enum
+import importlib.util
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+# the repository root, so the scripts run from any directory
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import jsonbind
+from jsonbind.core import Serialization
+from jsonbind.core.binary import Msgpack
+from jsonbind.bindings import BoundClass
+from jsonbind.special import List, ArrayList, Object
+from jsonbind.special.util import bin_search, bin_search_many, bin_search_ranges, SearchType
+
+
+class Color(enum.Enum):
+    red = 0
+    green = 1
+    blue = 2
+
+
+class Point(BoundClass):
+    def __init__(self):
+        self.x = 0.0
+        self.y = 0.0
+        self.label = ""
+
+
+class Node(Object):
+    def __init__(self):
+        super(Node, self).__init__(id=0, name="", score=0.0, active=False, tags=List(list_type=str), child=Object())
+
+
+def create_node(i: int, depth: int) -> Node:
+    node = Node()
+    node.id = i
+    node.name = "node %d" % i
+    node.score = i / 7
+    node.active = i % 2 == 0
+    node.tags.extend(["tag%d" % (i % 5), "tag%d" % (i % 3)])
+    # each level nests a plain object, so depth controls how deep the documents go
+    child = node.child
+    for level in range(depth):
+        child.level = level
+        child.value = i * level
+        child.child = Object()
+        child = child.child
+    return node
+
+
+def create_point(i: int) -> Point:
+    point = Point()
+    point.x = i * 0.5
+    point.y = -i * 0.25
+    point.label = "p%d" % i
+    return point
+
+
+def binding_datasets(size: int) -> dict:
+    # one typed list per built-in binding, every element goes through the binding
+    start = datetime.datetime(2020, 1, 1)
+    values = {"datetime": [start + datetime.timedelta(seconds=i * 37) for i in range(size)],
+              "date": [start.date() + datetime.timedelta(days=i % 3650) for i in range(size)],
+              "time": [(start + datetime.timedelta(seconds=i)).time() for i in range(size)],
+              "bytes": [b"payload %d" % i for i in range(size)],
+              "enum": [Color(i % 3) for i in range(size)],
+              "set": [{i, i + 1, i + 2} for i in range(size)],
+              "tuple": [(i, i * 2, "t%d" % i) for i in range(size)],
+              "BoundClass": [create_point(i) for i in range(size)]}
+    return {name: List.create_type(items[0].__class__)(items) for name, items in values.items()}
+
+
+def create_cases(size: int, depth: int) -> dict:
+    # case name -> (function, items processed per call)
+    cases = dict()
+    for name, python_value in binding_datasets(size).items():
+        python_type = python_value.__class__
+        json_string = Serialization.serialize(python_value)
+        cases["dumps/" + name] = (lambda v=python_value: Serialization.serialize(v), size)
+        cases["loads/" + name] = (lambda s=json_string, t=python_type: Serialization.deserialize(s, t), size)
+
+    nodes = List.create_type(Node)([create_node(i, depth) for i in range(size)])
+    nodes_type = nodes.__class__
+    nodes_json = Serialization.serialize(nodes)
+    cases["dumps/Object"] = (lambda: Serialization.serialize(nodes), size)
+    cases["loads/Object"] = (lambda: Serialization.deserialize(nodes_json, nodes_type), size)
+    cases["roundtrip/Object"] = (lambda: Serialization.deserialize(Serialization.serialize(nodes), nodes_type), size)
+    cases["roundtrip/List"] = (lambda: Serialization.deserialize(Serialization.serialize(nodes[0].tags * size), List), size)
+    numbers = List.create_type(float)(i * 0.5 for i in range(size))
+    numbers_json = Serialization.serialize(numbers)
+    cases["roundtrip/List[float]"] = (lambda: Serialization.deserialize(numbers_json, numbers.__class__), size)
+    array_numbers = ArrayList(float, numbers)
+    cases["roundtrip/ArrayList"] = (lambda: Serialization.deserialize(Serialization.serialize(array_numbers),
+                                                                      array_numbers.__class__), size)
+
+    # binary documents need msgpack, they are compared with dumps/Object, loads/Object and roundtrip/ArrayList
+    if Msgpack.is_available():
+        nodes_binary = Serialization.serialize_binary(nodes)
+        cases["binary/dumpb/Object"] = (lambda: Serialization.serialize_binary(nodes), size)
+        cases["binary/loadb/Object"] = (lambda: Serialization.deserialize_binary(nodes_binary, nodes_type), size)
+        numbers_binary = Serialization.serialize_binary(array_numbers)
+        cases["binary/roundtrip/ArrayList"] = (lambda: Serialization.deserialize_binary(Serialization.serialize_binary(array_numbers),
+                                                                                        array_numbers.__class__), size)
+        cases["binary/loadb/List[float]"] = (lambda: Serialization.deserialize_binary(numbers_binary, numbers.__class__), size)
+
+    sorted_values = list(range(0, size * 2, 2))
+    probes = list(range(0, size * 2, 3))
+    cases["search/bin_search"] = (lambda: [bin_search(sorted_values, p, search_type=SearchType.Aprox) for p in probes],
+                                  len(probes))
+    cases["search/bin_search_many"] = (lambda: bin_search_many(sorted_values, probes), len(probes))
+    cases["search/bin_search_many_key"] = (lambda: bin_search_many(nodes, probes, key=lambda n: n.id * 2), len(probes))
+    cases["search/bin_search_ranges"] = (lambda: bin_search_ranges(sorted_values, [(p, p + 10) for p in probes]),
+                                         len(probes))
+
+    if importlib.util.find_spec("numpy"):
+        import numpy as np
+        from jsonbind.addons import numpy
+        flat = List.create_type(float)(numbers)
+        numeric_array = np.arange(size, dtype=float)
+        cases["numpy/to_numpy_array"] = (lambda: flat.to_numpy_array(), size)
+        cases["numpy/from_numpy_array"] = (lambda: flat.__class__.from_numpy_array(numeric_array.reshape(-1, 1)), size)
+        cases["numpy/ArrayList.to_numpy_array"] = (lambda: array_numbers.to_numpy_array(), size)
+        cases["numpy/ArrayList.from_numpy_array"] = (lambda: array_numbers.__class__.from_numpy_array(numeric_array),
+                                                     size)
+        cases["numpy/search_ArrayList"] = (lambda: array_numbers.find_ordered_indexes(probes,
+                                                                                      search_type=SearchType.LowerBound),
+                                           len(probes))
+        cases["numpy/Object.to_numpy_array"] = (lambda: nodes.to_numpy_array(), size)
+
+    if importlib.util.find_spec("pandas"):
+        from jsonbind.addons import pandas
+        points = List.create_type(Object)(Object(x=i * 0.5, y=i, label="p%d" % i) for i in range(size))
+        data_frame = points.to_data_frame()
+        cases["pandas/to_data_frame"] = (lambda: points.to_data_frame(), size)
+        cases["pandas/from_data_frame"] = (lambda: points.__class__.from_data_frame(data_frame), size)
+    return cases
+
+
+def percentile(sorted_values: list, fraction: float) -> float:
+    position = (len(sorted_values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def measure(function, items: int, repeat: int, warmup: int = 1) -> dict:
+    for _ in range(warmup):
+        function()
+    timings = list()
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    # memory is traced on a separate run, tracing slows the calls down too much to time them
+    tracemalloc.start()
+    function()
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    median = percentile(timings, 0.5)
+    return {"items": items,
+            "repeat": repeat,
+            "min_seconds": timings[0],
+            "p50_seconds": median,
+            "p90_seconds": percentile(timings, 0.9),
+            "p99_seconds": percentile(timings, 0.99),
+            "max_seconds": timings[-1],
+            "items_per_second": items / median if median else 0.0,
+            "peak_memory_bytes": peak_memory}
+
+
+def run(size: int, depth: int, repeat: int, case_filter: str = "") -> dict:
+    results = dict()
+    for name, (function, items) in create_cases(size=size, depth=depth).items():
+        if case_filter and case_filter not in name:
+            continue
+        results[name] = measure(function, items=items, repeat=repeat)
+    return {"environment": {"python": platform.python_version(),
+                            "platform": platform.platform(),
+                            "jsonbind": getattr(jsonbind, "__version__", "")},
+            "parameters": {"size": size, "depth": depth, "repeat": repeat},
+            "results": results}
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> list:
+    # cases whose median time grew more than tolerance (0.2 = 20%) over the baseline
+    regressions = list()
+    for name, result in report["results"].items():
+        if name not in baseline["results"]:
+            continue
+        baseline_seconds = baseline["results"][name]["p50_seconds"]
+        if baseline_seconds and result["p50_seconds"] > baseline_seconds * (1 + tolerance):
+            regressions.append({"case": name,
+                                "baseline_seconds": baseline_seconds,
+                                "p50_seconds": result["p50_seconds"],
+                                "ratio": result["p50_seconds"] / baseline_seconds})
+    return regressions
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="measures jsonbind bindings, special types and searches")
+    parser.add_argument("--size", type=int, default=10000, help="elements in each dataset")
+    parser.add_argument("--depth", type=int, default=3, help="nesting levels of the object documents")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--filter", default="", help="only run the cases whose name contains this text")
+    parser.add_argument("--json", action="store_true", help="print machine readable results")
+    parser.add_argument("--output", default="", help="write the machine readable results to this file")
+    parser.add_argument("--baseline", default="", help="results file to compare against, exits with 1 on regressions")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+    report = run(size=args.size, depth=args.depth, repeat=args.repeat, case_filter=args.filter)
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(report, output_file, indent=2)
+    regressions = list()
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            regressions = compare(report, json.load(baseline_file), args.tolerance)
+        report["regressions"] = regressions
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print("%-34s %12s %12s %12s %14s %12s" % ("case", "p50 (ms)", "p90 (ms)", "p99 (ms)", "items/s", "peak (KB)"))
+        for name, result in report["results"].items():
+            print("%-34s %12.2f %12.2f %12.2f %14.0f %12.1f" % (name, result["p50_seconds"] * 1000,
+                                                                result["p90_seconds"] * 1000,
+                                                                result["p99_seconds"] * 1000,
+                                                                result["items_per_second"],
+                                                                result["peak_memory_bytes"] / 1024))
+        for regression in regressions:
+            print("regression: %s is %.2fx slower than the baseline" % (regression["case"], regression["ratio"]))
+    sys.exit(1 if regressions else 0)
@@ -1,6 +1,7 @@
-from .basic_functions import load, loads, dump, dumps
+from .basic_functions import load, loads, loadb, dump, dumps, dumpb, dumps_bytes, dumps_many, loads_many, iterload, load_lines, dump_lines
+from .async_functions import aload, aiterload, adump
 from .decorators import parse_parameters
-from .core import TypeBinding, Bindings, Serialization, JsonTypes
+from .core import TypeBinding, Bindings, Serialization, JsonTypes, Profiler
 from . import bindings
 from . import special
 from . import addons
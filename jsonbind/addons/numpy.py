@@ -5,8 +5,9 @@ if not spec:
     raise RuntimeError("pandas not installed")
 else:
     import numpy as np
-    from ..special.object import Object
+    from ..special.object import BaseObject
     from ..special.list import List
+    from ..special.array_list import ArrayList
 
     def to_numpy_array(self):
         """
@@ -21,15 +22,34 @@ else:
         if self.list_type is None:
             raise TypeError("list must have a list_type")
 
-        if issubclass(self.list_type, Object):
+        if issubclass(self.list_type, BaseObject):
             if not self:
-                return np.array()
-            columns = self[0].get_columns()
-            values = [tuple([column_value for column_name, column_value in i.get_values()]) for i in self]
-            return np.array(values, dtype=columns)
+                # the fields come from a default element
+                return np.empty(0, dtype=[(column_name, column_array([], column_type).dtype)
+                                          for column_name, column_type in self.list_type().get_columns()])
+            # one array per column, joined into the structured array in one assignment per column
+            column_types = dict(self[0].get_columns())
+            column_arrays = [(column_name, column_array(column, column_types[column_name]))
+                             for column_name, column in self.to_columns().items()]
+            numpy_array = np.empty(len(self), dtype=[(column_name, array.dtype) for column_name, array in column_arrays])
+            for column_name, array in column_arrays:
+                numpy_array[column_name] = array
+            return numpy_array
 
         return np.array(self)
 
+    def column_array(values: list, column_type: type) -> np.ndarray:
+        if column_type in (bool, int, float):
+            try:
+                return np.fromiter(values, dtype=column_type, count=len(values))
+            except (TypeError, ValueError, OverflowError):
+                pass
+        if column_type is str:
+            return np.array(values, dtype=str)
+        array = np.empty(len(values), dtype=object)
+        array[:] = values
+        return array
+
     List.to_numpy_array = to_numpy_array
 
     @classmethod
@@ -54,17 +74,35 @@ else:
         if new_list.list_type is None:
             raise TypeError("list must have a list_type")
 
-        if issubclass(new_list.list_type, Object):
-            columns = numpy_array.dtype.names
-            for row in numpy_array:
-                ni = new_list.list_type()
-                for i, c in enumerate(columns):
-                    ni[c] = row[i].item()
-                new_list.append(ni)
-        else:
-            for row in numpy_array:
-                new_list.append(row[0].item())
+        if issubclass(new_list.list_type, BaseObject):
+            # tolist converts a whole column to python values in one call
+            columns = {column_name: numpy_array[column_name].tolist() for column_name in numpy_array.dtype.names}
+            return list_cls.from_columns(columns, list_type=new_list.list_type)
+        values = numpy_array[:, 0] if numpy_array.ndim > 1 else numpy_array
+        new_list.extend(values.tolist())
         return new_list
 
     List.from_numpy_array = from_numpy_array
 
+
+    def array_list_to_numpy_array(self):
+        """
+        View the list buffer as a numpy array, without copying.
+
+        Returns:
+        numpy.array: array sharing memory with the list, it must not be used after the list is resized.
+        """
+        return np.frombuffer(self, dtype=self.typecode) if self else np.array([], dtype=self.typecode)
+
+    ArrayList.to_numpy_array = array_list_to_numpy_array
+
+    @classmethod
+    def array_list_from_numpy_array(list_cls: type, numpy_array: np.array) -> ArrayList:
+        """
+        Create a list from a one dimensional numpy array, copying its buffer in one call.
+        """
+        new_list = list_cls()
+        new_list.frombytes(np.ascontiguousarray(numpy_array, dtype=new_list.typecode).tobytes())
+        return new_list
+
+    ArrayList.from_numpy_array = array_list_from_numpy_array
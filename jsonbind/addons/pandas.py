@@ -1,11 +1,13 @@
 import importlib.util
+import operator
+import typing
 
 spec = importlib.util.find_spec('pandas')
 if not spec:
     raise RuntimeError("pandas not installed")
 else:
     import pandas as pd
-    from ..special.object import Object
+    from ..special.object import BaseObject
     from ..special.list import List
 
 
@@ -20,31 +22,98 @@ else:
 
         return pd.Series(values)
 
-    Object.to_data_series = to_data_series
-
-    def to_data_frame(self):
+    BaseObject.to_data_series = to_data_series
+
+    # pandas dtypes for the member types, other members are left for pandas to infer
+    __dtypes__ = {bool: "bool", int: "int64", float: "float64"}
+
+    def schema_dtypes(list_type: type) -> dict:
+        # column -> dtype from the members of a default constructed object, None for the ones pandas infers
+        try:
+            columns = list_type().get_columns()
+        except TypeError:
+            return dict()
+        return {column_name: __dtypes__.get(column_type, None) for column_name, column_type in columns}
+
+    def columns_data_frame(rows: list, column_types: list, dtypes: dict, index: range) -> pd.DataFrame:
+        data = dict()
+        for column_name, column_type in column_types:
+            column = list(map(operator.attrgetter(column_name), rows))
+            if isinstance(column_type, type) and issubclass(column_type, List):
+                column = [value.to_data_frame() if isinstance(value, List) else value for value in column]
+            dtype = dtypes.get(column_name, None)
+            try:
+                data[column_name] = pd.Series(column, dtype=dtype, index=index)
+            except (TypeError, ValueError, OverflowError):
+                # values that do not fit the hint (None, mixed types) keep the inferred dtype
+                data[column_name] = pd.Series(column, index=index)
+        return pd.DataFrame(data, index=index)
+
+    def to_data_frames(self, chunk_size: int, dtypes: dict = None) -> typing.Iterator[pd.DataFrame]:
         """
-        Convert the list to a pandas DataFrame.
+        Convert the list to pandas DataFrames of up to chunk_size rows.
 
         Parameters:
-        - recursive (bool): Flag to indicate if nested objects should be recursively converted to DataFrame columns.
+        - chunk_size (int): Rows in each DataFrame.
+        - dtypes (dict): Column dtypes, on top of the ones taken from the members of list_type.
 
         Returns:
-        pandas.DataFrame: The DataFrame representation of the list.
+        iterator of pandas.DataFrame: The rows of the list in order, the index continues from one frame to the next.
         """
         if self.list_type is None:
             raise TypeError("list must have a list_type")
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+
+        if not issubclass(self.list_type, BaseObject):
+            if not self:
+                yield pd.DataFrame()
+            for start in range(0, len(self), chunk_size):
+                rows = list.__getitem__(self, slice(start, start + chunk_size))
+                yield pd.DataFrame(rows, index=range(start, start + len(rows)))
+            return
+
+        column_dtypes = schema_dtypes(self.list_type)
+        column_dtypes.update(dtypes or dict())
+        if not self:
+            yield pd.DataFrame({column_name: pd.Series([], dtype=dtype or object) for column_name, dtype in column_dtypes.items()})
+            return
+        column_types = list.__getitem__(self, 0).get_columns()
+        for start in range(0, len(self), chunk_size):
+            rows = list.__getitem__(self, slice(start, start + chunk_size))
+            yield columns_data_frame(rows, column_types, column_dtypes, range(start, start + len(rows)))
+
+    List.to_data_frames = to_data_frames
+
+    def to_data_frame(self, dtypes: dict = None):
+        """
+        Convert the list to a pandas DataFrame.
 
-        if issubclass(self.list_type, Object):
-            return pd.DataFrame([i.to_data_series() for i in self])
-        else:
-            return pd.DataFrame(self)
+        Parameters:
+        - dtypes (dict): Column dtypes, on top of the ones taken from the members of list_type.
 
+        Returns:
+        pandas.DataFrame: The DataFrame representation of the list, one column per member (dotted names for nested
+        objects).
+        """
+        return next(iter(to_data_frames(self, chunk_size=max(len(self), 1), dtypes=dtypes)))
 
     List.to_data_frame = to_data_frame
 
     @classmethod
-    def from_data_frame(list_cls: type, data_frame:pd.DataFrame, list_type: type = None):
+    def from_data_frame(list_cls: type,
+                        data_frame: typing.Union[pd.DataFrame, typing.Iterable[pd.DataFrame]],
+                        list_type: type = None,
+                        chunk_size: int = 0):
+        """
+        Create a list from a pandas DataFrame, or from the frames of a chunked reader (pd.read_csv(chunksize=...)).
+
+        Parameters:
+        - data_frame: The DataFrame or DataFrames to load, one object per row.
+        - list_type (type): The type of the elements, defaults to the list_type of list_cls.
+        - chunk_size (int): Rows converted at a time, 0 converts each frame at once. Only one chunk of the
+        frame is held as python values while the objects are built.
+        """
         if not issubclass(list_cls, List):
             raise TypeError("list_cls must inherit from List")
 
@@ -55,14 +124,18 @@ else:
 
         if new_list.list_type is None:
             raise TypeError("list must have a list_type")
-        if not issubclass(new_list.list_type, Object):
-            raise TypeError("list_type must inherit from Object")
-        columns = data_frame.dtypes.to_dict()
-        for i, row in data_frame.iterrows():
-            ni = new_list.list_type()
-            for column_name, column_type in columns.items():
-                ni[column_name] = row[column_name].item()
-            new_list.append(ni)
+        data_frames = [data_frame] if isinstance(data_frame, pd.DataFrame) else data_frame
+        for frame in data_frames:
+            size = len(frame)
+            step = chunk_size if chunk_size > 0 else max(size, 1)
+            for start in range(0, size, step):
+                rows = frame.iloc[start:start + step]
+                if issubclass(new_list.list_type, BaseObject):
+                    # tolist converts a whole column to python values in one call
+                    columns = {column_name: rows[column_name].tolist() for column_name in rows.columns}
+                    new_list.extend(list_cls.from_columns(columns, list_type=new_list.list_type), trusted=True)
+                else:
+                    new_list.extend(rows.iloc[:, 0].tolist())
         return new_list
 
     List.from_data_frame = from_data_frame
@@ -0,0 +1,37 @@
+from jsonbind.core.async_serialization import AsyncSerialization
+
+
+async def aload(stream, cls: type=None, chunk_size: int=65536, executor=None):
+    return await AsyncSerialization.deserialize_from(stream=stream,
+                                                     python_type=cls,
+                                                     chunk_size=chunk_size,
+                                                     executor=executor)
+
+def aiterload(stream, cls: type=None, chunk_size: int=65536, executor=None):
+    return AsyncSerialization.deserialize_iter(stream=stream,
+                                               python_type=cls,
+                                               chunk_size=chunk_size,
+                                               executor=executor)
+
+async def adump(obj,
+                writer,
+                skipkeys=False,
+                ensure_ascii=True,
+                check_circular=True,
+                allow_nan=True,
+                indent=None,
+                separators=(',', ':'),
+                sort_keys=False,
+                executor=None,
+                **kw):
+    return await AsyncSerialization.serialize_to(python_value=obj,
+                                                 writer=writer,
+                                                 executor=executor,
+                                                 skipkeys=skipkeys,
+                                                 ensure_ascii=ensure_ascii,
+                                                 check_circular=check_circular,
+                                                 allow_nan=allow_nan,
+                                                 indent=indent,
+                                                 separators=separators,
+                                                 sort_keys=sort_keys,
+                                                 **kw)
@@ -1,13 +1,29 @@
 from jsonbind.core.serialization import Serialization
 
 
-def loads(json_string: str, cls: type=None):
-    return Serialization.deserialize(json_string=json_string, python_type=cls)
+def loads(json_string, cls: type=None, backend=None, projection=None):
+    return Serialization.deserialize(json_string=json_string, python_type=cls, backend=backend, projection=projection)
+
+def loadb(data, cls: type=None, projection=None, compiled=None):
+    return Serialization.deserialize_binary(data=data, python_type=cls, projection=projection, compiled=compiled)
 
 def load(fp):
     json_string = fp.read()
     return loads(json_string)
 
+def iterload(fp, cls: type=None, chunk_size: int=65536):
+    return Serialization.deserialize_iter(fp=fp, python_type=cls, chunk_size=chunk_size)
+
+def loads_many(json_strings, cls: type=None, backend=None, workers: int=0, chunk_size: int=1000):
+    return Serialization.deserialize_many(json_strings=json_strings,
+                                          python_type=cls,
+                                          backend=backend,
+                                          workers=workers,
+                                          chunk_size=chunk_size)
+
+def load_lines(fp, cls: type=None, workers: int=0, chunk_size: int=1000):
+    return Serialization.deserialize_lines(fp=fp, python_type=cls, workers=workers, chunk_size=chunk_size)
+
 def dumps(obj,
           skipkeys=False,
           ensure_ascii=True,
@@ -32,6 +48,56 @@ def dumps(obj,
                                    **kw)
 
 
+def dumpb(obj, check_circular=True, compiled=None):
+    return Serialization.serialize_binary(python_value=obj, check_circular=check_circular, compiled=compiled)
+
+
+def dumps_bytes(obj,
+                skipkeys=False,
+                ensure_ascii=True,
+                check_circular=True,
+                allow_nan=True,
+                cls=None,
+                indent=None,
+                separators=(',', ':'),
+                default=None,
+                sort_keys=False,
+                **kw):
+    return Serialization.serialize_bytes(python_value=obj,
+                                         cls=cls,
+                                         skipkeys=skipkeys,
+                                         ensure_ascii=ensure_ascii,
+                                         check_circular=check_circular,
+                                         allow_nan=allow_nan,
+                                         indent=indent,
+                                         separators=separators,
+                                         default=default,
+                                         sort_keys=sort_keys,
+                                         **kw)
+
+def dumps_many(objs,
+               cls: type=None,
+               backend=None,
+               skipkeys=False,
+               ensure_ascii=True,
+               check_circular=True,
+               allow_nan=True,
+               indent=None,
+               separators=(',', ':'),
+               sort_keys=False,
+               **kw):
+    return Serialization.serialize_many(python_values=objs,
+                                        python_type=cls,
+                                        backend=backend,
+                                        skipkeys=skipkeys,
+                                        ensure_ascii=ensure_ascii,
+                                        check_circular=check_circular,
+                                        allow_nan=allow_nan,
+                                        indent=indent,
+                                        separators=separators,
+                                        sort_keys=sort_keys,
+                                        **kw)
+
 def dump(obj,
          fp,
          skipkeys=False,
@@ -43,15 +109,39 @@ def dump(obj,
          separators=(',', ':'),
          default=None,
          sort_keys=False, **kw):
-    json_string = dumps(obj=obj,
-                        skipkeys=skipkeys,
-                        ensure_ascii=ensure_ascii,
-                        check_circular=check_circular,
-                        allow_nan=allow_nan,
-                        cls=cls,
-                        indent=indent,
-                        separators=separators,
-                        default=default,
-                        sort_keys=sort_keys,
-                        **kw)
-    return fp.write(json_string.encode("utf8"))
+    return Serialization.serialize_to(python_value=obj,
+                                      fp=fp,
+                                      cls=cls,
+                                      skipkeys=skipkeys,
+                                      ensure_ascii=ensure_ascii,
+                                      check_circular=check_circular,
+                                      allow_nan=allow_nan,
+                                      indent=indent,
+                                      separators=separators,
+                                      default=default,
+                                      sort_keys=sort_keys,
+                                      **kw)
+
+
+def dump_lines(objs,
+               fp,
+               skipkeys=False,
+               ensure_ascii=True,
+               check_circular=True,
+               allow_nan=True,
+               cls=None,
+               separators=(',', ':'),
+               default=None,
+               sort_keys=False,
+               **kw):
+    return Serialization.serialize_lines(python_values=objs,
+                                         fp=fp,
+                                         cls=cls,
+                                         skipkeys=skipkeys,
+                                         ensure_ascii=ensure_ascii,
+                                         check_circular=check_circular,
+                                         allow_nan=allow_nan,
+                                         separators=separators,
+                                         default=default,
+                                         sort_keys=sort_keys,
+                                         **kw)
@@ -1,4 +1,5 @@
 import base64
+import typing
 from jsonbind.core.type_binding import TypeBinding, Bindings
 
 
@@ -10,8 +11,16 @@ class BytesBinding(TypeBinding):
     def to_json_value(self, python_value: bytes) -> str:
         return base64.b64encode(python_value).decode(self.encoding)
 
-    def to_python_value(self, json_value: str, python_type: type) -> bytes:
+    def to_json_token(self, python_value: bytes) -> bytes:
+        return b'"' + base64.b64encode(python_value) + b'"'
+
+    def to_python_value(self, json_value: typing.Union[str, bytes], python_type: type) -> bytes:
+        # binary documents (Serialization.deserialize_binary) carry the bytes as they are
+        if json_value.__class__ is bytes:
+            return json_value
         return base64.b64decode(json_value)
 
 
 Bindings.set_binding(BytesBinding(encoding='ascii'))
+# untyped bin values of binary documents bind as bytes
+Bindings.__default_binding__[bytes] = Bindings.get_binding(bytes)
@@ -1,24 +1,18 @@
+import typing
 from jsonbind.core.type_binding import TypeBinding, Bindings
+from jsonbind.core.plan import ClassPlan
 
 
 class BoundClass(object):
     def __to_json_dict__(self) -> dict:
-        new_dict = dict()
-        for key, value in self.__dict__.items():
-            if key.startswith("_"):
-                continue
-            new_dict[key] = Bindings.to_json_value(value)
-        return new_dict
+        return ClassPlan.get(self.__class__).to_json_dict(self.__dict__)
 
     @classmethod
     def __from_json_dict__(cls, values: dict) -> "BoundClass":
-        new_bound_object = cls()
-        for key, value in values.items():
-            if key in new_bound_object.__dict__:
-                bond = Bindings.get_binding(new_bound_object.__dict__[key].__class__)
-                new_bound_object.__dict__[key] = bond.to_python_value(value, new_bound_object.__dict__[key].__class__)
-            else:
-                new_bound_object.__dict__[key] = value
+        plan = ClassPlan.get(cls)
+        values = plan.to_python_dict(values)
+        new_bound_object = plan.new_instance(values)
+        new_bound_object.__dict__.update(values)
         return new_bound_object
 
 
@@ -31,10 +25,25 @@ class ClassBinding(TypeBinding):
         json_value = python_value.__to_json_dict__()
         return json_value
 
+    def to_json_items(self, python_value: BoundClass) -> typing.Union[None, typing.Iterable]:
+        if python_value.__class__.__to_json_dict__ is not BoundClass.__to_json_dict__:
+            return None
+        return ClassPlan.get(python_value.__class__).to_json_items(python_value.__dict__)
+
     def to_python_value(self, json_value: dict, python_type: type) -> BoundClass:
         if not issubclass(python_type, BoundClass):
             raise TypeError("python_type must inherit from BoundClass".format(python_type.__name__))
         return python_type.__from_json_dict__(values=json_value)
 
+    def to_python_projection(self, json_value: dict, python_type: type, projection: dict) -> BoundClass:
+        if not issubclass(python_type, BoundClass) or python_type.__from_json_dict__.__func__ is not BoundClass.__from_json_dict__.__func__:
+            # custom decoders get the whole document
+            return self.to_python_value(json_value=json_value, python_type=python_type)
+        plan = ClassPlan.get(python_type)
+        values = plan.to_python_dict(json_value, projection)
+        new_bound_object = plan.new_instance(values, projected=projection is not None)
+        new_bound_object.__dict__.update(values)
+        return new_bound_object
+
 
 Bindings.set_binding(ClassBinding())
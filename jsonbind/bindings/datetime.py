@@ -1,16 +1,43 @@
 import datetime
+import functools
+import re
 import typing
 from jsonbind.core.type_binding import TypeBinding, Bindings
 from enum import Enum
 
+# http dates are always written with the english names
+__weekdays__ = {"Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"}
+__months__ = {name: number + 1 for number, name in enumerate(["Jan", "Feb", "Mar", "Apr", "May", "Jun",
+                                                                "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"])}
+__http_date__ = re.compile(r"([A-Z][a-z]{2}), (\d{2}) ([A-Z][a-z]{2}) (\d{4}) (\d{2}):(\d{2}):(\d{2}) GMT", re.ASCII)
+
+
+def __http_date_fields__(json_value: str) -> typing.Union[None, typing.Tuple[int, ...]]:
+    match = __http_date__.fullmatch(json_value)
+    if match is None or match.group(1) not in __weekdays__ or match.group(3) not in __months__:
+        return None
+    return (int(match.group(4)), __months__[match.group(3)], int(match.group(2)),
+            int(match.group(5)), int(match.group(6)), int(match.group(7)))
+
+
+def __cached__(parse: typing.Callable, cache_size: int) -> typing.Callable:
+    # parsed values are immutable, so repeated strings can share them
+    return functools.lru_cache(maxsize=cache_size)(parse) if cache_size else parse
+
 
 class DateTimeBinding(TypeBinding):
     class Format(Enum):
         time_stamp = "%Y-%m-%d %H:%M:%S.%f"
         http_date = "%a, %d %b %Y %H:%M:%S GMT"
 
+    # strftime output of the iso like formats, parsed with fromisoformat. Anything else strptime accepts
+    # (single digit fields, for instance) goes through strptime
+    __iso_formats__: typing.Dict[str, typing.Pattern] = {
+        Format.time_stamp.value: re.compile(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d{6}", re.ASCII)}
+
     def __init__(self, date_time_format: typing.Union[str, "DateTimeBinding.Format"],
-                 python_type: type = None):
+                 python_type: type = None,
+                 cache_size: int = 4096):
 
         if python_type:
             if not issubclass(python_type, datetime.datetime):
@@ -21,13 +48,34 @@ class DateTimeBinding(TypeBinding):
             date_time_format = date_time_format.value
         super().__init__(json_type=str, python_type=python_type)
         self.date_format = date_time_format
+        self.parse: typing.Callable = __cached__(self.__parser__(), cache_size)
+
+    def __parser__(self) -> typing.Callable:
+        date_format = self.date_format
+        if date_format in DateTimeBinding.__iso_formats__:
+            is_iso = DateTimeBinding.__iso_formats__[date_format].fullmatch
+
+            def parse(json_value: str, python_type: type) -> datetime.datetime:
+                if is_iso(json_value):
+                    return python_type.fromisoformat(json_value)
+                return python_type.strptime(json_value, date_format)
+        elif date_format == DateTimeBinding.Format.http_date.value:
+            def parse(json_value: str, python_type: type) -> datetime.datetime:
+                fields = __http_date_fields__(json_value)
+                if fields is not None:
+                    return python_type(*fields)
+                return python_type.strptime(json_value, date_format)
+        else:
+            def parse(json_value: str, python_type: type) -> datetime.datetime:
+                return python_type.strptime(json_value, date_format)
+        return parse
 
     def to_json_value(self, python_value: datetime.datetime) -> str:
         return python_value.strftime(self.date_format)
 
     def to_python_value(self, json_value: str,
                         python_type: type) -> datetime.datetime:
-        return python_type.strptime(json_value, self.date_format)
+        return self.parse(json_value, python_type)
 
 
 class DateBinding(TypeBinding):
@@ -35,8 +83,11 @@ class DateBinding(TypeBinding):
         date = "%Y-%m-%d"
         http_date = "%a, %d %b %Y %H:%M:%S GMT"
 
+    __iso_formats__: typing.Dict[str, typing.Pattern] = {Format.date.value: re.compile(r"\d{4}-\d{2}-\d{2}", re.ASCII)}
+
     def __init__(self, date_format: typing.Union[str, "DateBinding.Format"],
-                 python_type: type = None):
+                 python_type: type = None,
+                 cache_size: int = 4096):
 
         if python_type:
             if not issubclass(python_type, datetime.date):
@@ -47,16 +98,31 @@ class DateBinding(TypeBinding):
             date_format = date_format.value
         super().__init__(json_type=str, python_type=python_type)
         self.date_format = date_format
+        self.parse: typing.Callable = __cached__(self.__parser__(), cache_size)
+
+    def __parser__(self) -> typing.Callable:
+        date_format = self.date_format
+        date_type = self.python_type
+        is_iso = DateBinding.__iso_formats__[date_format].fullmatch if date_format in DateBinding.__iso_formats__ else None
+        is_http_date = date_format == DateBinding.Format.http_date.value
+
+        def parse(json_value: str) -> datetime.date:
+            if is_iso is not None and is_iso(json_value):
+                return date_type.fromisoformat(json_value)
+            fields = __http_date_fields__(json_value) if is_http_date else None
+            # the time fields are still validated
+            dt = datetime.datetime(*fields) if fields is not None else datetime.datetime.strptime(json_value, date_format)
+            return date_type(year=dt.year,
+                             month=dt.month,
+                             day=dt.day)
+        return parse
 
     def to_json_value(self, python_value: datetime.date) -> str:
         return python_value.strftime(self.date_format)
 
     def to_python_value(self, json_value: str,
                         python_type: type) -> datetime.date:
-        dt = datetime.datetime.strptime(json_value, self.date_format)
-        return self.python_type(year=dt.year,
-                                month=dt.month,
-                                day=dt.day)
+        return self.parse(json_value)
 
 
 class TimeBinding(TypeBinding):
@@ -66,8 +132,14 @@ class TimeBinding(TypeBinding):
         short_time = "%H:%M:%S"
         tiny_time = "%H:%M"
 
+    __iso_formats__: typing.Dict[str, typing.Pattern] = {
+        Format.time.value: re.compile(r"\d{2}:\d{2}:\d{2}\.\d{6}", re.ASCII),
+        Format.short_time.value: re.compile(r"\d{2}:\d{2}:\d{2}", re.ASCII),
+        Format.tiny_time.value: re.compile(r"\d{2}:\d{2}", re.ASCII)}
+
     def __init__(self, time_format: typing.Union[str, "TimeBinding.Format"],
-                 python_type: type = None):
+                 python_type: type = None,
+                 cache_size: int = 4096):
 
         if python_type:
             if not issubclass(python_type, datetime.time):
@@ -78,18 +150,30 @@ class TimeBinding(TypeBinding):
             time_format = time_format.value
         super().__init__(json_type=str, python_type=python_type)
         self.date_format = time_format
+        self.parse: typing.Callable = __cached__(self.__parser__(), cache_size)
+
+    def __parser__(self) -> typing.Callable:
+        time_format = self.date_format
+        time_type = self.python_type
+        is_iso = TimeBinding.__iso_formats__[time_format].fullmatch if time_format in TimeBinding.__iso_formats__ else None
+
+        def parse(json_value: str) -> datetime.time:
+            if is_iso is not None and is_iso(json_value):
+                return time_type.fromisoformat(json_value)
+            dt = datetime.datetime.strptime(json_value, time_format)
+            return time_type(hour=dt.hour,
+                             minute=dt.minute,
+                             second=dt.second,
+                             microsecond=dt.microsecond,
+                             tzinfo=dt.tzinfo)
+        return parse
 
     def to_json_value(self, python_value: datetime.date) -> str:
         return python_value.strftime(self.date_format)
 
     def to_python_value(self, json_value: str,
                         python_type: type) -> datetime.date:
-        dt = datetime.datetime.strptime(json_value, self.date_format)
-        return self.python_type(hour=dt.hour,
-                                minute=dt.minute,
-                                second=dt.second,
-                                microsecond=dt.microsecond,
-                                tzinfo=dt.tzinfo)
+        return self.parse(json_value)
 
 
 Bindings.set_binding(DateTimeBinding(date_time_format=DateTimeBinding.Format.time_stamp))
@@ -1,2 +1,11 @@
 from .serialization import Serialization, Bindings
-from .type_binding import TypeBinding, JsonTypes
\ No newline at end of file
+from .type_binding import TypeBinding, JsonTypes
+from .plan import ClassPlan
+from .encoder import StreamEncoder
+from .decoder import ArrayDecoder
+from .binary import BinaryEncoder, BinaryDecoder
+from .parallel import Parallel
+from .backend import JsonBackend, StdlibBackend, OrjsonBackend, UjsonBackend, Backends
+from .async_serialization import AsyncSerialization
+from .http import HttpClient
+from .profiler import Profiler
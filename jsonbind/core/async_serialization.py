@@ -0,0 +1,163 @@
+import asyncio
+import codecs
+import concurrent.futures
+import inspect
+import typing
+from .type_binding import Bindings
+from .serialization import Serialization
+from .encoder import StreamEncoder
+from .decoder import ArrayDecoder
+
+Executor = typing.Union[None, concurrent.futures.Executor]
+
+
+class AsyncSerialization:
+    # parsing runs on the event loop one chunk at a time, binding and encoding run in an executor
+
+    @staticmethod
+    async def read_chunks(stream, chunk_size: int = 65536) -> typing.AsyncIterator[typing.Union[str, bytes]]:
+        # streams with a read(n) coroutine (asyncio and aiohttp readers) or async iterables of chunks
+        if hasattr(stream, "read"):
+            while True:
+                chunk = await stream.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+        else:
+            async for chunk in stream:
+                yield chunk
+
+    @staticmethod
+    async def deserialize_from(stream,
+                               python_type: type = None,
+                               chunk_size: int = 65536,
+                               executor: Executor = None,
+                               **kwargs) -> typing.Any:
+
+        chunks = AsyncSerialization.read_chunks(stream=stream, chunk_size=chunk_size)
+        text_chunks = AsyncSerialization.__decode_chunks__(chunks)
+        head = ""
+        async for text in text_chunks:
+            head += text
+            if head.strip():
+                break
+        container = AsyncSerialization.__container__(python_type)
+        loop = asyncio.get_running_loop()
+        if head.lstrip().startswith("[") and (python_type is None or container is not None):
+            # arrays are decoded element by element as chunks arrive
+            python_values = python_type() if python_type else list()
+            async for values in AsyncSerialization.__deserialize_elements__(head, text_chunks, container, executor, kwargs):
+                python_values.__iadd__(values)
+            return python_values
+        text = [head]
+        async for chunk in text_chunks:
+            text.append(chunk)
+        return await loop.run_in_executor(executor,
+                                          lambda: Serialization.deserialize("".join(text), python_type, **kwargs))
+
+    @staticmethod
+    async def deserialize_iter(stream,
+                               python_type: type = None,
+                               chunk_size: int = 65536,
+                               executor: Executor = None,
+                               **kwargs) -> typing.AsyncIterator[typing.Any]:
+
+        container = AsyncSerialization.__container__(python_type)
+        if python_type and container is None:
+            raise TypeError("python_type {} is not bound to a json array".format(python_type.__name__))
+        chunks = AsyncSerialization.read_chunks(stream=stream, chunk_size=chunk_size)
+        text_chunks = AsyncSerialization.__decode_chunks__(chunks)
+        type_check = container.__type_check__ if container is not None else None
+        async for values in AsyncSerialization.__deserialize_elements__("", text_chunks, container, executor, kwargs):
+            for value in values:
+                yield type_check(value) if type_check else value
+
+    @staticmethod
+    async def serialize_to(python_value: typing.Any,
+                           writer,
+                           buffer_size: int = 65536,
+                           executor: Executor = None,
+                           **kwargs) -> int:
+
+        if "separators" not in kwargs:
+            kwargs["separators"] = (',', ':')
+        encoder = StreamEncoder(buffer_size=buffer_size, **kwargs)
+        binary = StreamEncoder.is_binary(writer)
+        chunks = encoder.__iterencode__(python_value=python_value)
+        loop = asyncio.get_running_loop()
+        written = 0
+        while True:
+            # the encoder generator is advanced in the executor one buffer at a time
+            data = await loop.run_in_executor(executor, AsyncSerialization.__encode_buffer__, chunks, buffer_size, binary)
+            if not data:
+                return written
+            result = writer.write(data)
+            if inspect.isawaitable(result):
+                await result
+            elif hasattr(writer, "drain"):
+                await writer.drain()
+            written += len(data)
+
+    @staticmethod
+    def to_python_values(json_values: list, python_type: type = None) -> list:
+        if python_type is None:
+            return [Bindings.to_python_value(json_value=json_value) for json_value in json_values]
+        to_python_value = Bindings.get_binding(python_type=python_type).to_python_value
+        return [to_python_value(json_value=json_value, python_type=python_type) for json_value in json_values]
+
+    @staticmethod
+    def __container__(python_type: typing.Union[None, type]) -> typing.Any:
+        # typed lists (the ones with a list_type) can be filled with elements bound one at a time
+        if python_type is None or Bindings.get_binding(python_type=python_type).json_type is not list:
+            return None
+        container = python_type()
+        return container if hasattr(container, "list_type") else None
+
+    @staticmethod
+    async def __decode_chunks__(chunks: typing.AsyncIterator[typing.Union[str, bytes]]) -> typing.AsyncIterator[str]:
+        text_decoder = None
+        async for chunk in chunks:
+            if not isinstance(chunk, str):
+                if text_decoder is None:
+                    text_decoder = codecs.getincrementaldecoder("utf-8-sig")()
+                chunk = text_decoder.decode(bytes(chunk))
+            yield chunk
+        if text_decoder is not None:
+            yield text_decoder.decode(b"", final=True)
+
+    @staticmethod
+    async def __deserialize_elements__(head: str,
+                                       text_chunks: typing.AsyncIterator[str],
+                                       container: typing.Any,
+                                       executor: Executor,
+                                       kwargs: dict) -> typing.AsyncIterator[list]:
+
+        item_type = container.list_type if container is not None else None
+        loop = asyncio.get_running_loop()
+        decoder = ArrayDecoder(**kwargs)
+        json_values = decoder.feed(head)
+        async for text in text_chunks:
+            json_values += decoder.feed(text)
+            if json_values:
+                yield await loop.run_in_executor(executor, AsyncSerialization.to_python_values, json_values, item_type)
+                json_values = list()
+        json_values += decoder.close()
+        if json_values:
+            yield await loop.run_in_executor(executor, AsyncSerialization.to_python_values, json_values, item_type)
+
+    @staticmethod
+    def __encode_buffer__(chunks: typing.Iterator[typing.Union[str, bytes]],
+                          buffer_size: int,
+                          binary: bool) -> typing.Union[str, bytes]:
+
+        buffer = list()
+        buffer_length = 0
+        for chunk in chunks:
+            if chunk.__class__ is bytes:
+                chunk = chunk.decode("ascii")
+            buffer.append(chunk)
+            buffer_length += len(chunk)
+            if buffer_length >= buffer_size:
+                break
+        text = "".join(buffer)
+        return text.encode("utf8") if binary else text
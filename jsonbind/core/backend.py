@@ -0,0 +1,283 @@
+import functools
+import importlib.util
+import json
+import marshal
+import re
+import typing
+
+
+BytesLike = typing.Union[bytes, bytearray, memoryview]
+
+
+def is_escaped_ascii(json_string: typing.Union[str, bytes]) -> bool:
+    # json.dumps(ensure_ascii=True) escapes everything outside the printable ascii range, including DEL
+    return json_string.isascii() and ("\x7f" if isinstance(json_string, str) else b"\x7f") not in json_string
+
+
+# numbers are checked on a copy of the text with every digit replaced by 0, which a plain substring search scans
+digits_to_zero = str.maketrans("123456789", "000000000")
+digits_to_zero_bytes = bytes.maketrans(b"123456789", b"000000000")
+# float exponents without the sign or the second digit json.dumps writes (1e20 and 1e-7 for 1e+20 and 1e-07)
+short_exponent = re.compile(r"0e(?:0|-0(?!0))")
+short_exponent_bytes = re.compile(rb"0e(?:0|-0(?!0))")
+# null tokens (outside strings, save for strings that hold json text), also written by orjson for nan and infinities
+null_token_bytes = re.compile(rb"[\[:,]\s*null")
+# marshal writes floats as b"g" and the 8 bytes of the double, little endian: nan and infinities have every exponent
+# bit set. utf8 text never has those two last bytes in a row
+non_finite_double = re.compile(rb"g.{6}[\xf0-\xff][\x7f\xff]", re.S)
+
+
+def has_short_exponent(json_string: typing.Union[str, bytes]) -> bool:
+    if isinstance(json_string, str):
+        return "e" in json_string and short_exponent.search(json_string.translate(digits_to_zero)) is not None
+    return b"e" in json_string and short_exponent_bytes.search(json_string.translate(digits_to_zero_bytes)) is not None
+
+
+def has_non_finite_float(json_value: typing.Any) -> bool:
+    try:
+        return non_finite_double.search(marshal.dumps(json_value, 2)) is not None
+    except ValueError:
+        # subclasses of the json types, marshal does not take them
+        return True
+
+
+def has_long_integer(json_string: typing.Union[str, BytesLike]) -> bool:
+    # runs of 19 digits or more, integers that may not fit in 64 bits
+    if isinstance(json_string, str):
+        return "0" * 19 in json_string.translate(digits_to_zero)
+    if isinstance(json_string, memoryview):
+        json_string = json_string.tobytes()
+    return b"0" * 19 in json_string.translate(digits_to_zero_bytes)
+
+
+def to_string(json_string: typing.Union[str, BytesLike]) -> typing.Union[str, bytes, bytearray]:
+    # json.loads takes str, bytes and bytearray; other buffers are decoded without an intermediate bytes copy
+    if isinstance(json_string, memoryview):
+        return str(json_string, json.detect_encoding(bytes(json_string[:4])), "surrogatepass")
+    return json_string
+
+
+class JsonBackend(object):
+
+    def __init__(self, name: str):
+        self.name: str = name
+
+    def __reduce__(self):
+        # backends hold module references, other processes look them up by name
+        return Backends.get_backend, (self.name,)
+
+    def dumps(self, json_value: typing.Any, **kwargs) -> str:
+        raise NotImplementedError("dumps() not implemented")
+
+    def dumps_bytes(self, json_value: typing.Any, **kwargs) -> bytes:
+        return self.dumps(json_value, **kwargs).encode("utf8")
+
+    def loads(self, json_string: typing.Union[str, BytesLike], **kwargs) -> typing.Any:
+        raise NotImplementedError("loads() not implemented")
+
+    def encoder(self, **kwargs) -> typing.Callable[[typing.Any], str]:
+        # dumps with the arguments bound once, for encoding many values with the same options
+        return functools.partial(self.dumps, **kwargs)
+
+    def decoder(self, **kwargs) -> typing.Callable[[typing.Union[str, BytesLike]], typing.Any]:
+        return functools.partial(self.loads, **kwargs)
+
+
+class StdlibBackend(JsonBackend):
+
+    def __init__(self):
+        super().__init__(name="json")
+
+    def dumps(self, json_value: typing.Any, **kwargs) -> str:
+        return json.dumps(json_value, **kwargs)
+
+    def loads(self, json_string: typing.Union[str, BytesLike], **kwargs) -> typing.Any:
+        return json.loads(to_string(json_string), **kwargs)
+
+    def encoder(self, **kwargs) -> typing.Callable[[typing.Any], str]:
+        if type(self).dumps is not StdlibBackend.dumps:
+            return JsonBackend.encoder(self, **kwargs)
+        # json.dumps builds a new encoder on every call that does not use the default options
+        encoder_type = kwargs.pop("cls", None) or json.JSONEncoder
+        return encoder_type(**kwargs).encode
+
+
+class OrjsonBackend(StdlibBackend):
+    # calls that orjson can not reproduce byte by byte fall back to the standard library, and so do the documents
+    # where its output would differ: floats with exponents (orjson writes 1e20 for 1e+20), nan and infinities
+    # (written as null) and, when decoding, integers of 19 digits or more (decoded as floats)
+
+    def __init__(self):
+        import orjson
+        JsonBackend.__init__(self, name="orjson")
+        self.orjson = orjson
+
+    def dumps(self, json_value: typing.Any, **kwargs) -> str:
+        json_bytes = self.__dumps__(json_value, **kwargs)
+        if json_bytes is None:
+            return StdlibBackend.dumps(self, json_value, **kwargs)
+        return json_bytes.decode("utf8")
+
+    def dumps_bytes(self, json_value: typing.Any, **kwargs) -> bytes:
+        json_bytes = self.__dumps__(json_value, **kwargs)
+        if json_bytes is None:
+            return StdlibBackend.dumps(self, json_value, **kwargs).encode("utf8")
+        return json_bytes
+
+    def __dumps__(self, json_value: typing.Any, **kwargs) -> typing.Union[None, bytes]:
+        option = self.__option__(**kwargs)
+        if option is None:
+            return None
+        try:
+            json_bytes = self.orjson.dumps(json_value, option=option)
+        except self.orjson.JSONEncodeError:
+            return None
+        if kwargs.get("ensure_ascii", True) and not is_escaped_ascii(json_bytes):
+            return None
+        if has_short_exponent(json_bytes):
+            return None
+        if null_token_bytes.search(json_bytes) is not None and has_non_finite_float(json_value):
+            # some null may stand for a nan or an infinity
+            return None
+        return json_bytes
+
+    def loads(self, json_string: typing.Union[str, BytesLike], **kwargs) -> typing.Any:
+        if kwargs or has_long_integer(json_string):
+            return StdlibBackend.loads(self, json_string, **kwargs)
+        try:
+            return self.orjson.loads(json_string)
+        except self.orjson.JSONDecodeError:
+            # NaN and Infinity literals, or a genuine error reported the standard way
+            return StdlibBackend.loads(self, json_string)
+
+    def __option__(self,
+                   skipkeys: bool = False,
+                   ensure_ascii: bool = True,
+                   check_circular: bool = True,
+                   allow_nan: bool = True,
+                   cls: type = None,
+                   indent: typing.Union[None, int, str] = None,
+                   separators: typing.Union[None, typing.Tuple[str, str]] = None,
+                   default: typing.Callable = None,
+                   sort_keys: bool = False,
+                   **kwargs) -> typing.Union[None, int]:
+        if skipkeys or not allow_nan or cls is not None or default is not None or kwargs:
+            return None
+        option = self.orjson.OPT_SORT_KEYS if sort_keys else 0
+        if indent is None:
+            if separators != (',', ':'):
+                return None
+        elif indent == 2 or indent == "  ":
+            if separators is not None and separators != (',', ': '):
+                return None
+            option |= self.orjson.OPT_INDENT_2
+        else:
+            return None
+        return option
+
+
+class UjsonBackend(StdlibBackend):
+    # calls that ujson can not reproduce byte by byte fall back to the standard library, and so do the documents
+    # with small floats, which ujson spells without the second exponent digit (1e-7 for 1e-07)
+
+    def __init__(self):
+        import ujson
+        JsonBackend.__init__(self, name="ujson")
+        self.ujson = ujson
+
+    def dumps(self, json_value: typing.Any, **kwargs) -> str:
+        arguments = self.__arguments__(**kwargs)
+        if arguments is None:
+            return StdlibBackend.dumps(self, json_value, **kwargs)
+        try:
+            json_string = self.ujson.dumps(json_value, **arguments)
+        except (TypeError, OverflowError, ValueError):
+            return StdlibBackend.dumps(self, json_value, **kwargs)
+        if arguments["ensure_ascii"] and not is_escaped_ascii(json_string):
+            return StdlibBackend.dumps(self, json_value, **kwargs)
+        if has_short_exponent(json_string):
+            return StdlibBackend.dumps(self, json_value, **kwargs)
+        return json_string
+
+    def loads(self, json_string: typing.Union[str, BytesLike], **kwargs) -> typing.Any:
+        if kwargs:
+            return StdlibBackend.loads(self, json_string, **kwargs)
+        try:
+            return self.ujson.loads(to_string(json_string))
+        except (ValueError, TypeError):
+            return StdlibBackend.loads(self, json_string)
+
+    @staticmethod
+    def __arguments__(skipkeys: bool = False,
+                      ensure_ascii: bool = True,
+                      check_circular: bool = True,
+                      allow_nan: bool = True,
+                      cls: type = None,
+                      indent: typing.Union[None, int, str] = None,
+                      separators: typing.Union[None, typing.Tuple[str, str]] = None,
+                      default: typing.Callable = None,
+                      sort_keys: bool = False,
+                      **kwargs) -> typing.Union[None, dict]:
+        if skipkeys or cls is not None or default is not None or kwargs:
+            return None
+        if indent is not None and (not isinstance(indent, int) or indent <= 0):
+            return None
+        if separators is None:
+            separators = (',', ': ') if indent is not None else (', ', ': ')
+        return dict(ensure_ascii=ensure_ascii,
+                    allow_nan=allow_nan,
+                    indent=indent or 0,
+                    separators=separators,
+                    sort_keys=sort_keys,
+                    escape_forward_slashes=False)
+
+
+class Backends(object):
+
+    __backend_types__: typing.Dict[str, type] = {"orjson": OrjsonBackend,
+                                                 "ujson": UjsonBackend,
+                                                 "json": StdlibBackend}
+    __backends__: typing.Dict[str, JsonBackend] = dict()
+    __auto_order__: typing.List[str] = ["orjson", "ujson", "json"]
+    __default__: str = "json"
+
+    @staticmethod
+    def set_backend(backend: JsonBackend) -> None:
+        Backends.__backends__[backend.name] = backend
+        Backends.__backend_types__[backend.name] = backend.__class__
+
+    @staticmethod
+    def set_default(name: str) -> None:
+        if name != "auto" and not Backends.is_available(name):
+            raise ValueError("json backend '{}' is not available".format(name))
+        Backends.__default__ = name
+
+    @staticmethod
+    def get_default() -> str:
+        return Backends.__default__
+
+    @staticmethod
+    def is_available(name: str) -> bool:
+        if name in Backends.__backends__ or name == "json":
+            return True
+        if name not in Backends.__backend_types__:
+            return False
+        return importlib.util.find_spec(name) is not None
+
+    @staticmethod
+    def available_backends() -> typing.List[str]:
+        return [name for name in Backends.__backend_types__ if Backends.is_available(name)]
+
+    @staticmethod
+    def get_backend(name: typing.Union[None, str, JsonBackend] = None) -> JsonBackend:
+        if isinstance(name, JsonBackend):
+            return name
+        if name is None:
+            name = Backends.__default__
+        if name == "auto":
+            name = next(backend_name for backend_name in Backends.__auto_order__ if Backends.is_available(backend_name))
+        if name not in Backends.__backends__:
+            if not Backends.is_available(name):
+                raise ValueError("json backend '{}' is not available".format(name))
+            Backends.__backends__[name] = Backends.__backend_types__[name]()
+        return Backends.__backends__[name]
@@ -0,0 +1,506 @@
+import array
+import importlib.util
+import struct
+import sys
+import typing
+from .type_binding import TypeBinding, Bindings, ListBinding
+
+BinaryLike = typing.Union[bytes, bytearray, memoryview]
+
+
+class Msgpack(object):
+    # the compiled msgpack package, which BinaryEncoder and BinaryDecoder require by default: without it binary
+    # documents would be slower to write and read than json text, so ImportError is raised instead of falling back.
+    # compiled=False selects the pure python codec explicitly, for reading or writing the format where msgpack cannot
+    # be installed
+    __msgpack__: typing.Any = None
+    __available__: typing.Union[None, bool] = None
+
+    @staticmethod
+    def is_available() -> bool:
+        if Msgpack.__available__ is None:
+            Msgpack.__available__ = importlib.util.find_spec("msgpack") is not None
+        return Msgpack.__available__
+
+    @staticmethod
+    def get(compiled: typing.Union[None, bool] = None) -> typing.Any:
+        if compiled is False:
+            return None
+        if not Msgpack.is_available():
+            raise ImportError("binary serialization requires msgpack (pip install msgpack), "
+                              "compiled=False selects the slower pure python codec")
+        if Msgpack.__msgpack__ is None:
+            import msgpack
+            Msgpack.__msgpack__ = msgpack
+        return Msgpack.__msgpack__
+
+
+class BinaryEncoder(object):
+    # MessagePack encoding of the values, walked through the bindings the same way StreamEncoder walks them:
+    # containers with to_json_items are written item by item and everything else as its to_json_value.
+    # bytes are written as bin values instead of base64 text, and arrays of floats or ints whose binding is one of
+    # __packed_bindings__ (ArrayList, List[float], lists) as packed little endian buffers in ext types 1 (float64)
+    # and 2 (int64), so any MessagePack reader can decode the output.
+    #
+    # with msgpack installed the values are written by its packer, which only calls back for the values that are not
+    # exactly json types. Plain python lists of numbers are then written item by item (they decode the same way),
+    # dict keys that are not strings are written as they are, and circular references fail on its nesting limit
+
+    __float_array__: int = 1
+    __int_array__: int = 2
+    # shorter numeric lists are not worth packing
+    __packed_threshold__: int = 8
+    __typecodes__: typing.Dict[str, int] = {"d": __float_array__, "q": __int_array__}
+    __native_types__: typing.Set[type] = {str, int, float, bool, type(None), bytes, bytearray, memoryview}
+    # bindings whose numeric lists (or arrays) are packed, custom bindings are always written through to_json_value
+    __packed_bindings__: typing.Set[type] = {ListBinding}
+    __uint16__: struct.Struct = struct.Struct(">H")
+    __uint32__: struct.Struct = struct.Struct(">I")
+    __float64__: struct.Struct = struct.Struct(">d")
+    __little_endian__: bool = sys.byteorder == "little"
+
+    def __init__(self, check_circular: bool = True, compiled: typing.Union[None, bool] = None):
+        self.markers: typing.Union[None, typing.Dict[int, typing.Any]] = dict() if check_circular else None
+        # binding class -> has to_json_items
+        self.binding_hooks: typing.Dict[type, bool] = dict()
+        self.msgpack: typing.Any = Msgpack.get(compiled)
+
+    def encode(self, python_value: typing.Any) -> bytes:
+        if self.msgpack is not None:
+            return self.msgpack.packb(python_value, default=self.__default__, use_bin_type=True, strict_types=True)
+        buffer = bytearray()
+        self.__pack__(python_value, buffer)
+        return bytes(buffer)
+
+    def __items__(self, binding: TypeBinding, python_value: typing.Any) -> typing.Union[None, typing.Iterable]:
+        hooks = self.binding_hooks.get(binding.__class__)
+        if hooks is None:
+            hooks = TypeBinding.__has_hook__(binding.__class__, "to_json_items")
+            self.binding_hooks[binding.__class__] = hooks
+        return binding.to_json_items(python_value) if hooks else None
+
+    def __default__(self, python_value: typing.Any) -> typing.Any:
+        # values the msgpack packer does not write itself, returned as values it does
+        binding = Bindings.get_binding(python_value.__class__)
+        if binding.__class__ in BinaryEncoder.__packed_bindings__:
+            numbers = BinaryEncoder.__numbers__(python_value)
+            if numbers is not None:
+                return self.msgpack.ExtType(BinaryEncoder.__typecodes__[numbers.typecode], BinaryEncoder.__array_data__(numbers))
+        items = self.__items__(binding, python_value)
+        if items is None:
+            return binding.to_json_value(python_value)
+        if binding.json_type is dict:
+            return {key if key.__class__ is str else BinaryEncoder.__key__(key): value for key, value in items}
+        # list subclasses would come back here
+        return items if items.__class__ is list else list(items)
+
+    def __pack__(self, python_value: typing.Any, buffer: bytearray) -> None:
+        value_type = python_value.__class__
+        if value_type in BinaryEncoder.__native_types__:
+            BinaryEncoder.__pack_json__(python_value, buffer)
+            return
+        binding = Bindings.get_binding(value_type)
+        if binding.__class__ in BinaryEncoder.__packed_bindings__:
+            numbers = BinaryEncoder.__numbers__(python_value)
+            if numbers is not None:
+                BinaryEncoder.__pack_array__(numbers, buffer)
+                return
+        items = self.__items__(binding, python_value)
+        if items is None:
+            BinaryEncoder.__pack_json__(binding.to_json_value(python_value), buffer)
+            return
+        if self.markers is not None:
+            marker_id = id(python_value)
+            if marker_id in self.markers:
+                raise ValueError("Circular reference detected")
+            self.markers[marker_id] = python_value
+        if not hasattr(items, "__len__"):
+            items = list(items)
+        pack = self.__pack__
+        pack_str = BinaryEncoder.__pack_str__
+        pack_float = BinaryEncoder.__float64__.pack
+        if binding.json_type is dict:
+            BinaryEncoder.__pack_header__(len(items), 0x80, 0xde, buffer)
+            for key, value in items:
+                pack_str(key if key.__class__ is str else BinaryEncoder.__key__(key), buffer)
+                # strings and floats are written inline
+                value_type = value.__class__
+                if value_type is str:
+                    pack_str(value, buffer)
+                elif value_type is float:
+                    buffer.append(0xcb)
+                    buffer += pack_float(value)
+                else:
+                    pack(value, buffer)
+        else:
+            BinaryEncoder.__pack_header__(len(items), 0x90, 0xdc, buffer)
+            for value in items:
+                value_type = value.__class__
+                if value_type is str:
+                    pack_str(value, buffer)
+                elif value_type is float:
+                    buffer.append(0xcb)
+                    buffer += pack_float(value)
+                else:
+                    pack(value, buffer)
+        if self.markers is not None:
+            del self.markers[marker_id]
+
+    @staticmethod
+    def __pack_json__(json_value: typing.Any, buffer: bytearray) -> None:
+        value_type = json_value.__class__
+        if value_type is str:
+            BinaryEncoder.__pack_str__(json_value, buffer)
+        elif value_type is int:
+            BinaryEncoder.__pack_int__(json_value, buffer)
+        elif value_type is float:
+            buffer.append(0xcb)
+            buffer += BinaryEncoder.__float64__.pack(json_value)
+        elif json_value is None:
+            buffer.append(0xc0)
+        elif value_type is bool:
+            buffer.append(0xc3 if json_value else 0xc2)
+        elif value_type is list or value_type is tuple:
+            BinaryEncoder.__pack_list__(json_value, buffer)
+        elif value_type is dict:
+            BinaryEncoder.__pack_dict__(json_value, buffer)
+        elif value_type is bytes or value_type is bytearray or value_type is memoryview:
+            BinaryEncoder.__pack_bin__(json_value, buffer)
+        # subclasses of the json types are written as their base type
+        elif isinstance(json_value, bool):
+            buffer.append(0xc3 if json_value else 0xc2)
+        elif isinstance(json_value, int):
+            BinaryEncoder.__pack_int__(int(json_value), buffer)
+        elif isinstance(json_value, float):
+            BinaryEncoder.__pack_json__(float(json_value), buffer)
+        elif isinstance(json_value, str):
+            BinaryEncoder.__pack_str__(str(json_value), buffer)
+        elif isinstance(json_value, (list, tuple)):
+            BinaryEncoder.__pack_list__(json_value, buffer)
+        elif isinstance(json_value, dict):
+            BinaryEncoder.__pack_dict__(json_value, buffer)
+        else:
+            raise TypeError("value type '{}' is not a json type".format(value_type.__name__))
+
+    @staticmethod
+    def __pack_list__(json_value: typing.Sequence, buffer: bytearray) -> None:
+        numbers = BinaryEncoder.__numbers__(json_value)
+        if numbers is not None:
+            BinaryEncoder.__pack_array__(numbers, buffer)
+            return
+        BinaryEncoder.__pack_header__(len(json_value), 0x90, 0xdc, buffer)
+        for value in json_value:
+            BinaryEncoder.__pack_json__(value, buffer)
+
+    @staticmethod
+    def __pack_dict__(json_value: dict, buffer: bytearray) -> None:
+        BinaryEncoder.__pack_header__(len(json_value), 0x80, 0xde, buffer)
+        for key, value in json_value.items():
+            BinaryEncoder.__pack_str__(key if key.__class__ is str else BinaryEncoder.__key__(key), buffer)
+            BinaryEncoder.__pack_json__(value, buffer)
+
+    @staticmethod
+    def __key__(key: typing.Any) -> str:
+        # dict keys are converted as json.dumps converts them
+        if isinstance(key, str):
+            return str(key)
+        if key is True:
+            return "true"
+        if key is False:
+            return "false"
+        if key is None:
+            return "null"
+        if isinstance(key, (int, float)):
+            return float.__repr__(key) if isinstance(key, float) else int.__repr__(key)
+        raise TypeError("keys must be str, int, float, bool or None, not {}".format(key.__class__.__name__))
+
+    @staticmethod
+    def __pack_header__(size: int, fix_code: int, code: int, buffer: bytearray) -> None:
+        # arrays (0x90, 0xdc) and maps (0x80, 0xde): fixed up to 15 items, then 16 and 32 bit sizes
+        if size < 16:
+            buffer.append(fix_code | size)
+        elif size < 0x10000:
+            buffer.append(code)
+            buffer += BinaryEncoder.__uint16__.pack(size)
+        else:
+            buffer.append(code + 1)
+            buffer += BinaryEncoder.__uint32__.pack(size)
+
+    @staticmethod
+    def __pack_str__(value: str, buffer: bytearray) -> None:
+        data = value.encode("utf8")
+        size = len(data)
+        if size < 32:
+            buffer.append(0xa0 | size)
+            buffer += data
+            return
+        if size < 0x100:
+            buffer.append(0xd9)
+            buffer.append(size)
+        elif size < 0x10000:
+            buffer.append(0xda)
+            buffer += BinaryEncoder.__uint16__.pack(size)
+        else:
+            buffer.append(0xdb)
+            buffer += BinaryEncoder.__uint32__.pack(size)
+        buffer += data
+
+    @staticmethod
+    def __pack_bin__(value: BinaryLike, buffer: bytearray) -> None:
+        size = len(value)
+        if size < 0x100:
+            buffer.append(0xc4)
+            buffer.append(size)
+        elif size < 0x10000:
+            buffer.append(0xc5)
+            buffer += BinaryEncoder.__uint16__.pack(size)
+        else:
+            buffer.append(0xc6)
+            buffer += BinaryEncoder.__uint32__.pack(size)
+        buffer += value
+
+    @staticmethod
+    def __pack_int__(value: int, buffer: bytearray) -> None:
+        if 0 <= value < 0x80:
+            buffer.append(value)
+        elif -32 <= value < 0:
+            buffer.append(value & 0xff)
+        elif 0 <= value < 0x10000000000000000:
+            if value < 0x100:
+                buffer.append(0xcc)
+                buffer.append(value)
+            elif value < 0x10000:
+                buffer.append(0xcd)
+                buffer += BinaryEncoder.__uint16__.pack(value)
+            elif value < 0x100000000:
+                buffer.append(0xce)
+                buffer += BinaryEncoder.__uint32__.pack(value)
+            else:
+                buffer.append(0xcf)
+                buffer += value.to_bytes(8, "big")
+        elif -0x8000000000000000 <= value < 0:
+            if value >= -0x80:
+                buffer.append(0xd0)
+                buffer += value.to_bytes(1, "big", signed=True)
+            elif value >= -0x8000:
+                buffer.append(0xd1)
+                buffer += value.to_bytes(2, "big", signed=True)
+            elif value >= -0x80000000:
+                buffer.append(0xd2)
+                buffer += value.to_bytes(4, "big", signed=True)
+            else:
+                buffer.append(0xd3)
+                buffer += value.to_bytes(8, "big", signed=True)
+        else:
+            raise OverflowError("integer {} does not fit in 64 bits".format(value))
+
+    @staticmethod
+    def __numbers__(values: typing.Sequence) -> typing.Union[None, array.array]:
+        # the values as an array to pack: float64 and int64 arrays as they are, lists holding only floats
+        # (or only ints that fit in 64 bits) converted
+        if isinstance(values, array.array):
+            return values if values.typecode in BinaryEncoder.__typecodes__ else None
+        if len(values) < BinaryEncoder.__packed_threshold__ or values[0].__class__ not in (float, int):
+            return None
+        value_types = set(map(type, values))
+        if value_types == {float}:
+            return array.array("d", values)
+        if value_types == {int}:
+            try:
+                return array.array("q", values)
+            except OverflowError:
+                return None
+        return None
+
+    @staticmethod
+    def __array_data__(numbers: array.array) -> bytes:
+        if not BinaryEncoder.__little_endian__:
+            numbers = array.array(numbers.typecode, numbers)
+            numbers.byteswap()
+        return numbers.tobytes()
+
+    @staticmethod
+    def __pack_array__(numbers: array.array, buffer: bytearray) -> None:
+        data = BinaryEncoder.__array_data__(numbers)
+        size = len(data)
+        if size < 0x100:
+            buffer.append(0xc7)
+            buffer.append(size)
+        elif size < 0x10000:
+            buffer.append(0xc8)
+            buffer += BinaryEncoder.__uint16__.pack(size)
+        else:
+            buffer.append(0xc9)
+            buffer += BinaryEncoder.__uint32__.pack(size)
+        buffer.append(BinaryEncoder.__typecodes__[numbers.typecode])
+        buffer += data
+
+
+class BinaryDecoder(object):
+    # decodes MessagePack documents to json values, except for bin values that decode to bytes (which BytesBinding
+    # takes as they are) and the packed arrays of BinaryEncoder that decode to lists
+
+    __structs__: typing.Dict[int, struct.Struct] = {0xcc: struct.Struct(">B"),
+                                                    0xcd: struct.Struct(">H"),
+                                                    0xce: struct.Struct(">I"),
+                                                    0xcf: struct.Struct(">Q"),
+                                                    0xd0: struct.Struct(">b"),
+                                                    0xd1: struct.Struct(">h"),
+                                                    0xd2: struct.Struct(">i"),
+                                                    0xd3: struct.Struct(">q"),
+                                                    0xca: struct.Struct(">f"),
+                                                    0xcb: struct.Struct(">d")}
+    # code -> (size of the length field, kind): 0 str, 1 bin, 2 array, 3 map, 4 ext
+    __sized__: typing.Dict[int, typing.Tuple[int, int]] = {0xd9: (1, 0), 0xda: (2, 0), 0xdb: (4, 0),
+                                                            0xc4: (1, 1), 0xc5: (2, 1), 0xc6: (4, 1),
+                                                            0xdc: (2, 2), 0xdd: (4, 2),
+                                                            0xde: (2, 3), 0xdf: (4, 3),
+                                                            0xc7: (1, 4), 0xc8: (2, 4), 0xc9: (4, 4)}
+    __fixed_ext__: typing.Dict[int, int] = {0xd4: 1, 0xd5: 2, 0xd6: 4, 0xd7: 8, 0xd8: 16}
+    __typecodes__: typing.Dict[int, str] = {BinaryEncoder.__float_array__: "d", BinaryEncoder.__int_array__: "q"}
+    __float64__: struct.Struct = struct.Struct(">d")
+
+    def __init__(self, compiled: typing.Union[None, bool] = None):
+        self.msgpack: typing.Any = Msgpack.get(compiled)
+
+    def decode(self, data: BinaryLike) -> typing.Any:
+        if self.msgpack is not None:
+            # msgpack reports malformed documents as ValueError too
+            return self.msgpack.unpackb(data, raw=False, strict_map_key=False, ext_hook=BinaryDecoder.__ext__)
+        if data.__class__ is not bytes:
+            data = bytes(data)
+        try:
+            json_value, position = BinaryDecoder.__unpack__(data, 0)
+        except (IndexError, struct.error):
+            raise ValueError("truncated binary document")
+        if position != len(data):
+            raise ValueError("extra data after position {}".format(position))
+        return json_value
+
+    @staticmethod
+    def __unpack__(data: bytes, position: int) -> typing.Tuple[typing.Any, int]:
+        code = data[position]
+        position += 1
+        if code < 0x80:
+            return code, position
+        if code >= 0xe0:
+            return code - 0x100, position
+        if code >= 0xa0:
+            if code < 0xc0:
+                end = position + (code & 0x1f)
+                if end > len(data):
+                    raise IndexError()
+                return data[position:end].decode("utf8"), end
+        elif code >= 0x90:
+            return BinaryDecoder.__unpack_array__(data, position, code & 0x0f)
+        else:
+            return BinaryDecoder.__unpack_map__(data, position, code & 0x0f)
+        if code == 0xc0:
+            return None, position
+        if code == 0xc2:
+            return False, position
+        if code == 0xc3:
+            return True, position
+        number_struct = BinaryDecoder.__structs__.get(code)
+        if number_struct is not None:
+            return number_struct.unpack_from(data, position)[0], position + number_struct.size
+        sized = BinaryDecoder.__sized__.get(code)
+        if sized is not None:
+            length_size, kind = sized
+            if position + length_size > len(data):
+                raise IndexError()
+            size = int.from_bytes(data[position:position + length_size], "big")
+            position += length_size
+            if kind == 2:
+                return BinaryDecoder.__unpack_array__(data, position, size)
+            if kind == 3:
+                return BinaryDecoder.__unpack_map__(data, position, size)
+            if kind == 4:
+                return BinaryDecoder.__unpack_ext__(data, position + 1, data[position], size)
+            end = position + size
+            if end > len(data):
+                raise IndexError()
+            return (data[position:end].decode("utf8") if kind == 0 else data[position:end]), end
+        if code in BinaryDecoder.__fixed_ext__:
+            return BinaryDecoder.__unpack_ext__(data, position + 1, data[position], BinaryDecoder.__fixed_ext__[code])
+        raise ValueError("invalid type code 0x{:02x} at position {}".format(code, position - 1))
+
+    @staticmethod
+    def __unpack_array__(data: bytes, position: int, size: int) -> typing.Tuple[list, int]:
+        unpack = BinaryDecoder.__unpack__
+        unpack_float = BinaryDecoder.__float64__.unpack_from
+        length = len(data)
+        values = list()
+        append = values.append
+        for _ in range(size):
+            # small ints, floats and short strings are read inline
+            code = data[position]
+            if code < 0x80:
+                append(code)
+                position += 1
+            elif code == 0xcb:
+                append(unpack_float(data, position + 1)[0])
+                position += 9
+            elif 0xa0 <= code < 0xc0:
+                end = position + 1 + (code & 0x1f)
+                if end > length:
+                    raise IndexError()
+                append(data[position + 1:end].decode("utf8"))
+                position = end
+            else:
+                value, position = unpack(data, position)
+                append(value)
+        return values, position
+
+    @staticmethod
+    def __unpack_map__(data: bytes, position: int, size: int) -> typing.Tuple[dict, int]:
+        unpack = BinaryDecoder.__unpack__
+        unpack_float = BinaryDecoder.__float64__.unpack_from
+        length = len(data)
+        values = dict()
+        for _ in range(size):
+            code = data[position]
+            if 0xa0 <= code < 0xc0:
+                end = position + 1 + (code & 0x1f)
+                if end > length:
+                    raise IndexError()
+                key = data[position + 1:end].decode("utf8")
+                position = end
+            else:
+                key, position = unpack(data, position)
+            code = data[position]
+            if code < 0x80:
+                values[key] = code
+                position += 1
+            elif code == 0xcb:
+                values[key] = unpack_float(data, position + 1)[0]
+                position += 9
+            elif 0xa0 <= code < 0xc0:
+                end = position + 1 + (code & 0x1f)
+                if end > length:
+                    raise IndexError()
+                values[key] = data[position + 1:end].decode("utf8")
+                position = end
+            else:
+                values[key], position = unpack(data, position)
+        return values, position
+
+    @staticmethod
+    def __unpack_ext__(data: bytes, position: int, ext_type: int, size: int) -> typing.Tuple[list, int]:
+        end = position + size
+        if end > len(data):
+            raise IndexError()
+        if ext_type not in BinaryDecoder.__typecodes__:
+            raise ValueError("unsupported ext type {} at position {}".format(ext_type, position - 2))
+        return BinaryDecoder.__ext__(ext_type, data[position:end]), end
+
+    @staticmethod
+    def __ext__(ext_type: int, data: bytes) -> list:
+        typecode = BinaryDecoder.__typecodes__.get(ext_type)
+        if typecode is None:
+            raise ValueError("unsupported ext type {}".format(ext_type))
+        numbers = array.array(typecode)
+        numbers.frombytes(data)
+        if not BinaryEncoder.__little_endian__:
+            numbers.byteswap()
+        return numbers.tolist()
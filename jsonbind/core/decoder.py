@@ -0,0 +1,178 @@
+import json
+import re
+import typing
+
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+DELIMITERS = ' \t\n\r,]'
+DELIMITER = re.compile(r'[ \t\n\r,\]]')
+STRUCTURE = re.compile(r'["\[\]{}]')
+STRING_END = re.compile(r'["\\]')
+CLOSING = {"[": "]", "{": "}"}
+# first characters of json values, NaN and Infinity included
+VALUE_START = '"[{-0123456789tfnNI'
+
+
+class ArrayDecoder(object):
+    # incremental decoder for a top level json array: text is fed in chunks and complete elements are returned
+    # as soon as they are available, so only the pending element has to be kept in memory
+
+    BEFORE_ARRAY = 0
+    FIRST_VALUE = 1
+    VALUE = 2
+    SEPARATOR = 3
+    DONE = 4
+
+    def __init__(self, **kwargs):
+        self.json_decoder = json.JSONDecoder(**kwargs)
+        self.buffer: str = ""
+        self.position: int = 0
+        self.state: int = ArrayDecoder.BEFORE_ARRAY
+        # a string or container element that spans several chunks is kept as a list of pieces: each chunk is scanned
+        # once for the end of the element (carrying the open brackets and string state over) and the pieces are
+        # joined and decoded when the end arrives
+        self.pieces: typing.List[str] = list()
+        self.closing: typing.List[str] = list()
+        self.in_string: bool = False
+        self.escaped: bool = False
+        self.element_end: int = -1
+
+    def feed(self, text: str) -> typing.List[typing.Any]:
+        if self.pieces:
+            end = self.__scan__(text, 0)
+            self.pieces.append(text)
+            if end < 0:
+                return list()
+            self.buffer = "".join(self.pieces)
+            self.pieces.clear()
+            self.element_end = len(self.buffer) - len(text) + end
+        else:
+            self.buffer = self.buffer[self.position:] + text
+        self.position = 0
+        return self.__decode__(final=False)
+
+    def close(self) -> typing.List[typing.Any]:
+        if self.pieces:
+            # the pending element never ended, decoding it reports where
+            self.buffer = "".join(self.pieces)
+            self.position = 0
+            self.pieces.clear()
+            self.closing.clear()
+            self.in_string = False
+            self.escaped = False
+        json_values = self.__decode__(final=True)
+        if self.state != ArrayDecoder.DONE:
+            raise json.JSONDecodeError("Expecting ']'", self.buffer, self.position)
+        return json_values
+
+    def __decode__(self, final: bool) -> typing.List[typing.Any]:
+        json_values = list()
+        buffer = self.buffer
+        buffer_length = len(buffer)
+        position = self.position
+        while True:
+            position = WHITESPACE.match(buffer, position).end()
+            if position == buffer_length:
+                break
+            if self.state == ArrayDecoder.BEFORE_ARRAY:
+                if buffer[position] != "[":
+                    raise json.JSONDecodeError("Expecting '['", buffer, position)
+                position += 1
+                self.state = ArrayDecoder.FIRST_VALUE
+            elif self.state == ArrayDecoder.SEPARATOR:
+                if buffer[position] == ",":
+                    self.state = ArrayDecoder.VALUE
+                elif buffer[position] == "]":
+                    self.state = ArrayDecoder.DONE
+                else:
+                    raise json.JSONDecodeError("Expecting ',' delimiter", buffer, position)
+                position += 1
+            elif self.state == ArrayDecoder.DONE:
+                raise json.JSONDecodeError("Extra data", buffer, position)
+            elif self.state == ArrayDecoder.FIRST_VALUE and buffer[position] == "]":
+                position += 1
+                self.state = ArrayDecoder.DONE
+            elif buffer[position] not in VALUE_START:
+                raise json.JSONDecodeError("Expecting value", buffer, position)
+            elif buffer[position] in '"[{':
+                if self.element_end < 0:
+                    try:
+                        json_value, end = self.json_decoder.raw_decode(buffer, position)
+                    except json.JSONDecodeError:
+                        if final:
+                            raise
+                        # incomplete or malformed: the rest of the buffer is scanned once to tell them apart
+                        if buffer[position] == '"':
+                            self.in_string = True
+                        else:
+                            self.closing.append(CLOSING[buffer[position]])
+                        if self.__scan__(buffer, position + 1) >= 0:
+                            raise
+                        self.pieces.append(buffer[position:])
+                        buffer = ""
+                        position = 0
+                        break
+                else:
+                    # the element ended in the last chunk, decoding it raises if it is malformed
+                    json_value, end = self.json_decoder.raw_decode(buffer, position)
+                    self.element_end = -1
+                json_values.append(json_value)
+                position = end
+                self.state = ArrayDecoder.SEPARATOR
+            else:
+                try:
+                    json_value, end = self.json_decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    # numbers and literals end at a delimiter, there is no point in waiting past one
+                    if final or DELIMITER.search(buffer, position):
+                        raise
+                    break
+                # numbers and literals that are not followed by a delimiter could still continue in the next chunk
+                if not final and (end == buffer_length or buffer[end] not in DELIMITERS):
+                    break
+                json_values.append(json_value)
+                position = end
+                self.state = ArrayDecoder.SEPARATOR
+        self.buffer = buffer
+        self.position = position
+        return json_values
+
+    def __scan__(self, text: str, index: int) -> int:
+        # index past the end of the pending element in text, or -1 when text ends first
+        closing = self.closing
+        in_string = self.in_string
+        text_length = len(text)
+        end = -1
+        while True:
+            if in_string:
+                if self.escaped:
+                    if index >= text_length:
+                        break
+                    index += 1
+                    self.escaped = False
+                match = STRING_END.search(text, index)
+                if match is None:
+                    break
+                index = match.end()
+                if match.group() == "\\":
+                    self.escaped = True
+                    continue
+                in_string = False
+            else:
+                match = STRUCTURE.search(text, index)
+                if match is None:
+                    break
+                index = match.end()
+                character = match.group()
+                if character == '"':
+                    in_string = True
+                    continue
+                if character in CLOSING:
+                    closing.append(CLOSING[character])
+                    continue
+                if closing.pop() != character:
+                    raise json.JSONDecodeError("Unexpected '{}'".format(character), text, index - 1)
+            if not closing:
+                end = index
+                break
+        self.in_string = in_string
+        return end
@@ -0,0 +1,226 @@
+import io
+import json
+import typing
+from .type_binding import TypeBinding, Bindings
+
+
+class StreamEncoder(object):
+
+    def __init__(self,
+                 skipkeys: bool = False,
+                 ensure_ascii: bool = True,
+                 check_circular: bool = True,
+                 allow_nan: bool = True,
+                 indent: typing.Union[None, int, str] = None,
+                 separators: typing.Union[None, typing.Tuple[str, str]] = None,
+                 sort_keys: bool = False,
+                 buffer_size: int = 65536,
+                 **kwargs):
+        # json.dump arguments such as cls and default are accepted but never needed: bindings only produce json types
+        self.json_encoder = json.JSONEncoder(skipkeys=skipkeys,
+                                             ensure_ascii=ensure_ascii,
+                                             check_circular=check_circular,
+                                             allow_nan=allow_nan,
+                                             indent=indent,
+                                             separators=separators,
+                                             sort_keys=sort_keys)
+        if indent is not None and not isinstance(indent, str):
+            indent = ' ' * indent
+        self.indent: typing.Union[None, str] = indent
+        self.item_separator: str = self.json_encoder.item_separator
+        self.key_separator: str = self.json_encoder.key_separator
+        self.skipkeys: bool = skipkeys
+        self.sort_keys: bool = sort_keys
+        self.allow_nan: bool = allow_nan
+        self.encode_string = json.encoder.encode_basestring_ascii if ensure_ascii else json.encoder.encode_basestring
+        self.markers: typing.Union[None, typing.Dict[int, typing.Any]] = dict() if check_circular else None
+        self.buffer_size: int = buffer_size
+        # binding class -> (overrides to_json_items, overrides to_json_token), so plain leaves skip both hooks
+        self.binding_hooks: typing.Dict[type, typing.Tuple[bool, bool]] = dict()
+
+    @staticmethod
+    def is_binary(fp) -> bool:
+        if isinstance(fp, io.TextIOBase):
+            return False
+        if isinstance(fp, (io.RawIOBase, io.BufferedIOBase)):
+            return True
+        mode = getattr(fp, "mode", None)
+        if isinstance(mode, str):
+            return "b" in mode
+        return True
+
+    def encode_to(self, python_value: typing.Any, fp) -> int:
+        binary = StreamEncoder.is_binary(fp)
+        text_buffer: typing.List[str] = list()
+        binary_buffer: typing.List[bytes] = list()
+        buffer_length = 0
+        written = 0
+        for chunk in self.__iterencode__(python_value=python_value):
+            if chunk.__class__ is bytes:
+                if binary:
+                    # pre-encoded tokens go straight to the output buffer
+                    if text_buffer:
+                        binary_buffer.append("".join(text_buffer).encode("utf8"))
+                        text_buffer.clear()
+                    binary_buffer.append(chunk)
+                else:
+                    text_buffer.append(chunk.decode("ascii"))
+            else:
+                text_buffer.append(chunk)
+            buffer_length += len(chunk)
+            if buffer_length >= self.buffer_size:
+                written += StreamEncoder.__flush__(fp, text_buffer, binary_buffer, binary)
+                buffer_length = 0
+        written += StreamEncoder.__flush__(fp, text_buffer, binary_buffer, binary)
+        return written
+
+    @staticmethod
+    def __flush__(fp, text_buffer: typing.List[str], binary_buffer: typing.List[bytes], binary: bool) -> int:
+        if binary:
+            if text_buffer:
+                binary_buffer.append("".join(text_buffer).encode("utf8"))
+            data = b"".join(binary_buffer)
+        else:
+            data = "".join(text_buffer)
+        text_buffer.clear()
+        binary_buffer.clear()
+        if data:
+            fp.write(data)
+        return len(data)
+
+    @staticmethod
+    def __write__(fp, text: str, binary: bool) -> int:
+        data = text.encode("utf8") if binary else text
+        fp.write(data)
+        return len(data)
+
+    def iterencode(self, python_value: typing.Any) -> typing.Iterator[str]:
+        for chunk in self.__iterencode__(python_value=python_value):
+            yield chunk.decode("ascii") if chunk.__class__ is bytes else chunk
+
+    def __iterencode__(self, python_value: typing.Any) -> typing.Iterator[typing.Union[str, bytes]]:
+        binding = Bindings.get_binding(python_value.__class__)
+        hooks = self.binding_hooks.get(binding.__class__)
+        if hooks is None:
+            hooks = self.__binding_hooks__(binding)
+        items = binding.to_json_items(python_value) if hooks[0] else None
+        if items is not None:
+            return self.__iterencode_items__(python_value, binding, items, 0)
+        token = binding.to_json_token(python_value) if hooks[1] else None
+        if token is not None:
+            return iter((token,))
+        return iter((self.__encode_json_value__(binding.to_json_value(python_value), 0),))
+
+    def __iterencode_items__(self,
+                             python_value: typing.Any,
+                             binding: TypeBinding,
+                             items: typing.Iterable,
+                             level: int) -> typing.Iterator[typing.Union[str, bytes]]:
+        if self.markers is not None:
+            marker_id = id(python_value)
+            if marker_id in self.markers:
+                raise ValueError("Circular reference detected")
+            self.markers[marker_id] = python_value
+        is_dict = binding.json_type is dict
+        separator = self.item_separator
+        opening = "{" if is_dict else "["
+        closing = "}" if is_dict else "]"
+        if self.indent is not None:
+            level += 1
+            newline_indent = "\n" + self.indent * level
+            separator += newline_indent
+            opening += newline_indent
+            closing = "\n" + self.indent * (level - 1) + closing
+        if is_dict and self.sort_keys:
+            items = sorted(items, key=lambda item: item[0])
+        get_binding = Bindings.get_binding
+        encode_json_value = self.__encode_json_value__
+        binding_hooks = self.binding_hooks
+        prefix = opening
+        for value in items:
+            if is_dict:
+                key = self.__encode_key__(value[0])
+                if key is None:
+                    continue
+                prefix += key + self.key_separator
+                value = value[1]
+            value_binding = get_binding(value.__class__)
+            hooks = binding_hooks.get(value_binding.__class__)
+            if hooks is None:
+                hooks = self.__binding_hooks__(value_binding)
+            value_items = value_binding.to_json_items(value) if hooks[0] else None
+            token = value_binding.to_json_token(value) if hooks[1] and value_items is None else None
+            if value_items is not None:
+                yield prefix
+                yield from self.__iterencode_items__(value, value_binding, value_items, level)
+            elif token is not None:
+                yield prefix
+                yield token
+            else:
+                yield prefix + encode_json_value(value_binding.to_json_value(value), level)
+            prefix = separator
+        if prefix is opening:
+            yield "{}" if is_dict else "[]"
+        else:
+            yield closing
+        if self.markers is not None:
+            del self.markers[marker_id]
+
+    def __binding_hooks__(self, binding: TypeBinding) -> typing.Tuple[bool, bool]:
+        binding_type = binding.__class__
+        hooks = (TypeBinding.__has_hook__(binding_type, "to_json_items"),
+                 TypeBinding.__has_hook__(binding_type, "to_json_token"))
+        self.binding_hooks[binding_type] = hooks
+        return hooks
+
+    def __encode_key__(self, key: typing.Any) -> typing.Union[None, str]:
+        if isinstance(key, str):
+            pass
+        elif isinstance(key, float):
+            key = self.__encode_float__(key)
+        elif key is True:
+            key = "true"
+        elif key is False:
+            key = "false"
+        elif key is None:
+            key = "null"
+        elif isinstance(key, int):
+            key = int.__repr__(key)
+        elif self.skipkeys:
+            return None
+        else:
+            raise TypeError("keys must be str, int, float, bool or None, not {}".format(key.__class__.__name__))
+        return self.encode_string(key)
+
+    def __encode_float__(self, value: float) -> str:
+        if value != value:
+            text = "NaN"
+        elif value == float("inf"):
+            text = "Infinity"
+        elif value == -float("inf"):
+            text = "-Infinity"
+        else:
+            return float.__repr__(value)
+        if not self.allow_nan:
+            raise ValueError("Out of range float values are not JSON compliant: " + repr(value))
+        return text
+
+    def __encode_json_value__(self, json_value: typing.Any, level: int) -> str:
+        value_type = json_value.__class__
+        if value_type is str:
+            return self.encode_string(json_value)
+        if json_value is None:
+            return "null"
+        if json_value is True:
+            return "true"
+        if json_value is False:
+            return "false"
+        if value_type is int:
+            return int.__repr__(json_value)
+        if value_type is float:
+            return self.__encode_float__(json_value)
+        text = self.json_encoder.encode(json_value)
+        if level and self.indent is not None:
+            # json strings never contain raw new lines, so this only shifts the structural ones
+            text = text.replace("\n", "\n" + self.indent * level)
+        return text
@@ -0,0 +1,76 @@
+import asyncio
+import typing
+import urllib.parse
+
+
+class HttpClient(object):
+    # minimal asyncio http/1.1 client used by Serializable.aparse_from_url when no other client is given.
+    # any callable taking a url and returning an async iterable of body chunks can replace it
+
+    # 3xx responses with a location are followed, up to max_redirects of them
+    __redirect_statuses__: typing.Tuple[int, ...] = (301, 302, 303, 307, 308)
+    __max_redirects__: int = 5
+
+    @staticmethod
+    async def get(url: str, chunk_size: int = 65536, max_redirects: int = None) -> typing.AsyncIterator[bytes]:
+        if max_redirects is None:
+            max_redirects = HttpClient.__max_redirects__
+        for _ in range(max_redirects + 1):
+            parts = urllib.parse.urlsplit(url)
+            if parts.scheme not in ("http", "https"):
+                raise ValueError("unsupported url scheme '{}'".format(parts.scheme))
+            port = parts.port or (443 if parts.scheme == "https" else 80)
+            reader, writer = await asyncio.open_connection(parts.hostname, port,
+                                                           ssl=True if parts.scheme == "https" else None)
+            try:
+                path = (parts.path or "/") + ("?" + parts.query if parts.query else "")
+                request = ("GET {} HTTP/1.1\r\n"
+                           "Host: {}\r\n"
+                           "Accept: application/json\r\n"
+                           "Accept-Encoding: identity\r\n"
+                           "Connection: close\r\n\r\n").format(path, parts.netloc)
+                writer.write(request.encode("latin1"))
+                await writer.drain()
+                status, headers = await HttpClient.__read_head__(reader)
+                if status in HttpClient.__redirect_statuses__ and "location" in headers:
+                    url = urllib.parse.urljoin(url, headers["location"])
+                    continue
+                if status != 200:
+                    raise ConnectionError("GET {} returned status {}".format(url, status))
+                if "chunked" in headers.get("transfer-encoding", "").lower():
+                    while True:
+                        size = int((await reader.readline()).split(b";")[0], 16)
+                        if size == 0:
+                            break
+                        yield await reader.readexactly(size)
+                        await reader.readline()
+                else:
+                    remaining = int(headers["content-length"]) if "content-length" in headers else None
+                    while remaining is None or remaining > 0:
+                        chunk = await reader.read(chunk_size if remaining is None else min(chunk_size, remaining))
+                        if not chunk:
+                            if remaining:
+                                raise ConnectionError("GET {} ended {} bytes early".format(url, remaining))
+                            break
+                        if remaining is not None:
+                            remaining -= len(chunk)
+                        yield chunk
+                return
+            finally:
+                writer.close()
+                await writer.wait_closed()
+        raise ConnectionError("GET {} exceeded {} redirects".format(url, max_redirects))
+
+    @staticmethod
+    async def __read_head__(reader: asyncio.StreamReader) -> typing.Tuple[int, typing.Dict[str, str]]:
+        status_line = (await reader.readline()).split()
+        if len(status_line) < 2 or not status_line[1].isdigit():
+            raise ConnectionError("invalid http response")
+        headers = dict()
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        return int(status_line[1]), headers
@@ -0,0 +1,31 @@
+import collections
+import itertools
+import typing
+from concurrent.futures import ProcessPoolExecutor
+
+
+class Parallel(object):
+
+    @staticmethod
+    def chunks(iterable: typing.Iterable, chunk_size: int) -> typing.Iterator[list]:
+        iterator = iter(iterable)
+        while True:
+            chunk = list(itertools.islice(iterator, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+    @staticmethod
+    def map(function: typing.Callable,
+            arguments: typing.Iterable[tuple],
+            workers: int) -> typing.Iterator[typing.Any]:
+        # results come back in submission order and at most two tasks per worker are in flight,
+        # so lazy inputs are only consumed as fast as the results are
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = collections.deque()
+            for function_arguments in arguments:
+                pending.append(executor.submit(function, *function_arguments))
+                if len(pending) >= workers * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
@@ -0,0 +1,275 @@
+import copy
+import datetime
+import enum
+import types
+import typing
+from .type_binding import TypeBinding, Bindings
+
+
+class ClassPlan(object):
+
+    __plans__: typing.Dict[type, "ClassPlan"] = dict()
+    # constructors that only store their arguments (or the declared defaults of __initializers__): classes using one
+    # of them are decoded into instances built with __new__, so their constructor never runs
+    __plain_initializers__: typing.Set[typing.Callable] = {object.__init__}
+    __no_default__ = object()
+    __immutable_types__: typing.Tuple[type, ...] = (type(None), bool, int, float, complex, str, bytes, tuple, frozenset,
+                                                    datetime.date, datetime.time, datetime.timedelta, enum.Enum)
+
+    def __init__(self, python_type: type):
+        self.python_type: type = python_type
+        # every member of the default instance, used to type the decoded members
+        self.members: typing.Dict[str, typing.Tuple[type, typing.Union[TypeBinding, None]]] = dict()
+        # public members with a binding, used to encode. Bindings are kept rather than their to_json_value, so
+        # conversions patched on the binding instance (Profiler) are used without compiling the plan again
+        self.json_members: typing.Dict[str, typing.Tuple[type, TypeBinding]] = dict()
+        # types whose bindings were looked up, a new binding for any of them (or a base) drops the plan
+        self.dependencies: typing.Set[type] = set()
+        # (name, kind, default) of the members new_instance sets when the decoded values do not have them
+        self.initializers: typing.Tuple[typing.Tuple[str, int, typing.Any], ...] = getattr(python_type, "__initializers__", ())
+        self.allocate: bool = python_type.__init__ in ClassPlan.__plain_initializers__ and python_type.__new__ is object.__new__
+        # members declared as annotations are typed once per class, Optional, list[...] and dict[str, ...] included
+        for member_name, annotation in ClassPlan.__annotations_of__(python_type).items():
+            member_type, binding = ClassPlan.__resolve__(annotation, self.dependencies)
+            if member_type is not None:
+                if ClassPlan.__default_of__(python_type, member_name) is None:
+                    # x: X = None is read as Optional[X]
+                    binding = ClassPlan.__optional__(member_type, binding)
+                self.__add_member__(member_name, member_type, binding)
+        if self.allocate:
+            # the default instance would only have the declared members
+            return
+        try:
+            default_value = python_type()
+        except TypeError:
+            return
+        # objects without a __dict__ expose their members through __values__
+        values = default_value.__values__() if hasattr(default_value, "__values__") else vars(default_value)
+        for member_name, member in values.items():
+            if member_name not in self.members:
+                member_type = member.__class__
+                self.dependencies.add(member_type)
+                self.__add_member__(member_name, member_type, Bindings.find_binding(python_type=member_type))
+            elif member is None:
+                # annotated members the constructor sets to None
+                member_type, binding = self.members[member_name]
+                self.__add_member__(member_name, member_type, ClassPlan.__optional__(member_type, binding))
+
+    def __add_member__(self, member_name: str, member_type: type, binding: typing.Union[TypeBinding, None]) -> None:
+        self.members[member_name] = (member_type, binding)
+        if isinstance(binding, OptionalMemberBinding):
+            # present values are encoded by the binding of their type, None falls back to the generic path
+            binding = binding.binding
+        if binding is not None and not member_name.startswith('_'):
+            self.json_members[member_name] = (member_type, binding)
+
+    @staticmethod
+    def __default_of__(python_type: type, member_name: str) -> typing.Any:
+        # declared default of a member, slotted objects keep theirs in __schema__
+        schema = getattr(python_type, "__schema__", None)
+        if schema is not None and member_name in schema:
+            return schema[member_name][1]
+        return getattr(python_type, member_name, ClassPlan.__no_default__)
+
+    @staticmethod
+    def __optional__(member_type: type, binding: typing.Union[None, TypeBinding]) -> TypeBinding:
+        if isinstance(binding, OptionalMemberBinding):
+            return binding
+        return OptionalMemberBinding(member_type=member_type, binding=binding)
+
+    @staticmethod
+    def __annotations_of__(python_type: type) -> typing.Dict[str, typing.Any]:
+        try:
+            annotations = typing.get_type_hints(python_type)
+        except Exception:
+            # unresolvable forward references: the annotations that are already types are still used
+            annotations = dict()
+            for base in reversed(python_type.__mro__):
+                annotations.update(getattr(base, "__annotations__", dict()))
+        return {member_name: annotation for member_name, annotation in annotations.items()
+                if not member_name.startswith("__") and typing.get_origin(annotation) is not typing.ClassVar}
+
+    @staticmethod
+    def __resolve__(annotation: typing.Any,
+                    dependencies: typing.Set[type]) -> typing.Tuple[typing.Union[None, type], typing.Union[None, TypeBinding]]:
+        # (type passed to the binding, binding) of an annotation, (None, None) when it does not type the member.
+        # The types whose bindings are looked up are added to dependencies
+        origin = typing.get_origin(annotation)
+        if origin is typing.Union or origin is types.UnionType:
+            member_types = [member_type for member_type in typing.get_args(annotation) if member_type is not types.NoneType]
+            if len(member_types) != 1:
+                return None, None
+            member_type, binding = ClassPlan.__resolve__(member_types[0], dependencies)
+            if member_type is None:
+                return None, None
+            return member_type, OptionalMemberBinding(member_type=member_type, binding=binding)
+        if origin is list:
+            arguments = typing.get_args(annotation)
+            item_type, item_binding = ClassPlan.__resolve__(arguments[0], dependencies) if arguments else (None, None)
+            return list, ListMemberBinding(item_type=item_type, item_binding=item_binding)
+        if origin is dict:
+            arguments = typing.get_args(annotation)
+            item_type, item_binding = ClassPlan.__resolve__(arguments[1], dependencies) if len(arguments) == 2 else (None, None)
+            return dict, DictMemberBinding(item_type=item_type, item_binding=item_binding)
+        if isinstance(origin, type):
+            annotation = origin
+        if isinstance(annotation, type):
+            dependencies.add(annotation)
+            binding = Bindings.find_binding(python_type=annotation)
+            if binding is not None:
+                return annotation, binding
+        return None, None
+
+    @staticmethod
+    def __initializer__(member_name: str, member_type: type, default: typing.Any) -> typing.Tuple[str, int, typing.Any]:
+        # (name, 0, shared default) | (name, 1, default copied per instance) | (name, 2, type built per instance)
+        if default is ClassPlan.__no_default__:
+            return member_name, 2, member_type
+        if isinstance(default, ClassPlan.__immutable_types__):
+            return member_name, 0, default
+        return member_name, 1, default
+
+    def new_instance(self, values: typing.Container[str], projected: bool = False) -> typing.Any:
+        # instance to assign the decoded values to. Classes with plain constructors are built with __new__ and only
+        # get the declared defaults of the members that are not in values, the same members their constructor sets.
+        # Projected decodes skip any other constructor too, so members left out of the projection are never built
+        python_type = self.python_type
+        if not self.allocate and (not projected or python_type.__new__ is not object.__new__):
+            return python_type()
+        python_value = python_type.__new__(python_type)
+        for member_name, initializer, default in self.initializers:
+            if member_name in values:
+                continue
+            if initializer == 0:
+                value = default
+            elif initializer == 1:
+                value = copy.deepcopy(default)
+            else:
+                value = default() if default is not None else None
+            setattr(python_value, member_name, value)
+        return python_value
+
+    @staticmethod
+    def get(python_type: type) -> "ClassPlan":
+        plan = ClassPlan.__plans__.get(python_type)
+        if plan is None:
+            plan = ClassPlan(python_type=python_type)
+            ClassPlan.__plans__[python_type] = plan
+        return plan
+
+    @staticmethod
+    def __invalidate__(python_type: type) -> None:
+        # plans that looked up the binding of python_type or of one of its subclasses are compiled again
+        stale_types = [plan_type for plan_type, plan in ClassPlan.__plans__.items()
+                       if any(issubclass(dependency, python_type) for dependency in plan.dependencies)]
+        for plan_type in stale_types:
+            del ClassPlan.__plans__[plan_type]
+
+    def to_json_dict(self, values: dict) -> dict:
+        json_members = self.json_members
+        json_value = dict()
+        for member_name, member in values.items():
+            member_plan = json_members.get(member_name)
+            if member_plan is not None and member.__class__ is member_plan[0]:
+                json_value[member_name] = member_plan[1].to_json_value(member)
+            elif not member_name.startswith('_'):
+                json_value[member_name] = Bindings.get_binding(member.__class__).to_json_value(member)
+        return json_value
+
+    def to_json_items(self, values: dict) -> typing.Iterator[typing.Tuple[str, typing.Any]]:
+        for member_name, member in values.items():
+            if not member_name.startswith('_'):
+                yield member_name, member
+
+    def to_python_dict(self, json_value: dict, projection: dict = None) -> dict:
+        if projection is not None:
+            return {member_name: self.to_python_member(member_name, json_value[member_name], member_projection)
+                    for member_name, member_projection in projection.items() if member_name in json_value}
+        members = self.members
+        values = dict()
+        for member_name, member_json_value in json_value.items():
+            member_plan = members.get(member_name)
+            if member_plan is None:
+                values[member_name] = member_json_value
+                continue
+            member_type, binding = member_plan
+            if binding is None:
+                binding = Bindings.get_binding(member_type)
+            values[member_name] = binding.to_python_value(json_value=member_json_value, python_type=member_type)
+        return values
+
+    def to_python_member(self, member_name: str, member_json_value: typing.Any, projection: dict = None) -> typing.Any:
+        member_plan = self.members.get(member_name)
+        if member_plan is None:
+            return Bindings.to_python_projection(json_value=member_json_value, projection=projection)
+        member_type, binding = member_plan
+        if binding is None:
+            binding = Bindings.get_binding(member_type)
+        if projection is not None:
+            return binding.to_python_projection(json_value=member_json_value, python_type=member_type, projection=projection)
+        return binding.to_python_value(json_value=member_json_value, python_type=member_type)
+
+
+class OptionalMemberBinding(TypeBinding):
+    # members annotated Optional[...]: null stays None, anything else goes through the binding of the type
+    def __init__(self, member_type: type, binding: typing.Union[None, TypeBinding]):
+        super().__init__(json_type=binding.json_type if binding is not None else types.NoneType, python_type=member_type)
+        self.binding: typing.Union[None, TypeBinding] = binding
+
+    def to_json_value(self, python_value: typing.Any) -> typing.Any:
+        return None if python_value is None else Bindings.to_json_value(python_value)
+
+    def to_python_value(self, json_value: typing.Any, python_type: type) -> typing.Any:
+        if json_value is None or self.binding is None:
+            return json_value
+        return self.binding.to_python_value(json_value=json_value, python_type=self.python_type)
+
+    def to_python_projection(self, json_value: typing.Any, python_type: type, projection: dict) -> typing.Any:
+        if json_value is None or self.binding is None:
+            return json_value
+        return self.binding.to_python_projection(json_value=json_value, python_type=self.python_type, projection=projection)
+
+
+class ListMemberBinding(TypeBinding):
+    # members annotated list[...]: a plain list with every item bound to the item type
+    def __init__(self, item_type: typing.Union[None, type], item_binding: typing.Union[None, TypeBinding]):
+        super().__init__(json_type=list, python_type=list)
+        self.item_type: typing.Union[None, type] = item_type
+        self.item_binding: typing.Union[None, TypeBinding] = item_binding
+
+    def to_json_value(self, python_value: typing.Any) -> typing.Any:
+        return [Bindings.to_json_value(item) for item in python_value]
+
+    def to_python_value(self, json_value: typing.Any, python_type: type) -> typing.Any:
+        if self.item_binding is None:
+            return json_value
+        to_python_value = self.item_binding.to_python_value
+        item_type = self.item_type
+        return [to_python_value(json_value=item, python_type=item_type) for item in json_value]
+
+    def to_python_projection(self, json_value: typing.Any, python_type: type, projection: dict) -> typing.Any:
+        if self.item_binding is None:
+            return [Bindings.to_python_projection(json_value=item, projection=projection) for item in json_value]
+        return [self.item_binding.to_python_projection(json_value=item, python_type=self.item_type, projection=projection)
+                for item in json_value]
+
+
+class DictMemberBinding(TypeBinding):
+    # members annotated dict[str, ...]: a plain dict with every value bound to the value type
+    def __init__(self, item_type: typing.Union[None, type], item_binding: typing.Union[None, TypeBinding]):
+        super().__init__(json_type=dict, python_type=dict)
+        self.item_type: typing.Union[None, type] = item_type
+        self.item_binding: typing.Union[None, TypeBinding] = item_binding
+
+    def to_json_value(self, python_value: typing.Any) -> typing.Any:
+        return {key: Bindings.to_json_value(item) for key, item in python_value.items()}
+
+    def to_python_value(self, json_value: typing.Any, python_type: type) -> typing.Any:
+        if self.item_binding is None:
+            return json_value
+        to_python_value = self.item_binding.to_python_value
+        item_type = self.item_type
+        return {key: to_python_value(json_value=item, python_type=item_type) for key, item in json_value.items()}
+
+
+Bindings.__invalidators__.append(ClassPlan.__invalidate__)
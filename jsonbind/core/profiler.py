@@ -0,0 +1,217 @@
+import contextlib
+import time
+import typing
+from .type_binding import TypeBinding, Bindings
+from .serialization import Serialization
+
+
+class Profiler(object):
+    # opt-in instrumentation of the conversions, the binding resolution and the json text going through
+    # Serialization. enable() swaps timed wrappers in and disable() puts the originals back, so nothing is
+    # measured (or paid for) while disabled. Conversion times include the nested conversions they trigger.
+    # Work done in worker processes (workers > 0) is not recorded.
+    #
+    #   with Profiler.profile():
+    #       jsonbind.loads(json_string, Message)
+    #   print(Profiler.report())
+
+    __enabled__: bool = False
+    # (method, binding class name, python type name) -> [calls, seconds]
+    __conversions__: typing.Dict[typing.Tuple[str, str, str], typing.List] = dict()
+    # "get_binding" / "find_binding" -> [hits, misses]
+    __resolutions__: typing.Dict[str, typing.List[int]] = dict()
+    # Serialization method -> [calls, length in, length out]
+    __transfers__: typing.Dict[str, typing.List[int]] = dict()
+    __originals__: typing.Dict[typing.Tuple[typing.Any, str], typing.Any] = dict()
+    __wrapped__: typing.List[TypeBinding] = list()
+    __depth__: int = 0
+
+    __conversion_methods__: typing.Tuple[str, ...] = ("to_json_value", "to_python_value")
+    # name -> (position of the json text argument or None, the result is the json text or its length)
+    __serialization_methods__: typing.Dict[str, typing.Tuple[typing.Union[None, str], bool]] = {
+        "serialize": (None, True),
+        "serialize_bytes": (None, True),
+        "serialize_many": (None, True),
+        "serialize_to": (None, True),
+        "serialize_lines": (None, True),
+        "serialize_binary": (None, True),
+        "deserialize": ("json_string", False),
+        "deserialize_binary": ("data", False),
+        "deserialize_many": ("json_strings", False)}
+
+    @staticmethod
+    def enable() -> None:
+        if Profiler.__enabled__:
+            return
+        Profiler.__enabled__ = True
+        for binding in list(Bindings.__bindings__.values()):
+            Profiler.__wrap_binding__(binding)
+        Profiler.__patch__(Bindings, "set_binding", Profiler.__set_binding__)
+        for method_name in ("get_binding", "find_binding"):
+            Profiler.__patch__(Bindings, method_name, Profiler.__resolution__(method_name))
+        for method_name in Profiler.__serialization_methods__:
+            Profiler.__patch__(Serialization, method_name, Profiler.__transfer__(method_name))
+
+    @staticmethod
+    def disable() -> None:
+        if not Profiler.__enabled__:
+            return
+        Profiler.__enabled__ = False
+        for binding in Profiler.__wrapped__:
+            for method_name in Profiler.__conversion_methods__:
+                binding.__dict__.pop(method_name, None)
+        Profiler.__wrapped__.clear()
+        for (owner, method_name), original in Profiler.__originals__.items():
+            setattr(owner, method_name, original)
+        Profiler.__originals__.clear()
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return Profiler.__enabled__
+
+    @staticmethod
+    def reset() -> None:
+        Profiler.__conversions__.clear()
+        Profiler.__resolutions__.clear()
+        Profiler.__transfers__.clear()
+
+    @staticmethod
+    @contextlib.contextmanager
+    def profile(reset: bool = True) -> typing.Iterator[typing.Type["Profiler"]]:
+        if reset:
+            Profiler.reset()
+        Profiler.enable()
+        try:
+            yield Profiler
+        finally:
+            Profiler.disable()
+
+    @staticmethod
+    def stats() -> dict:
+        conversions = list()
+        for (method_name, binding_name, type_name), (calls, seconds) in Profiler.__conversions__.items():
+            conversions.append({"method": method_name,
+                                "binding": binding_name,
+                                "python_type": type_name,
+                                "calls": calls,
+                                "seconds": seconds})
+        conversions.sort(key=lambda conversion: conversion["seconds"], reverse=True)
+        return {"conversions": conversions,
+                "resolutions": {method_name: {"hits": hits, "misses": misses}
+                                for method_name, (hits, misses) in Profiler.__resolutions__.items()},
+                "serialization": {method_name: {"calls": calls, "length_in": length_in, "length_out": length_out}
+                                  for method_name, (calls, length_in, length_out) in Profiler.__transfers__.items()}}
+
+    @staticmethod
+    def report(limit: int = 20) -> str:
+        stats = Profiler.stats()
+        lines = ["{:<16} {:<24} {:<24} {:>10} {:>12} {:>10}".format("method", "binding", "python type", "calls",
+                                                                     "seconds", "us/call")]
+        for conversion in stats["conversions"][:limit]:
+            lines.append("{:<16} {:<24} {:<24} {:>10} {:>12.6f} {:>10.3f}".format(
+                conversion["method"], conversion["binding"], conversion["python_type"], conversion["calls"],
+                conversion["seconds"], conversion["seconds"] * 1e6 / conversion["calls"]))
+        for method_name, counts in stats["resolutions"].items():
+            lines.append("{}: {} hits, {} misses".format(method_name, counts["hits"], counts["misses"]))
+        for method_name, counts in stats["serialization"].items():
+            lines.append("{}: {} calls, {} in, {} out".format(method_name, counts["calls"], counts["length_in"],
+                                                             counts["length_out"]))
+        return "\n".join(lines)
+
+    @staticmethod
+    def __patch__(owner: type, method_name: str, replacement: typing.Callable) -> None:
+        Profiler.__originals__[(owner, method_name)] = owner.__dict__[method_name]
+        setattr(owner, method_name, staticmethod(replacement))
+
+    @staticmethod
+    def __set_binding__(binding: TypeBinding, default_json_type_binding: bool = False) -> None:
+        Profiler.__originals__[(Bindings, "set_binding")].__func__(binding, default_json_type_binding)
+        Profiler.__wrap_binding__(binding)
+
+    @staticmethod
+    def __wrap_binding__(binding: TypeBinding) -> None:
+        if any(method_name in binding.__dict__ for method_name in Profiler.__conversion_methods__):
+            return
+        binding_name = binding.__class__.__name__
+        conversions = Profiler.__conversions__
+        to_json_value = binding.to_json_value
+        to_python_value = binding.to_python_value
+        perf_counter = time.perf_counter
+
+        def timed_to_json_value(*args, **kwargs):
+            python_value = args[0] if args else kwargs["python_value"]
+            start = perf_counter()
+            json_value = to_json_value(*args, **kwargs)
+            elapsed = perf_counter() - start
+            key = ("to_json_value", binding_name, python_value.__class__.__name__)
+            counts = conversions.get(key)
+            if counts is None:
+                conversions[key] = [1, elapsed]
+            else:
+                counts[0] += 1
+                counts[1] += elapsed
+            return json_value
+
+        def timed_to_python_value(*args, **kwargs):
+            python_type = args[1] if len(args) > 1 else kwargs["python_type"]
+            start = perf_counter()
+            python_value = to_python_value(*args, **kwargs)
+            elapsed = perf_counter() - start
+            key = ("to_python_value", binding_name, python_type.__name__)
+            counts = conversions.get(key)
+            if counts is None:
+                conversions[key] = [1, elapsed]
+            else:
+                counts[0] += 1
+                counts[1] += elapsed
+            return python_value
+
+        binding.to_json_value = timed_to_json_value
+        binding.to_python_value = timed_to_python_value
+        Profiler.__wrapped__.append(binding)
+
+    @staticmethod
+    def __resolution__(method_name: str) -> typing.Callable:
+        resolve = getattr(Bindings, method_name)
+        counts = Profiler.__resolutions__
+
+        def counted(python_type: type) -> typing.Any:
+            hit = Bindings.__bonds__.get(python_type) is not None
+            method_counts = counts.setdefault(method_name, [0, 0])
+            method_counts[0 if hit else 1] += 1
+            return resolve(python_type=python_type)
+        return counted
+
+    @staticmethod
+    def __transfer__(method_name: str) -> typing.Callable:
+        method = getattr(Serialization, method_name)
+        argument_name, serializes = Profiler.__serialization_methods__[method_name]
+
+        def measured(*args, **kwargs):
+            # nested calls (serialize_lines -> serialize_many) are only counted once
+            outermost = Profiler.__depth__ == 0
+            Profiler.__depth__ += 1
+            try:
+                result = method(*args, **kwargs)
+            finally:
+                Profiler.__depth__ -= 1
+            if outermost:
+                counts = Profiler.__transfers__.setdefault(method_name, [0, 0, 0])
+                counts[0] += 1
+                if serializes:
+                    counts[2] += Profiler.__length__(result)
+                else:
+                    json_text = args[0] if args else kwargs[argument_name]
+                    counts[1] += Profiler.__length__(json_text)
+            return result
+        return measured
+
+    @staticmethod
+    def __length__(value: typing.Any) -> int:
+        if isinstance(value, int):
+            return value
+        if isinstance(value, (str, bytes, bytearray, memoryview)):
+            return len(value)
+        if isinstance(value, (list, tuple)):
+            return sum(len(item) for item in value)
+        return 0
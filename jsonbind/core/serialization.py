@@ -1,26 +1,95 @@
+import codecs
 import typing
-import json
 from ..core.type_binding import Bindings
+from .encoder import StreamEncoder
+from .binary import BinaryEncoder, BinaryDecoder, BinaryLike
+from .decoder import ArrayDecoder
+from .parallel import Parallel
+from .backend import JsonBackend, Backends, BytesLike
 
 
 class Serialization:
 
     @staticmethod
-    def serialize(python_value: typing.Any, **kwargs) -> str:
+    def serialize(python_value: typing.Any, backend: typing.Union[None, str, JsonBackend] = None, **kwargs) -> str:
 
         if "separators" not in kwargs:
             kwargs["separators"] = (',', ':')
         value_type = python_value.__class__
         bond = Bindings.get_binding(value_type)
         if bond:
-            return json.dumps(bond.to_json_value(python_value=python_value), **kwargs)
+            return Backends.get_backend(backend).dumps(bond.to_json_value(python_value=python_value), **kwargs)
         raise TypeError("value type '%s' is not serializable" % value_type.__name__)
 
     @staticmethod
-    def deserialize(json_string: str,
-                    python_type: type = None, **kwargs) -> typing.Any:
+    def serialize_bytes(python_value: typing.Any,
+                        backend: typing.Union[None, str, JsonBackend] = None,
+                        **kwargs) -> bytes:
+
+        if "separators" not in kwargs:
+            kwargs["separators"] = (',', ':')
+        bond = Bindings.get_binding(python_value.__class__)
+        return Backends.get_backend(backend).dumps_bytes(bond.to_json_value(python_value=python_value), **kwargs)
+
+    @staticmethod
+    def serialize_many(python_values: typing.Iterable,
+                       python_type: type = None,
+                       backend: typing.Union[None, str, JsonBackend] = None,
+                       **kwargs) -> typing.List[str]:
+
+        if "separators" not in kwargs:
+            kwargs["separators"] = (',', ':')
+        encode = Backends.get_backend(backend).encoder(**kwargs)
+        bond = Bindings.get_binding(python_type) if python_type else None
+        json_strings = list()
+        for python_value in python_values:
+            value_type = python_value.__class__
+            if value_type is not python_type:
+                # values of other types are encoded with their own binding, as serialize would
+                bond = Bindings.get_binding(value_type)
+                python_type = value_type
+            json_strings.append(encode(bond.to_json_value(python_value=python_value)))
+        return json_strings
+
+    @staticmethod
+    def serialize_to(python_value: typing.Any, fp, **kwargs) -> int:
+
+        if "separators" not in kwargs:
+            kwargs["separators"] = (',', ':')
+        encoder = StreamEncoder(**kwargs)
+        return encoder.encode_to(python_value=python_value, fp=fp)
+
+    @staticmethod
+    def deserialize(json_string: typing.Union[str, BytesLike],
+                    python_type: type = None,
+                    backend: typing.Union[None, str, JsonBackend] = None,
+                    projection: typing.Iterable[str] = None,
+                    **kwargs) -> typing.Any:
+
+        json_value = Backends.get_backend(backend).loads(json_string, **kwargs)
+        return Serialization.__bind__(json_value=json_value, python_type=python_type, projection=projection)
+
+    @staticmethod
+    def serialize_binary(python_value: typing.Any,
+                         check_circular: bool = True,
+                         compiled: typing.Union[None, bool] = None) -> bytes:
+
+        return BinaryEncoder(check_circular=check_circular, compiled=compiled).encode(python_value=python_value)
+
+    @staticmethod
+    def deserialize_binary(data: BinaryLike,
+                           python_type: type = None,
+                           projection: typing.Iterable[str] = None,
+                           compiled: typing.Union[None, bool] = None) -> typing.Any:
+
+        json_value = BinaryDecoder(compiled=compiled).decode(data=data)
+        return Serialization.__bind__(json_value=json_value, python_type=python_type, projection=projection)
+
+    @staticmethod
+    def __bind__(json_value: typing.Any,
+                 python_type: type = None,
+                 projection: typing.Iterable[str] = None) -> typing.Any:
 
-        json_value = json.loads(json_string, **kwargs)
         if python_type:
             bond = Bindings.get_binding(python_type=python_type)
         else:
@@ -28,7 +97,119 @@ class Serialization:
             bond = Bindings.get_default_binding(json_type=json_type)
             python_type = bond.python_type
 
+        if projection is not None:
+            # only the members in the dotted paths are bound, the rest of the document is skipped
+            return bond.to_python_projection(json_value=json_value,
+                                             python_type=python_type,
+                                             projection=Bindings.projection_tree(projection))
         return bond.to_python_value(json_value=json_value, python_type=python_type)
 
+    @staticmethod
+    def deserialize_many(json_strings: typing.Iterable[typing.Union[str, BytesLike]],
+                         python_type: type = None,
+                         backend: typing.Union[None, str, JsonBackend] = None,
+                         workers: int = 0,
+                         chunk_size: int = 1000,
+                         **kwargs) -> typing.List[typing.Any]:
+
+        if workers:
+            kwargs["backend"] = backend
+            chunks = ((chunk, python_type, kwargs) for chunk in Parallel.chunks(json_strings, chunk_size))
+            python_values = list()
+            for chunk_values in Parallel.map(Serialization.deserialize_chunk, chunks, workers=workers):
+                python_values.extend(chunk_values)
+            return python_values
+        decode = Backends.get_backend(backend).decoder(**kwargs)
+        if python_type:
+            to_python_value = Bindings.get_binding(python_type=python_type).to_python_value
+            return [to_python_value(json_value=decode(json_string), python_type=python_type)
+                    for json_string in json_strings]
+        python_values = list()
+        for json_string in json_strings:
+            json_value = decode(json_string)
+            bond = Bindings.get_default_binding(json_type=json_value.__class__)
+            python_values.append(bond.to_python_value(json_value=json_value, python_type=bond.python_type))
+        return python_values
+
+    @staticmethod
+    def deserialize_iter(fp,
+                         python_type: type = None,
+                         chunk_size: int = 65536,
+                         **kwargs) -> typing.Iterator[typing.Any]:
+
+        item_type = None
+        type_check = None
+        if python_type:
+            if Bindings.get_binding(python_type=python_type).json_type is not list:
+                raise TypeError("python_type {} is not bound to a json array".format(python_type.__name__))
+            container = python_type()
+            item_type = getattr(container, "list_type", None)
+            type_check = getattr(container, "__type_check__", None)
+
+        decoder = ArrayDecoder(**kwargs)
+        text_decoder = None
+        while True:
+            chunk = fp.read(chunk_size)
+            if not chunk:
+                break
+            if not isinstance(chunk, str):
+                if text_decoder is None:
+                    text_decoder = codecs.getincrementaldecoder("utf-8-sig")()
+                chunk = text_decoder.decode(chunk)
+            for json_value in decoder.feed(chunk):
+                python_value = Bindings.to_python_value(json_value=json_value, python_type=item_type)
+                yield type_check(python_value) if type_check else python_value
+        if text_decoder is not None:
+            decoder.feed(text_decoder.decode(b"", final=True))
+        for json_value in decoder.close():
+            python_value = Bindings.to_python_value(json_value=json_value, python_type=item_type)
+            yield type_check(python_value) if type_check else python_value
+
+    @staticmethod
+    def serialize_lines(python_values: typing.Iterable,
+                        fp,
+                        buffer_size: int = 65536,
+                        **kwargs) -> int:
+
+        if kwargs.get("indent") is not None:
+            raise ValueError("json lines can not be indented")
+        binary = StreamEncoder.is_binary(fp)
+        buffer: typing.List[str] = list()
+        buffer_length = 0
+        written = 0
+        for chunk in Parallel.chunks(python_values, 1000):
+            for line in Serialization.serialize_many(chunk, **kwargs):
+                buffer.append(line)
+                buffer.append("\n")
+                buffer_length += len(line) + 1
+                if buffer_length >= buffer_size:
+                    written += StreamEncoder.__write__(fp, "".join(buffer), binary)
+                    buffer.clear()
+                    buffer_length = 0
+        if buffer:
+            written += StreamEncoder.__write__(fp, "".join(buffer), binary)
+        return written
 
+    @staticmethod
+    def deserialize_lines(fp,
+                          python_type: type = None,
+                          workers: int = 0,
+                          chunk_size: int = 1000,
+                          **kwargs) -> typing.Iterator[typing.Any]:
+
+        lines = (line for line in fp if line.strip())
+        if workers:
+            chunks = ((chunk, python_type, kwargs) for chunk in Parallel.chunks(lines, chunk_size))
+            for python_values in Parallel.map(Serialization.deserialize_chunk, chunks, workers=workers):
+                yield from python_values
+        else:
+            for chunk in Parallel.chunks(lines, chunk_size):
+                yield from Serialization.deserialize_many(json_strings=chunk, python_type=python_type, **kwargs)
+
+    @staticmethod
+    def deserialize_chunk(json_strings: typing.List[typing.Union[str, bytes]],
+                          python_type: type = None,
+                          kwargs: dict = None) -> typing.List[typing.Any]:
 
+        kwargs = kwargs or dict()
+        return Serialization.deserialize_many(json_strings=json_strings, python_type=python_type, **kwargs)
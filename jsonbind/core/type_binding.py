@@ -20,12 +20,43 @@ class TypeBinding(object):
 
         raise NotImplementedError("to_json_type() not implemented")
 
+    def to_json_items(self,
+                      python_value: typing.Any) -> typing.Union[None, typing.Iterable]:
+        # bindings to json lists and dicts can expose the python values of their elements (or (key, value) pairs)
+        # so encoders can walk them without building the json tree; None means use to_json_value
+        return None
+
+    def to_json_token(self,
+                      python_value: typing.Any) -> typing.Union[None, bytes]:
+        # bindings whose json text is plain ascii can return it already encoded (quotes included)
+        # so binary encoders copy it straight to the output; None means use to_json_value
+        return None
+
     def to_python_value(self,
                         json_value: typing.Union[JsonTypes],
                         python_type: type) -> typing.Any:
 
         raise NotImplementedError("to_mapped_type() not implemented")
 
+    def to_python_projection(self,
+                             json_value: typing.Union[JsonTypes],
+                             python_type: type,
+                             projection: dict) -> typing.Any:
+        # bindings of json dicts (or arrays of them) can bind only the members in projection, a tree of member
+        # names where None means the whole member (see Bindings.projection_tree); the default binds everything
+        return self.to_python_value(json_value=json_value, python_type=python_type)
+
+    @staticmethod
+    def __has_hook__(binding_type: type, hook_name: str) -> bool:
+        # encoder hooks stand for the to_json_value of the class that defines them: subclasses that only override
+        # to_json_value are encoded through it, not through the hook they inherit
+        for base in binding_type.__mro__:
+            if hook_name in base.__dict__:
+                return base is not TypeBinding
+            if "to_json_value" in base.__dict__:
+                return False
+        return False
+
     def __convert_to_json_type__(self,
                                  python_value: typing.Any) -> typing.Any:
 
@@ -48,31 +79,35 @@ class TypeBinding(object):
 
 class Bindings(object):
 
-    __bindings__: typing.List[TypeBinding] = list()
+    __bindings__: typing.Dict[type, TypeBinding] = dict()
+    # resolved bindings by python type, misses are not kept so probing unbound types does not grow it
     __bonds__: typing.Dict[type, TypeBinding] = dict()
     __default_binding__: typing.Dict[type, TypeBinding] = dict()
+    # called with the python type of every new binding, so caches built from bindings drop the affected entries
+    __invalidators__: typing.List[typing.Callable[[type], None]] = list()
 
     @staticmethod
     def set_binding(binding: TypeBinding,
                     default_json_type_binding: bool = False) -> None:
 
-        existing_bond_index = Bindings.__find_bind_by_python_type__(binding.python_type)
-        if existing_bond_index is not None:
-            del Bindings.__bindings__[existing_bond_index]
-        Bindings.__bonds__.clear()
-        Bindings.__bindings__. append(binding)
+        python_type = binding.python_type
+        Bindings.__bindings__.pop(python_type, None)
+        Bindings.__bindings__[python_type] = binding
+        Bindings.__invalidate_bonds__(python_type)
+        for invalidate in Bindings.__invalidators__:
+            invalidate(python_type)
         if default_json_type_binding:
             Bindings.__default_binding__[binding.json_type] = binding
 
     @staticmethod
     def get_binding(python_type: type) -> TypeBinding:
 
-        if python_type not in Bindings.__bonds__:
-            binding = Bindings.find_binding(python_type)
-            if binding is None:
-                raise TypeError("python_type {} does not have a defined binding".format(python_type.__name__))
-            Bindings.__bonds__[python_type] = binding
-        return Bindings.__bonds__[python_type]
+        binding = Bindings.__bonds__.get(python_type)
+        if binding is None:
+            binding = Bindings.find_binding(python_type=python_type)
+        if binding is None:
+            raise TypeError("python_type {} does not have a defined binding".format(python_type.__name__))
+        return binding
 
     @staticmethod
     def is_bonded(python_type: type) -> bool:
@@ -80,26 +115,26 @@ class Bindings(object):
 
     @staticmethod
     def find_binding(python_type: type) -> typing.Union[None, TypeBinding]:
-        bases = python_type.__mro__
-        for base in bases:
-            for binding in Bindings.__bindings__:
-                if base is binding.python_type:
-                    return binding
+        binding = Bindings.__bonds__.get(python_type)
+        if binding is not None:
+            return binding
+        for base in python_type.__mro__:
+            if base in Bindings.__bindings__:
+                binding = Bindings.__bindings__[base]
+                Bindings.__bonds__[python_type] = binding
+                return binding
         return None
 
     @staticmethod
-    def __find_bind_by_python_type__(python_type: type) -> typing.Union[int, None]:
-        for index, binding in enumerate(Bindings.__bindings__):
-            if binding.python_type is python_type:
-                return index
-        return None
+    def __invalidate_bonds__(python_type: type) -> None:
+        # only the types that inherit from python_type can resolve to a different binding
+        stale_types = [bonded_type for bonded_type in Bindings.__bonds__ if issubclass(bonded_type, python_type)]
+        for bonded_type in stale_types:
+            del Bindings.__bonds__[bonded_type]
 
     @staticmethod
     def bonded_python_types() -> typing.List[type]:
-        bonded_types: typing.List[type] = list()
-        for binding in Bindings.__bindings__:
-            bonded_types.append(binding.python_type)
-        return bonded_types
+        return list(Bindings.__bindings__.keys())
 
     @staticmethod
     def to_json_value(python_value: typing.Any) -> typing.Union[JsonTypes]:
@@ -117,6 +152,35 @@ class Bindings(object):
             python_type = bond.python_type
         return bond.to_python_value(json_value=json_value, python_type=python_type)
 
+    @staticmethod
+    def to_python_projection(json_value: typing.Union[JsonTypes],
+                             python_type: type = None,
+                             projection: dict = None) -> typing.Any:
+
+        if projection is None:
+            return Bindings.to_python_value(json_value=json_value, python_type=python_type)
+        if python_type:
+            bond = Bindings.get_binding(python_type=python_type)
+        else:
+            bond = Bindings.__default_binding__[json_value.__class__]
+            python_type = bond.python_type
+        return bond.to_python_projection(json_value=json_value, python_type=python_type, projection=projection)
+
+    @staticmethod
+    def projection_tree(paths: typing.Iterable[str]) -> dict:
+        # ["meta.id", "payload"] -> {"meta": {"id": None}, "payload": None}
+        tree = dict()
+        for path in paths:
+            node = tree
+            names = path.split(".")
+            for name in names[:-1]:
+                if name in node and node[name] is None:
+                    break
+                node = node.setdefault(name, dict())
+            else:
+                node[names[-1]] = None
+        return tree
+
     @staticmethod
     def get_default_binding(json_type: type) -> typing.Union[TypeBinding, None]:
         if json_type in Bindings.__default_binding__:
@@ -142,30 +206,41 @@ class ListBinding(BaseBinding):
         super().__init__(base_type=list)
 
     def to_json_value(self, python_value: typing.Any) -> typing.Union[JsonTypes]:
-        from .serialization import Bindings
         json_value = list()
         for value in python_value:
             json_value.append(Bindings.to_json_value(value))
         return json_value
 
+    def to_json_items(self, python_value: typing.Any) -> typing.Union[None, typing.Iterable]:
+        return python_value
+
     def to_python_value(self, json_value: typing.Union[JsonTypes], python_type: type) -> typing.Any:
         return json_value
 
+    def to_python_projection(self, json_value: typing.Union[JsonTypes], python_type: type, projection: dict) -> typing.Any:
+        return [Bindings.to_python_projection(json_value=value, projection=projection) for value in json_value]
+
 
 class DictBinding(BaseBinding):
     def __init__(self):
         super().__init__(base_type=dict)
 
     def to_json_value(self, python_value: typing.Any) -> typing.Union[JsonTypes]:
-        from .serialization import Bindings
         json_value = dict()
         for key, value in python_value.items():
             json_value[key] = Bindings.to_json_value(value)
         return json_value
 
+    def to_json_items(self, python_value: typing.Any) -> typing.Union[None, typing.Iterable]:
+        return python_value.items()
+
     def to_python_value(self, json_value: typing.Union[JsonTypes], python_type: type) -> typing.Any:
         return json_value
 
+    def to_python_projection(self, json_value: typing.Union[JsonTypes], python_type: type, projection: dict) -> typing.Any:
+        return {key: Bindings.to_python_projection(json_value=json_value[key], projection=member_projection)
+                for key, member_projection in projection.items() if key in json_value}
+
 
 Bindings.set_binding(BaseBinding(base_type=types.NoneType), default_json_type_binding=True)
 Bindings.set_binding(BaseBinding(base_type=bool), default_json_type_binding=True)
@@ -1,4 +1,5 @@
-from .list import List
-from .object import Object
+from .list import List, ColumnarListBinding
+from .array_list import ArrayList
+from .object import Object, BaseObject, SlottedObject
 from .string import String
 from .util import SortOrder, SearchType, NotFoundBehavior
\ No newline at end of file
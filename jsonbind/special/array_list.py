@@ -0,0 +1,283 @@
+import array
+import typing
+import weakref
+from ..core.type_binding import TypeBinding, JsonTypes, Bindings
+from ..core.serialization import Serialization
+from ..core.binary import BinaryEncoder
+from jsonbind.special.serializable import Serializable
+from .list import List
+from .util import bin_search, bin_search_many, bin_search_ranges, SearchType, SortOrder, NotFoundBehavior
+
+
+class ArrayList(array.array, Serializable):
+    # numeric list stored in a compact array.array buffer (8 bytes per element for the default type codes)
+    # with the same interface as List. It is not a List subclass, so isinstance(value, List) checks do not match it.
+    # Values that do not fit the type code (ints over 64 bits) raise TypeError, as values of the wrong type do
+
+    __typecodes__: typing.Dict[type, str] = {float: "d", int: "q"}
+    # types built by create_type, held weakly as List.__types__
+    __types__: typing.MutableMapping[tuple, type] = weakref.WeakValueDictionary()
+
+    def __new__(cls, list_type: type = float, iterable=None, typecode: str = ""):
+        if not typecode:
+            if list_type not in ArrayList.__typecodes__:
+                raise TypeError(f"array lists only support {', '.join(t.__name__ for t in ArrayList.__typecodes__)}")
+            typecode = ArrayList.__typecodes__[list_type]
+        new_list = super().__new__(cls, typecode)
+        if iterable is not None:
+            new_list.extend(iterable)
+        return new_list
+
+    @staticmethod
+    def create_type(list_type: type = float, typecode: str = "", list_name: str = "") -> type:
+        # calls with the same arguments return the same class, as List.create_type does
+        type_arguments = (list_type, typecode, list_name)
+        created_type = ArrayList.__types__.get(type_arguments)
+        if created_type is not None:
+            return created_type
+
+        def __new__(cls, iterable=None):
+            return ArrayList.__new__(cls, list_type=list_type, iterable=iterable, typecode=typecode)
+        if not list_name:
+            list_name = "%sArrayList" % list_type.__name__
+        new_type = type(list_name, (ArrayList,), {"__new__": __new__, "__type_arguments__": type_arguments})
+        ArrayList.__types__[type_arguments] = new_type
+        return new_type
+
+    @property
+    def list_type(self) -> type:
+        return float if self.typecode in "fd" else int
+
+    @property
+    def allow_empty(self) -> bool:
+        return False
+
+    def __type_check__(self, value) -> typing.Any:
+        if value.__class__ is self.list_type:
+            return value
+        if self.list_type is float and isinstance(value, int) and not isinstance(value, bool):
+            return float(value)
+        raise TypeError(f"this list only allows values of type {self.list_type.__name__}")
+
+    def __type_check_many__(self, values: typing.Iterable) -> typing.Any:
+        # the buffer would take bools (as 0 and 1), so values are checked as __type_check__ does, once per class
+        if isinstance(values, array.array):
+            if values.typecode == self.typecode:
+                return values
+            values = values.tolist()
+        elif not isinstance(values, (list, tuple)):
+            values = list(values)
+        value_types = set(map(type, values))
+        if value_types and not value_types <= ({float, int} if self.list_type is float else {int}):
+            raise TypeError(f"this list only allows values of type {self.list_type.__name__}")
+        return values
+
+    def __overflow__(self, error: OverflowError) -> TypeError:
+        return TypeError(f"value does not fit in an array list of type code '{self.typecode}': {error}")
+
+    def __like__(self, iterable=None) -> "ArrayList":
+        # a new list of the same type and type code
+        return ArrayList.__new__(self.__class__, list_type=self.list_type, iterable=iterable, typecode=self.typecode)
+
+    def __reduce_ex__(self, protocol):
+        # array.array defines __reduce_ex__, which pickle prefers over __reduce__
+        return ArrayList.__rebuild__, (List.__type_reference__(self.__class__), self.typecode, self.tobytes())
+
+    @staticmethod
+    def __rebuild__(type_reference: typing.Union[type, tuple], typecode: str, data: bytes) -> "ArrayList":
+        if isinstance(type_reference, tuple):
+            type_reference = ArrayList.create_type(*type_reference)
+        new_list = ArrayList.__new__(type_reference, typecode=typecode)
+        new_list.frombytes(data)
+        return new_list
+
+    def __eq__(self, other):
+        if isinstance(other, array.array):
+            return array.array.__eq__(self, other)
+        if isinstance(other, list):
+            return self.tolist() == other
+        return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.__like__(array.array.__getitem__(self, index))
+        return array.array.__getitem__(self, index)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = self.__type_check_many__(value)
+            if not isinstance(value, array.array):
+                value = array.array(self.typecode, value)
+        else:
+            value = self.__type_check__(value)
+        try:
+            array.array.__setitem__(self, index, value)
+        except OverflowError as error:
+            raise self.__overflow__(error) from None
+
+    def append(self, value):
+        try:
+            array.array.append(self, self.__type_check__(value))
+        except OverflowError as error:
+            raise self.__overflow__(error) from None
+
+    def insert(self, i, value):
+        try:
+            array.array.insert(self, i, self.__type_check__(value))
+        except OverflowError as error:
+            raise self.__overflow__(error) from None
+
+    def __add__(self, other):
+        new_list = self.__like__(self)
+        new_list.__iadd__(other)
+        return new_list
+
+    def __iadd__(self, other):
+        self.extend(other)
+        return self
+
+    def __copy__(self) -> "ArrayList":
+        return self.__like__(self)
+
+    def __deepcopy__(self, memo: dict = None) -> "ArrayList":
+        return self.__like__(self)
+
+    def copy(self) -> "ArrayList":
+        return self.__copy__()
+
+    def deepcopy(self) -> "ArrayList":
+        return self.__copy__()
+
+    def extend(self, iterable, trusted: bool = False):
+        if not trusted:
+            iterable = self.__type_check_many__(iterable)
+        elif isinstance(iterable, array.array) and iterable.typecode != self.typecode:
+            iterable = iterable.tolist()
+        size = len(self)
+        try:
+            array.array.extend(self, iterable)
+        except OverflowError as error:
+            # the values before the one that failed were already appended
+            del self[size:]
+            raise self.__overflow__(error) from None
+
+    def fromlist(self, values: list):
+        self.extend(values)
+
+    def split_by(self, m: typing.Callable) -> dict:
+        result = {}
+        for item in self:
+            computed_field = m(item)
+            if computed_field not in result:
+                result[computed_field] = self.__like__()
+            result[computed_field].append(item)
+        return result
+
+    def filter(self, key: typing.Any) -> "ArrayList":
+        return self.__like__([item for item in self if key(item)])
+
+    def find_first(self, key, not_found_behavior=NotFoundBehavior.RaiseError):
+        index = self.find_first_index(key, not_found_behavior=not_found_behavior)
+        return None if index is None else array.array.__getitem__(self, index)
+
+    def find_first_index(self, key, not_found_behavior=NotFoundBehavior.RaiseError):
+        if callable(key):
+            for ix, i in enumerate(self):
+                if key(i):
+                    return ix
+        elif key in self:
+            return self.index(key)
+
+        if not_found_behavior == NotFoundBehavior.RaiseError:
+            raise RuntimeError("Value not found")
+        else:
+            return None
+
+    def find_ordered(self,
+                     value,
+                     key=None,
+                     search_type: SearchType = SearchType.Exact,
+                     order: SortOrder = SortOrder.Ascending,
+                     not_found_behavior: NotFoundBehavior = NotFoundBehavior.RaiseError):
+        i = bin_search(self, value, key=key, search_type=search_type, order=order, not_found_behavior=not_found_behavior)
+        return None if i is None else array.array.__getitem__(self, i)
+
+    def find_ordered_index(self,
+                           value,
+                           key=None,
+                           search_type: SearchType = SearchType.Exact,
+                           order: SortOrder = SortOrder.Ascending,
+                           not_found_behavior: NotFoundBehavior = NotFoundBehavior.RaiseError):
+        return bin_search(self,
+                          value,
+                          key=key,
+                          search_type=search_type,
+                          order=order,
+                          not_found_behavior=not_found_behavior)
+
+    def find_ordered_many(self,
+                          values: typing.Iterable,
+                          key=None,
+                          search_type: SearchType = SearchType.Exact,
+                          order: SortOrder = SortOrder.Ascending,
+                          not_found_behavior: NotFoundBehavior = NotFoundBehavior.RaiseError) -> list:
+        indexes = self.find_ordered_indexes(values, key=key, search_type=search_type, order=order, not_found_behavior=not_found_behavior)
+        size = len(self)
+        return [array.array.__getitem__(self, i) if i is not None and i < size else None for i in indexes]
+
+    def find_ordered_indexes(self,
+                             values: typing.Iterable,
+                             key=None,
+                             search_type: SearchType = SearchType.Exact,
+                             order: SortOrder = SortOrder.Ascending,
+                             not_found_behavior: NotFoundBehavior = NotFoundBehavior.RaiseError) -> typing.List[int]:
+        # searched in place with numpy when it is installed and no key is given
+        return bin_search_many(self, values, key=key, search_type=search_type, order=order, not_found_behavior=not_found_behavior)
+
+    def find_ordered_range(self, start_value, end_value, key=None, order: SortOrder = SortOrder.Ascending) -> "ArrayList":
+        return self.find_ordered_ranges([(start_value, end_value)], key=key, order=order)[0]
+
+    def find_ordered_ranges(self,
+                            ranges: typing.Iterable[typing.Tuple[typing.Any, typing.Any]],
+                            key=None,
+                            order: SortOrder = SortOrder.Ascending) -> typing.List["ArrayList"]:
+        return [self[start:stop] for start, stop in bin_search_ranges(self, ranges, key=key, order=order)]
+
+    def to_lines(self, fp, **kwargs) -> int:
+        return Serialization.serialize_lines(python_values=self, fp=fp, **kwargs)
+
+    @classmethod
+    def from_lines(cls, fp, workers: int = 0) -> "ArrayList":
+        new_list = cls()
+        new_list.extend(Serialization.deserialize_lines(fp=fp, python_type=new_list.list_type, workers=workers))
+        return new_list
+
+    def map(self, process: typing.Callable) -> "List":
+        new_list = List()
+        for item in self:
+            new_list.append(process(item))
+        return new_list
+
+
+class ArrayListBinding(TypeBinding):
+    # the buffer converts to and from json lists in one call, elements are never bound one by one
+    def __init__(self):
+        super().__init__(json_type=list, python_type=ArrayList)
+
+    def to_json_value(self, python_value: ArrayList) -> typing.Union[JsonTypes]:
+        return python_value.tolist()
+
+    def to_python_value(self, json_value: typing.Union[JsonTypes], python_type: type) -> typing.Any:
+        python_value: ArrayList = python_type()
+        python_value.extend(json_value)
+        return python_value
+
+
+Bindings.set_binding(ArrayListBinding())
+BinaryEncoder.__packed_bindings__.add(ArrayListBinding)
@@ -1,12 +1,86 @@
+import operator
+import types
 import typing
-from ..core.type_binding import TypeBinding, JsonTypes, Bindings
+import weakref
+from ..core.type_binding import TypeBinding, JsonTypes, Bindings, BaseBinding
+from ..core.plan import ClassPlan
+from ..core.serialization import Serialization
+from ..core.parallel import Parallel
+from ..core.binary import BinaryEncoder
 from jsonbind.special.serializable import Serializable
-from .util import bin_search, SearchType, SortOrder, NotFoundBehavior
+from .object import BaseObject, Object, SlottedObject
+from .util import bin_search, bin_search_many, bin_search_ranges, SearchType, SortOrder, NotFoundBehavior, IndexType, ListIndex, HashIndex, SortedIndex
+
+
+class ListValidator(object):
+    # element checks for one (list_type, allow_empty) pair. accepted element classes are remembered,
+    # so bulk operations only look at each distinct class once. New bindings never make an accepted class
+    # invalid (bindings are replaced, not removed), so validators are kept for the life of the process
+
+    __validators__: typing.Dict[tuple, "ListValidator"] = dict()
+
+    def __init__(self, list_type: typing.Union[None, type], allow_empty: bool):
+        self.list_type = list_type
+        self.allow_empty = allow_empty
+        # accepted class -> whether its values are converted to float
+        self.accepted: typing.Dict[type, bool] = dict()
+
+    @staticmethod
+    def get(list_type: typing.Union[None, type], allow_empty: bool) -> "ListValidator":
+        validator = ListValidator.__validators__.get((list_type, allow_empty))
+        if validator is None:
+            validator = ListValidator(list_type=list_type, allow_empty=allow_empty)
+            ListValidator.__validators__[(list_type, allow_empty)] = validator
+        return validator
+
+    def check(self, value: typing.Any) -> typing.Any:
+        convert = self.accepted.get(value.__class__)
+        if convert is None:
+            convert = self.__accept__(value.__class__)
+        return float(value) if convert else value
+
+    def check_many(self, values: list, owner: typing.Any = None) -> list:
+        accepted = self.accepted
+        value_types = set(map(type, values))
+        convert = False
+        for value_type in value_types:
+            value_convert = accepted.get(value_type)
+            if value_convert is None:
+                value_convert = self.__accept__(value_type)
+            convert = convert or value_convert
+        if owner is not None and owner.__class__ in value_types and any(value is owner for value in values):
+            raise ValueError("recursive lists are not allowed")
+        if convert:
+            return [float(value) if value.__class__ is int else value for value in values]
+        return values
+
+    def __accept__(self, value_type: type) -> bool:
+        convert = False
+        if value_type is types.NoneType:
+            if not self.allow_empty:
+                raise TypeError(f"this list does not allow empty values")
+        elif self.list_type:
+            if not issubclass(value_type, self.list_type):
+                if self.list_type is float and value_type is int:  # json ints can also be floats
+                    convert = True
+                else:
+                    raise TypeError(f"this list only allows values of type {self.list_type.__name__}")
+        elif not Bindings.is_bonded(python_type=value_type):
+            raise TypeError(f"value of type {value_type} is not serializable")
+        self.accepted[value_type] = convert
+        return convert
 
 
 class List(list, Serializable):
 
-    def __init__(self, list_type=None, iterable=None, allow_empty: bool = False):
+    # types built by create_type, held weakly: a type nothing else uses is dropped with its class
+    __types__: typing.MutableMapping[tuple, type] = weakref.WeakValueDictionary()
+    # declared indexes by key, set on the instance by add_index
+    __indexes__: typing.Union[None, typing.Dict[typing.Any, ListIndex]] = None
+    __no_value__ = object()
+
+    def __init__(self, list_type=None, iterable=None, allow_empty: bool = False, trusted: bool = False):
+        # trusted skips the element checks, for values that are known to be valid (i.e. decoded by a binding)
         if list_type is not None:
             if not Bindings.is_bonded(list_type):
                 raise TypeError(f"list type {list_type} is not serializable")
@@ -14,44 +88,74 @@ class List(list, Serializable):
         self.allow_empty = allow_empty
         list.__init__(self)
         if iterable:
-            list.__iadd__(self, map(self.__type_check__, iterable))
+            list.extend(self, iterable if trusted else self.__type_check_many__(iterable))
 
     @staticmethod
-    def create_type(list_type=None, allow_empty: bool = False, list_name: str = "") -> type:
-        def __init__(self, iterable=None):
-            List.__init__(self, iterable=iterable, list_type=list_type, allow_empty=allow_empty)
+    def create_type(list_type=None, allow_empty: bool = False, list_name: str = "", columnar: bool = False) -> type:
+        # created types are cached by their arguments, so other processes can rebuild the same type when unpickling:
+        # calls with the same arguments return the same class while it is in use, and bindings or attributes set on
+        # it are shared by every caller. Pass a list_name to get a distinct type.
+        # columnar lists of objects are encoded as {"columns": [...], "data": [...]} (see ColumnarListBinding)
+        type_arguments = (list_type, allow_empty, list_name, columnar)
+        created_type = List.__types__.get(type_arguments)
+        if created_type is not None:
+            return created_type
+
+        def __init__(self, iterable=None, trusted: bool = False):
+            List.__init__(self, iterable=iterable, list_type=list_type, allow_empty=allow_empty, trusted=trusted)
         if not list_name:
-            list_name = "%sList" % list_type.__name__
-        new_type = type(list_name, (List,), {"__init__": __init__})
+            list_name = ("%sColumnarList" if columnar else "%sList") % list_type.__name__
+        new_type = type(list_name, (List,), {"__init__": __init__, "__type_arguments__": type_arguments})
+        List.__types__[type_arguments] = new_type
+        if columnar:
+            Bindings.set_binding(ColumnarListBinding(python_type=new_type))
         return new_type
 
+    @staticmethod
+    def __type_reference__(python_type: type) -> typing.Union[type, tuple]:
+        # only the types built by create_type are rebuilt from their arguments, their subclasses are referenced
+        if python_type is not None and "__type_arguments__" in python_type.__dict__:
+            return python_type.__type_arguments__
+        return python_type
+
+    @staticmethod
+    def __from_type_reference__(type_reference: typing.Union[type, tuple]) -> type:
+        if isinstance(type_reference, tuple):
+            return List.create_type(*type_reference)
+        return type_reference
+
+    def __reduce__(self):
+        state = {key: value for key, value in self.__dict__.items() if key != "__indexes__"}
+        return List.__rebuild__, (List.__type_reference__(self.__class__), state, list(self))
+
+    @staticmethod
+    def __rebuild__(type_reference: typing.Union[type, tuple], state: dict, items: list) -> "List":
+        list_type = List.__from_type_reference__(type_reference)
+        new_list = list_type.__new__(list_type)
+        new_list.__dict__.update(state)
+        list.extend(new_list, items)
+        return new_list
+
     def __type_check__(self, value) -> typing.Any:
-        if id(value) == id(self):
+        if value is self:
             raise ValueError("recursive lists are not allowed")
-
-        if value is None:
-            if not self.allow_empty:
-                raise TypeError(f"this list does not allow empty values")
+        if value.__class__ is self.list_type:
             return value
+        return ListValidator.get(self.list_type, self.allow_empty).check(value)
 
-
-        if self.list_type:
-            if not isinstance(value, self.list_type):
-                if self.list_type is float and type(value) is int:  # json ints can also be floats
-                    value = float(value)
-                else:
-                    raise TypeError(f"this list only allows values of type {self.list_type.__name__}")
-        else:
-            if not Bindings.is_bonded(python_type=value.__class__):
-                raise TypeError(f"value of type {value.__class__} is not serializable")
-        return value
+    def __type_check_many__(self, values: typing.Iterable) -> list:
+        values = values if values.__class__ is list else list(values)
+        return ListValidator.get(self.list_type, self.allow_empty).check_many(values, owner=self)
 
     def __iadd__(self, other):
-        list.__iadd__(self, map(self.__type_check__, other))
+        start = len(self)
+        list.extend(self, self.__type_check_many__(other))
+        if self.__indexes__:
+            self.__index_inserted__(start, len(self) - start)
         return self
 
     def __add__(self, other):
-        new_list = List(list_type=self.list_type, iterable=self)
+        new_list = List(list_type=self.list_type, iterable=self, trusted=True)
         new_list.__iadd__(other)
         return new_list
 
@@ -62,19 +166,163 @@ class List(list, Serializable):
 
     def __setitem__(self, index, value):
         if isinstance(index, slice):
-            value = map(self.__type_check__, value)
+            value = self.__type_check_many__(value)
+            if not self.__indexes__:
+                list.__setitem__(self, index, value)
+                return
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                removed = list.__getitem__(self, slice(start, max(start, stop)))
+                list.__setitem__(self, index, value)
+                self.__index_removed__(start, removed, len(self) - len(value))
+                self.__index_inserted__(start, len(value))
+            else:
+                # extended slices replace as many values as they take
+                removed = list.__getitem__(self, index)
+                list.__setitem__(self, index, value)
+                for list_index in self.__indexes__.values():
+                    if list_index.valid:
+                        for position, previous_value, new_value in zip(range(start, stop, step), removed, value):
+                            list_index.remove(position, previous_value)
+                            list_index.add(position, new_value)
+            return
+        value = self.__type_check__(value)
+        if self.__indexes__:
+            position = range(len(self))[index]
+            previous_value = list.__getitem__(self, position)
+            list.__setitem__(self, position, value)
+            for list_index in self.__indexes__.values():
+                if list_index.valid:
+                    list_index.remove(position, previous_value)
+                    list_index.add(position, value)
+        else:
+            list.__setitem__(self, index, value)
+
+    def __delitem__(self, index):
+        if not self.__indexes__:
+            list.__delitem__(self, index)
+            return
+        if not isinstance(index, slice):
+            position = range(len(self))[index]
+            removed = [list.__getitem__(self, position)]
+            list.__delitem__(self, position)
+            self.__index_removed__(position, removed, len(self))
+            return
+        start, stop, step = index.indices(len(self))
+        if step == 1:
+            removed = list.__getitem__(self, slice(start, max(start, stop)))
+            list.__delitem__(self, index)
+            self.__index_removed__(start, removed, len(self))
         else:
-            value = self.__type_check__(value)
-        list.__setitem__(self, index, value)
+            list.__delitem__(self, index)
+            self.reindex()
+
+    def __imul__(self, other):
+        list.__imul__(self, other)
+        self.reindex()
+        return self
 
     def append(self, value):
         list.append(self, self.__type_check__(value))
+        if self.__indexes__:
+            self.__index_inserted__(len(self) - 1, 1)
 
-    def extend(self, iterable):
-        list.extend(self, self.__type_check__(iterable))
+    def extend(self, iterable, trusted: bool = False):
+        start = len(self)
+        list.extend(self, iterable if trusted else self.__type_check_many__(iterable))
+        if self.__indexes__:
+            self.__index_inserted__(start, len(self) - start)
 
     def insert(self, i, value):
-        list.insert(self, i, self.__type_check__(value))
+        value = self.__type_check__(value)
+        if self.__indexes__:
+            position = max(0, min(len(self), i if i >= 0 else len(self) + i))
+            list.insert(self, position, value)
+            self.__index_inserted__(position, 1)
+        else:
+            list.insert(self, i, value)
+
+    def pop(self, index=-1):
+        value = list.pop(self, index)
+        if self.__indexes__:
+            position = index if index >= 0 else len(self) + 1 + index
+            self.__index_removed__(position, [value], len(self))
+        return value
+
+    def remove(self, value):
+        if not self.__indexes__:
+            list.remove(self, value)
+            return
+        position = self.index(value)
+        removed = [list.__getitem__(self, position)]
+        list.__delitem__(self, position)
+        self.__index_removed__(position, removed, len(self))
+
+    def clear(self):
+        list.clear(self)
+        self.reindex()
+
+    def sort(self, *, key=None, reverse=False):
+        list.sort(self, key=key, reverse=reverse)
+        self.reindex()
+
+    def reverse(self):
+        list.reverse(self)
+        self.reindex()
+
+    def add_index(self, key: typing.Union[str, typing.Callable], index_type: IndexType = IndexType.Hash) -> None:
+        """
+        Declares an index on the values of the list.
+
+        Args:
+            key: attribute name (dotted for nested members) or function of the value.
+            index_type (IndexType): Hash for find_by / filter_by, Sorted also serves find_ordered.
+
+        Appends, inserts, deletes and assignments (items and slices) update the index, sorts, reverses,
+        repetitions and extended slice deletes rebuild it on the next query. Changes made to the values
+        themselves need a call to reindex().
+        """
+        if self.__indexes__ is None:
+            self.__indexes__ = dict()
+        self.__indexes__[key] = SortedIndex(key=key) if index_type == IndexType.Sorted else HashIndex(key=key)
+
+    def drop_index(self, key: typing.Union[str, typing.Callable]) -> None:
+        if self.__indexes__:
+            self.__indexes__.pop(key, None)
+
+    def reindex(self) -> None:
+        if self.__indexes__:
+            for list_index in self.__indexes__.values():
+                list_index.valid = False
+
+    def __get_index__(self, key: typing.Any, index_type: typing.Union[None, type] = None) -> typing.Union[None, ListIndex]:
+        if not self.__indexes__ or key not in self.__indexes__:
+            return None
+        list_index = self.__indexes__[key]
+        if index_type is not None and not isinstance(list_index, index_type):
+            return None
+        if not list_index.valid:
+            list_index.build(self)
+        return list_index
+
+    def __index_inserted__(self, start: int, count: int) -> None:
+        # count values were inserted at start
+        for list_index in self.__indexes__.values():
+            if list_index.valid:
+                if start + count < len(self):
+                    list_index.shift(start, count)
+                for position in range(start, start + count):
+                    list_index.add(position, list.__getitem__(self, position))
+
+    def __index_removed__(self, start: int, removed: list, size: int) -> None:
+        # the removed values were at start and after, size is the length of the list without them
+        count = len(removed)
+        for list_index in self.__indexes__.values():
+            if list_index.valid:
+                for position, value in enumerate(removed, start):
+                    list_index.remove(position, value)
+                if start < size:
+                    list_index.shift(start + count, -count)
 
     def split_by(self, m: typing.Callable) -> dict:
         result = {}
@@ -86,7 +334,11 @@ class List(list, Serializable):
             result[computed_field].append(item)
         return result
 
-    def filter(self, key: typing.Any) -> "List":
+    def filter(self, key: typing.Any, value: typing.Any = __no_value__) -> "List":
+        # key is a predicate, evaluated on every value (functions can not be looked up in an index). With a value,
+        # key is an index key and the values whose key equals value are selected as filter_by does
+        if value is not List.__no_value__:
+            return self.filter_by(key, value)
         filtered_list = self.__class__()
         filtered_list.list_type = self.list_type
         for item in self:
@@ -94,11 +346,14 @@ class List(list, Serializable):
                 filtered_list.append(item)
         return filtered_list
 
-    def find_first(self, key, not_found_behavior=NotFoundBehavior.RaiseError):
-        index = self.find_first_index(key, not_found_behavior=not_found_behavior)
+    def find_first(self, key, not_found_behavior=NotFoundBehavior.RaiseError, value: typing.Any = __no_value__):
+        index = self.find_first_index(key, not_found_behavior=not_found_behavior, value=value)
         return None if index is None else List.__getitem__(self, index)
 
-    def find_first_index(self, key, not_found_behavior=NotFoundBehavior.RaiseError):
+    def find_first_index(self, key, not_found_behavior=NotFoundBehavior.RaiseError, value: typing.Any = __no_value__):
+        # key is a predicate or the value to find, with a value it is an index key (see filter)
+        if value is not List.__no_value__:
+            return self.find_index_by(key, value, not_found_behavior=not_found_behavior)
         if callable(key):
             for ix, i in enumerate(self):
                 if key(i):
@@ -113,13 +368,45 @@ class List(list, Serializable):
         else:
             return None
 
+    def find_by(self, key, value, not_found_behavior=NotFoundBehavior.RaiseError):
+        index = self.find_index_by(key, value, not_found_behavior=not_found_behavior)
+        return None if index is None else List.__getitem__(self, index)
+
+    def find_index_by(self, key, value, not_found_behavior=NotFoundBehavior.RaiseError):
+        positions = self.__find_positions__(key, value, first=True)
+        if positions:
+            return positions[0]
+        if not_found_behavior == NotFoundBehavior.RaiseError:
+            raise RuntimeError("Value not found")
+        else:
+            return None
+
+    def filter_by(self, key, value) -> "List":
+        filtered_list = self.__class__()
+        filtered_list.list_type = self.list_type
+        list.extend(filtered_list, [list.__getitem__(self, position) for position in self.__find_positions__(key, value)])
+        return filtered_list
+
+    def __find_positions__(self, key, value, first: bool = False) -> typing.List[int]:
+        list_index = self.__get_index__(key)
+        if list_index is not None:
+            return list_index.find(value)
+        get_key = operator.attrgetter(key) if isinstance(key, str) else key
+        positions = list()
+        for ix, i in enumerate(self):
+            if get_key(i) == value:
+                positions.append(ix)
+                if first:
+                    break
+        return positions
+
     def find_ordered(self,
                      value,
                      key=None,
                      search_type: SearchType = SearchType.Exact,
                      order: SortOrder = SortOrder.Ascending,
                      not_found_behavior: NotFoundBehavior = NotFoundBehavior.RaiseError):
-        i = bin_search(self, value, key=key, search_type=search_type, order=order, not_found_behavior=not_found_behavior)
+        i = self.find_ordered_index(value, key=key, search_type=search_type, order=order, not_found_behavior=not_found_behavior)
         return None if i is None else List.__getitem__(self, i)
 
     def find_ordered_index(self,
@@ -128,12 +415,72 @@ class List(list, Serializable):
                            search_type: SearchType = SearchType.Exact,
                            order: SortOrder = SortOrder.Ascending,
                            not_found_behavior: NotFoundBehavior = NotFoundBehavior.RaiseError):
-        return bin_search(self,
-                          value,
-                          key=key,
-                          search_type=search_type,
-                          order=order,
-                          not_found_behavior=not_found_behavior)
+        # with a sorted index on the key the list does not need to be sorted
+        list_index = self.__get_index__(key, SortedIndex) if key is not None else None
+        if list_index is None or search_type in (SearchType.LowerBound, SearchType.UpperBound):
+            return bin_search(self,
+                              value,
+                              key=operator.attrgetter(key) if isinstance(key, str) else key,
+                              search_type=search_type,
+                              order=order,
+                              not_found_behavior=not_found_behavior)
+        positions = list_index.find(value)
+        if positions:
+            return positions[0]
+        if search_type == SearchType.Aprox and len(self):
+            return list_index.nearest(value)
+        if not_found_behavior == NotFoundBehavior.RaiseError:
+            raise RuntimeError("Value not found")
+        else:
+            return None
+
+    def find_ordered_many(self,
+                          values: typing.Iterable,
+                          key=None,
+                          search_type: SearchType = SearchType.Exact,
+                          order: SortOrder = SortOrder.Ascending,
+                          not_found_behavior: NotFoundBehavior = NotFoundBehavior.RaiseError) -> list:
+        indexes = self.find_ordered_indexes(values, key=key, search_type=search_type, order=order, not_found_behavior=not_found_behavior)
+        size = len(self)
+        return [list.__getitem__(self, i) if i is not None and i < size else None for i in indexes]
+
+    def find_ordered_indexes(self,
+                             values: typing.Iterable,
+                             key=None,
+                             search_type: SearchType = SearchType.Exact,
+                             order: SortOrder = SortOrder.Ascending,
+                             not_found_behavior: NotFoundBehavior = NotFoundBehavior.RaiseError) -> typing.List[int]:
+        return bin_search_many(self,
+                               values,
+                               key=operator.attrgetter(key) if isinstance(key, str) else key,
+                               search_type=search_type,
+                               order=order,
+                               not_found_behavior=not_found_behavior)
+
+    def find_ordered_range(self, start_value, end_value, key=None, order: SortOrder = SortOrder.Ascending) -> "List":
+        return self.find_ordered_ranges([(start_value, end_value)], key=key, order=order)[0]
+
+    def find_ordered_ranges(self,
+                            ranges: typing.Iterable[typing.Tuple[typing.Any, typing.Any]],
+                            key=None,
+                            order: SortOrder = SortOrder.Ascending) -> typing.List["List"]:
+        # the values between each (start_value, end_value) pair, both included
+        results = list()
+        for start, stop in bin_search_ranges(self, ranges, key=operator.attrgetter(key) if isinstance(key, str) else key, order=order):
+            range_list = self.__class__()
+            range_list.list_type = self.list_type
+            list.extend(range_list, list.__getitem__(self, slice(start, stop)))
+            results.append(range_list)
+        return results
+
+    def to_lines(self, fp, **kwargs) -> int:
+        return Serialization.serialize_lines(python_values=self, fp=fp, **kwargs)
+
+    @classmethod
+    def from_lines(cls, fp, workers: int = 0) -> "List":
+        new_list = cls()
+        new_list.__iadd__(Serialization.deserialize_lines(fp=fp, python_type=new_list.list_type, workers=workers))
+        return new_list
 
     def map(self, process: typing.Callable) -> "List":
         new_list = List()
@@ -141,8 +488,69 @@ class List(list, Serializable):
             new_list.append(process(item))
         return new_list
 
+    def to_columns(self) -> typing.Dict[str, list]:
+        # one list of values per column of the objects (dotted names for nested objects, as in get_columns)
+        if self.list_type is None or not issubclass(self.list_type, BaseObject):
+            raise TypeError("list_type must inherit from BaseObject")
+        if not self:
+            return dict()
+        return {column_name: list(map(operator.attrgetter(column_name), self))
+                for column_name, column_type in list.__getitem__(self, 0).get_columns()}
+
+    @classmethod
+    def from_columns(cls, columns: typing.Dict[str, typing.Sequence], list_type: type = None) -> "List":
+        # builds the objects column by column: dotted names are split once, not once per value, and values are
+        # converted to the type of the member they replace. Unlike set_values, None is kept as it is, so json nulls
+        # decoded from columnar documents stay null
+        new_list = cls()
+        if list_type is not None:
+            new_list.list_type = list_type
+        if new_list.list_type is None or not issubclass(new_list.list_type, BaseObject):
+            raise TypeError("list_type must inherit from BaseObject")
+        object_type = new_list.list_type
+        columns = {column_name: column if isinstance(column, list) else list(column) for column_name, column in columns.items()}
+        size = len(next(iter(columns.values()))) if columns else 0
+        if any(len(column) != size for column in columns.values()):
+            raise ValueError("columns must have the same length")
+        template = object_type()
+        missing_parents: typing.List[str] = list()
+        assignments: typing.List[typing.Tuple[typing.Union[None, typing.Callable], str, list]] = list()
+        for column_name, column in columns.items():
+            path = column_name.split(".")
+            member = template
+            for depth, member_name in enumerate(path):
+                member = member.__values__().get(member_name, None) if isinstance(member, BaseObject) else None
+                if member is None and depth < len(path) - 1:
+                    parent_name = ".".join(path[:depth + 1])
+                    if parent_name not in missing_parents:
+                        missing_parents.append(parent_name)
+            member_type = member.__class__
+            if member is not None and not all(issubclass(value_type, member_type) or value_type is types.NoneType
+                                              for value_type in set(map(type, column))):
+                column = [value if value is None or isinstance(value, member_type) else member_type(value) for value in column]
+            elif column:
+                Bindings.get_binding(column[0].__class__)
+            parent = operator.attrgetter(".".join(path[:-1])) if len(path) > 1 else None
+            assignments.append((parent, path[-1], column))
+        python_values = [object_type() for _ in range(size)]
+        for parent_name in missing_parents:
+            # members the default object does not have are created as plain objects
+            path = parent_name.split(".")
+            parent = operator.attrgetter(".".join(path[:-1])) if len(path) > 1 else None
+            for python_value in python_values:
+                setattr(parent(python_value) if parent else python_value, path[-1], Object())
+        for parent, member_name, column in assignments:
+            if parent is None:
+                for python_value, value in zip(python_values, column):
+                    setattr(python_value, member_name, value)
+            else:
+                for python_value, value in zip(python_values, column):
+                    setattr(parent(python_value), member_name, value)
+        new_list.extend(python_values, trusted=True)
+        return new_list
+
     def __copy__(self) -> "List":
-        return List(list_type=self.list_type, iterable=self)
+        return List(list_type=self.list_type, iterable=self, trusted=True)
 
     def __deepcopy__(self, memo: dict = None) -> "List":
         from copy import deepcopy
@@ -160,20 +568,174 @@ class List(list, Serializable):
 
 
 class ListBinding(TypeBinding):
-    def __init__(self):
-        super().__init__(json_type=list, python_type=List)
+    def __init__(self,
+                 python_type: type = List,
+                 workers: int = 0,
+                 parallel_threshold: int = 10000,
+                 chunk_size: int = 2000):
+        # with workers, arrays of at least parallel_threshold elements are bound in a process pool
+        super().__init__(json_type=list, python_type=python_type)
+        self.workers: int = workers
+        self.parallel_threshold: int = parallel_threshold
+        self.chunk_size: int = chunk_size
 
     def to_json_value(self, python_value: typing.Any) -> typing.Union[JsonTypes]:
         json_value = self.json_type(map(Bindings.to_json_value, python_value))
         return json_value
 
+    def to_json_items(self, python_value: typing.Any) -> typing.Union[None, typing.Iterable]:
+        return python_value
+
     def to_python_value(self, json_value: typing.Union[JsonTypes], python_type: type) -> typing.Any:
         python_value: List = python_type()
-        for item in json_value:
-            python_value.append(Bindings.to_python_value(json_value=item, python_type=python_value.list_type))
+        type_reference = List.__type_reference__(python_value.list_type)
+        # decoded elements are still checked in bulk: json nulls and ints in float lists need it
+        if self.workers and len(json_value) >= self.parallel_threshold:
+            chunks = ((chunk, type_reference) for chunk in Parallel.chunks(json_value, self.chunk_size))
+            for items in Parallel.map(ListBinding.to_python_items, chunks, workers=self.workers):
+                python_value.extend(items)
+        else:
+            python_value.extend(ListBinding.to_python_items(json_value, type_reference))
         return python_value
 
+    def to_python_projection(self, json_value: typing.Union[JsonTypes], python_type: type, projection: dict) -> typing.Any:
+        # the projection applies to every element
+        python_value: List = python_type()
+        python_value.extend(ListBinding.to_python_items(json_value, List.__type_reference__(python_value.list_type), projection))
+        return python_value
 
-Bindings.set_binding(ListBinding())
+    @staticmethod
+    def to_python_items(json_values: list, type_reference: typing.Union[None, type, tuple], projection: dict = None) -> list:
+        python_type = List.__from_type_reference__(type_reference)
+        if projection is not None:
+            return [Bindings.to_python_projection(json_value=json_value, python_type=python_type, projection=projection)
+                    for json_value in json_values]
+        if python_type is None:
+            return [Bindings.to_python_value(json_value=json_value) for json_value in json_values]
+        to_python_value = Bindings.get_binding(python_type=python_type).to_python_value
+        return [to_python_value(json_value=json_value, python_type=python_type) for json_value in json_values]
+
+
+class ColumnarListBinding(ListBinding):
+    # lists of objects encoded one array per column instead of one dict per element, so member names are written
+    # once per document:
+    #
+    #   {"columns": ["id", "position.x", "position.y"], "data": [[1, 2], [0.5, 1.5], [0.0, 2.0]]}
+    #
+    # column names are the dotted names of Object.get_columns. Lists whose elements do not share the same members
+    # (or are not objects) are encoded as plain arrays, both layouts are accepted when decoding.
+    #
+    #   Bindings.set_binding(ColumnarListBinding(python_type=Readings)), or List.create_type(Reading, columnar=True)
+
+    __json_types__ = {types.NoneType, bool, int, float, str}
+
+    def to_json_value(self, python_value: typing.Any) -> typing.Union[JsonTypes]:
+        columns = ColumnarListBinding.__columns__(python_value)
+        if columns is None:
+            return list(map(Bindings.to_json_value, python_value))
+        data = list()
+        for column in columns.values():
+            value_types = set(map(type, column))
+            if value_types <= ColumnarListBinding.__json_types__:
+                data.append(column)
+            else:
+                data.append(list(map(Bindings.to_json_value, column)))
+        return {"columns": list(columns), "data": data}
+
+    def to_json_items(self, python_value: typing.Any) -> typing.Union[None, typing.Iterable]:
+        return None
+
+    def to_python_value(self, json_value: typing.Union[JsonTypes], python_type: type) -> typing.Any:
+        if json_value.__class__ is not dict:
+            return super().to_python_value(json_value=json_value, python_type=python_type)
+        return self.to_python_projection(json_value=json_value, python_type=python_type, projection=None)
+
+    def to_python_projection(self, json_value: typing.Union[JsonTypes], python_type: type, projection: dict) -> typing.Any:
+        if json_value.__class__ is not dict:
+            return super().to_python_projection(json_value=json_value, python_type=python_type, projection=projection)
+        column_names = json_value["columns"]
+        data = json_value["data"]
+        if len(column_names) != len(data):
+            raise ValueError("columnar list has {} columns and {} data arrays".format(len(column_names), len(data)))
+        python_value = python_type()
+        list_type = python_value.list_type
+        columns = dict()
+        for column_name, column in zip(column_names, data):
+            path = column_name.split(".")
+            if projection is None or ColumnarListBinding.__projected__(path, projection):
+                columns[column_name] = ColumnarListBinding.__to_python_column__(list_type, path, column)
+        if not columns:
+            python_value.extend([list_type() for _ in range(len(data[0]) if data else 0)], trusted=True)
+            return python_value
+        return python_type.from_columns(columns, list_type=list_type)
+
+    @staticmethod
+    def __columns__(python_value: List) -> typing.Union[None, typing.Dict[str, list]]:
+        # the columns of the elements, or None when they cannot be encoded as columns without losing members
+        if not python_value or python_value.list_type is None or not issubclass(python_value.list_type, BaseObject):
+            return None
+        first = list.__getitem__(python_value, 0)
+        if not isinstance(first, BaseObject):
+            return None
+        column_names = [column_name for column_name, column_type in first.get_columns()]
+        if not column_names:
+            return None
+        object_paths = [""] + sorted({column_name.rsplit(".", 1)[0] for column_name in column_names if "." in column_name})
+        try:
+            for object_path in object_paths:
+                objects = python_value if not object_path else list(map(operator.attrgetter(object_path), python_value))
+                object_types = set(map(type, objects))
+                if len(object_types) != 1:
+                    return None
+                object_type = object_types.pop()
+                if not issubclass(object_type, BaseObject):
+                    return None
+                if not issubclass(object_type, SlottedObject):
+                    # objects with dynamic members must all have the same ones
+                    member_names = set(objects[0].__values__())
+                    if any(set(o.__values__()) != member_names for o in objects):
+                        return None
+            columns = {column_name: list(map(operator.attrgetter(column_name), python_value)) for column_name in column_names}
+        except AttributeError:
+            return None
+        for column in columns.values():
+            if any(issubclass(value_type, BaseObject) for value_type in set(map(type, column))):
+                return None
+        return columns
 
+    @staticmethod
+    def __projected__(path: typing.List[str], projection: dict) -> bool:
+        node = projection
+        for member_name in path:
+            if member_name not in node:
+                return False
+            node = node[member_name]
+            if node is None:
+                return True
+        return True
+
+    @staticmethod
+    def __to_python_column__(list_type: type, path: typing.List[str], column: list) -> list:
+        # the values are bound as the members they replace, the same way a dict element is bound
+        plan = ClassPlan.get(list_type)
+        for member_name in path[:-1]:
+            member_type = plan.members.get(member_name, (Object, None))[0]
+            if not issubclass(member_type, BaseObject):
+                return column
+            plan = ClassPlan.get(member_type)
+        member_plan = plan.members.get(path[-1])
+        if member_plan is None:
+            return column
+        member_type, binding = member_plan
+        if binding is None:
+            binding = Bindings.get_binding(member_type)
+        if binding.__class__ is BaseBinding and member_type is binding.python_type:
+            return column
+        to_python_value = binding.to_python_value
+        return [None if json_value is None else to_python_value(json_value=json_value, python_type=member_type)
+                for json_value in column]
 
+
+Bindings.set_binding(ListBinding())
+# numeric lists are packed in binary documents
+BinaryEncoder.__packed_bindings__.add(ListBinding)
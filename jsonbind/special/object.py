@@ -1,26 +1,41 @@
+import copy
 import typing
 from jsonbind.core.type_binding import TypeBinding, JsonTypes, Bindings
+from jsonbind.core.plan import ClassPlan
 from jsonbind.special.serializable import Serializable
 
 Number = typing.Union[bool, int, float]
 
 
-class Object(Serializable):
-    def __init__(self, **kwargs):
-        self.__dict__.update(kwargs)
-        self._output_names: typing.Dict[str, str] = dict()
+class BaseObject(Serializable):
+    # interface shared by Object and SlottedObject, members are read through __values__
+    __slots__ = ()
+
+    def __values__(self) -> typing.Dict[str, typing.Any]:
+        raise NotImplementedError("__values__() not implemented")
 
-    def __eq__(self, other: "Object") -> bool:
-        for key, value in self.__dict__.items():
-            if key not in other.__dict__:
+    def __json_values__(self, wrap: typing.Callable = None) -> typing.Dict[str, typing.Any]:
+        # members to encode, the json values of unread members are passed through (through wrap if given)
+        return self.__values__()
+
+    def __member__(self, key: str) -> typing.Any:
+        values = self.__values__()
+        if key not in values:
+            raise KeyError("key '{}' not found".format(key))
+        return values[key]
+
+    def __eq__(self, other: "BaseObject") -> bool:
+        other_values = other.__values__()
+        for key, value in self.__values__().items():
+            if key not in other_values:
                 return False
-            if other.__dict__[key] != value:
+            if other_values[key] != value:
                 return False
         return True
 
     def get_members(self) -> typing.List[typing.Tuple[str, typing.Any]]:
         members: typing.List[typing.Tuple[str, typing.Any]] = list()
-        for key, value in self.__dict__.items():
+        for key, value in self.__values__().items():
             if not key or key.startswith('_'):
                 continue
             members.append((key, value))
@@ -28,10 +43,10 @@ class Object(Serializable):
 
     def get_columns(self) -> typing.List[typing.Tuple[str, type]]:
         columns: typing.List[typing.Tuple[str, type]] = list()
-        for key, value in self.__dict__.items():
+        for key, value in self.__values__().items():
             if not key or key.startswith('_'):
                 continue
-            if isinstance(value, Object):
+            if isinstance(value, BaseObject):
                 columns += [(key + "." + column_name, column_type) for column_name, column_type in value.get_columns()]
             else:
                 columns.append((key, value.__class__))
@@ -39,10 +54,10 @@ class Object(Serializable):
 
     def get_numeric_columns(self) -> typing.List[typing.Tuple[str, type]]:
         columns: typing.List[typing.Tuple[str, type]] = list()
-        for key, value in self.__dict__.items():
+        for key, value in self.__values__().items():
             if not key or key.startswith('_'):
                 continue
-            if isinstance(value, Object):
+            if isinstance(value, BaseObject):
                 columns += [(key + "." + column_name, column_type) for column_name, column_type in value.get_numeric_columns()]
             else:
                 if isinstance(value, Number):
@@ -51,10 +66,10 @@ class Object(Serializable):
 
     def get_values(self) -> typing.List[typing.Tuple[str, typing.Any]]:
         values = list()
-        for key, value in self.__dict__.items():
+        for key, value in self.__values__().items():
             if not key or key.startswith('_'):
                 continue
-            if isinstance(value, Object):
+            if isinstance(value, BaseObject):
                 values += [(key + "." + column_name, column_value) for column_name, column_value in value.get_values()]
             else:
                 values.append((key, value))
@@ -62,10 +77,10 @@ class Object(Serializable):
 
     def get_numeric_values(self) -> typing.List[typing.Tuple[str, Number]]:
         values: typing.List[typing.Tuple[str, Number]] = list()
-        for key, value in self.__dict__.items():
+        for key, value in self.__values__().items():
             if not key or key.startswith('_'):
                 continue
-            if isinstance(value, Object):
+            if isinstance(value, BaseObject):
                 values += [(key + "." + column_name, column_value) for column_name, column_value in value.get_numeric_values()]
             else:
                 if isinstance(value, Number):
@@ -76,8 +91,8 @@ class Object(Serializable):
         for column_name, column_value in values:
             Object.__setitem__(self, column_name, column_value)
 
-    def convert_to(self, cls: type) -> "Object":
-        if not issubclass(cls, Object):
+    def convert_to(self, cls: type) -> "BaseObject":
+        if not issubclass(cls, BaseObject):
             raise RuntimeError("type must derive from jsonbind.Object")
         values = self.get_values()
         nv = cls()
@@ -89,86 +104,273 @@ class Object(Serializable):
         if pos >= 0:
             child_key = key[pos+1:]
             key = key[:pos]
-            if key not in self.__dict__:
-                raise KeyError("key '{}' not found".format(key))
-            child = self.__dict__[key]
-            if isinstance(child, Object):
-                return Object.__getitem__(self=child,
-                                          key=child_key)
+            child = self.__member__(key)
+            if isinstance(child, BaseObject):
+                return BaseObject.__getitem__(self=child,
+                                              key=child_key)
             else:
                 raise KeyError("key '{}' not found".format(child_key))
         else:
-            if key not in self.__dict__:
-                raise KeyError("key '{}' not found".format(key))
-            return self.__dict__[key]
+            return self.__member__(key)
 
     def __setitem__(self, key, value):
+        values = self.__values__()
         pos = key.find(".")
         if pos >= 0:
             child_key = key[pos+1:]
             key = key[:pos]
-            if key not in self.__dict__:
-                self.__dict__[key] = Object()
-
-            child = self.__dict__[key]
-            if isinstance(child, Object):
-                return Object.__setitem__(self=child,
-                                          key=child_key,
-                                          value=value)
+            if key not in values:
+                setattr(self, key, Object())
+
+            child = getattr(self, key)
+            if isinstance(child, BaseObject):
+                return BaseObject.__setitem__(self=child,
+                                              key=child_key,
+                                              value=value)
             else:
                 raise KeyError("key '{}' not found".format(child_key))
         else:
-            if hasattr(self, key):
-                if not isinstance(value,self.__dict__[key].__class__):
-                    value = self.__dict__[key].__class__(value)
+            if key in values:
+                if not isinstance(value, values[key].__class__):
+                    value = values[key].__class__(value)
             else:
                 Bindings.get_binding(value.__class__)
             setattr(self, key, value)
 
-    def __copy__(self) -> "Object":
+    def __copy__(self) -> "BaseObject":
         new_object = self.__class__()
-        new_object.__dict__.update(self.__dict__)
+        for key, value in self.__values__().items():
+            setattr(new_object, key, value)
         return new_object
 
-    def __deepcopy__(self, memo: dict = None) -> "List":
+    def __deepcopy__(self, memo: dict = None) -> "BaseObject":
         from copy import deepcopy
         new_object = self.__class__()
         memo[id(self)] = new_object
-        for key, value in self.__dict__.items():
-            new_object.__dict__[key] = deepcopy(value, memo=memo)
+        for key, value in self.__values__().items():
+            setattr(new_object, key, deepcopy(value, memo=memo))
         return new_object
 
 
+class Object(BaseObject):
+    # decoded instances of classes with __lazy__ set keep the json members they receive and bind each one the
+    # first time it is read. Unread members are encoded back as they came. The pending json members and the member
+    # order of an eager decode are kept in the __pending__ slot, so __dict__ only ever holds members
+    __slots__ = ("__dict__", "__weakref__", "__pending__")
+    __lazy__: bool = False
+
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+    def __getattr__(self, name: str) -> typing.Any:
+        # only called for missing attributes, pending members of lazy objects (and the unset slot) included
+        if name != "__pending__":
+            lazy_state = self.__lazy_state__()
+            if lazy_state is not None and name in lazy_state[0]:
+                return self.__bind_member__(name)
+        raise AttributeError("'{}' object has no attribute '{}'".format(self.__class__.__name__, name))
+
+    def __lazy_state__(self) -> typing.Union[None, typing.Tuple[dict, tuple]]:
+        # (pending json members, member order) of lazily decoded objects with unread members, None otherwise
+        if not self.__lazy__:
+            return None
+        try:
+            return self.__pending__
+        except AttributeError:
+            return None
+
+    def __bind_member__(self, name: str) -> typing.Any:
+        pending = self.__pending__[0]
+        value = ClassPlan.get(self.__class__).to_python_member(name, pending.pop(name))
+        self.__dict__[name] = value
+        if not pending:
+            self.__restore_order__()
+        return value
+
+    def __restore_order__(self) -> None:
+        # once nothing is pending the members are put back in the order an eager decode gives them
+        values = self.__dict__
+        order = self.__pending__[1]
+        self.__pending__ = None
+        ordered = {name: values[name] for name in order if name in values}
+        ordered.update(values)
+        values.clear()
+        values.update(ordered)
+
+    def __values__(self) -> typing.Dict[str, typing.Any]:
+        values = self.__dict__
+        if not self.__lazy__:
+            return values
+        lazy_state = self.__lazy_state__()
+        if lazy_state is not None:
+            # members assigned after decoding replace the pending ones
+            for name in [name for name in lazy_state[0] if name not in values]:
+                self.__bind_member__(name)
+            if self.__pending__ is not None:
+                self.__restore_order__()
+        return values
+
+    def __json_values__(self, wrap: typing.Callable = None) -> typing.Dict[str, typing.Any]:
+        values = self.__dict__
+        if not self.__lazy__:
+            return values
+        lazy_state = self.__lazy_state__()
+        if lazy_state is None:
+            return values
+        pending, order = lazy_state
+        json_values = dict()
+        for name in order:
+            if name in values:
+                json_values[name] = values[name]
+            elif name in pending:
+                json_values[name] = pending[name] if wrap is None else wrap(pending[name])
+        # members added after decoding go last
+        for name, value in values.items():
+            if name not in json_values:
+                json_values[name] = value
+        return json_values
+
+    def __member__(self, key: str) -> typing.Any:
+        values = self.__dict__
+        if key in values:
+            return values[key]
+        lazy_state = self.__lazy_state__()
+        if lazy_state is not None and key in lazy_state[0]:
+            return self.__bind_member__(key)
+        raise KeyError("key '{}' not found".format(key))
+
+    def __getstate__(self) -> dict:
+        # pending members are bound first, the state is only the members
+        return self.__values__()
+
+
+class SlottedObjectType(type):
+    # builds __slots__ and the member schema from the annotations (and defaults) of the class body
+
+    def __new__(mcs, name: str, bases: tuple, namespace: dict):
+        schema = dict()
+        for base in reversed(bases):
+            schema.update(getattr(base, "__schema__", dict()))
+        own_members = list()
+        for member_name, member_type in namespace.get("__annotations__", dict()).items():
+            if member_name.startswith("__") or typing.get_origin(member_type) is typing.ClassVar:
+                continue
+            if member_name in namespace:
+                default = namespace.pop(member_name)
+            elif member_name in schema:
+                default = schema[member_name][1]
+            else:
+                default = ClassPlan.__no_default__
+            if not isinstance(member_type, type):
+                # generic aliases are built with their origin (list[int] -> list), anything else defaults to None
+                member_type = typing.get_origin(member_type)
+                member_type = member_type if isinstance(member_type, type) else None
+            if member_name not in schema:
+                own_members.append(member_name)
+            schema[member_name] = (member_type, default)
+        namespace["__slots__"] = tuple(own_members)
+        namespace["__schema__"] = schema
+        namespace["__initializers__"] = tuple(ClassPlan.__initializer__(member_name, member_type, default)
+                                              for member_name, (member_type, default) in schema.items())
+        return super().__new__(mcs, name, bases, namespace)
+
+
+class SlottedObject(BaseObject, metaclass=SlottedObjectType):
+    # Object with a fixed set of members declared as annotations: no __dict__ and no dynamic attributes.
+    #
+    #   class Point(SlottedObject):
+    #       x: float = 0.0
+    #       y: float = 0.0
+    #
+    # mutable defaults are copied for each instance, members without a default are built with their type
+    __slots__ = ()
+
+    def __init__(self, **kwargs):
+        for member_name, initializer, default in self.__class__.__initializers__:
+            if kwargs and member_name in kwargs:
+                value = kwargs.pop(member_name)
+            elif initializer == 0:
+                value = default
+            elif initializer == 1:
+                value = copy.deepcopy(default)
+            else:
+                value = default() if default is not None else None
+            setattr(self, member_name, value)
+        if kwargs:
+            raise AttributeError("{} has no members {}".format(self.__class__.__name__, ", ".join(kwargs)))
+
+    @staticmethod
+    def create_type(type_name: str, **members) -> type:
+        # schema declaration from default values: SlottedObject.create_type("Point", x=0.0, y=0.0)
+        namespace = dict(members)
+        namespace["__annotations__"] = {member_name: value.__class__ for member_name, value in members.items()}
+        return SlottedObjectType(type_name, (SlottedObject,), namespace)
+
+    def __values__(self) -> typing.Dict[str, typing.Any]:
+        return {member_name: getattr(self, member_name) for member_name in self.__class__.__schema__}
+
+    def __getstate__(self) -> dict:
+        return self.__values__()
+
+    def __setstate__(self, state: dict):
+        for member_name, value in state.items():
+            setattr(self, member_name, value)
+
+
+class PendingMember(object):
+    # json value of an unread member, encoded as it is instead of going through the bindings item by item
+    __slots__ = ("json_value",)
+
+    def __init__(self, json_value: typing.Any):
+        self.json_value = json_value
+
+
+class PendingMemberBinding(TypeBinding):
+    def __init__(self):
+        super().__init__(json_type=dict, python_type=PendingMember)
+
+    def to_json_value(self, python_value: PendingMember) -> typing.Union[JsonTypes]:
+        return python_value.json_value
+
+
 class ObjectBinding(TypeBinding):
     def __init__(self):
-        super().__init__(json_type=dict, python_type=Object)
+        super().__init__(json_type=dict, python_type=BaseObject)
 
     def to_json_value(self, python_value: typing.Any) -> typing.Union[JsonTypes]:
-        json_value = dict()
-        for member_name in vars(python_value):
-            if member_name.startswith('_'):
-                continue
-            member = getattr(python_value, member_name)
-            member_type = member.__class__
-            bond = Bindings.get_binding(member_type)
-            if not bond:
-                raise TypeError("no binding found for member {} of type {}".format(member_name, member_type.__name__))
-            json_value[member_name] = bond.to_json_value(getattr(python_value, member_name))
-        return json_value
+        return ClassPlan.get(python_value.__class__).to_json_dict(python_value.__json_values__(wrap=PendingMember))
+
+    def to_json_items(self, python_value: typing.Any) -> typing.Union[None, typing.Iterable]:
+        return ClassPlan.get(python_value.__class__).to_json_items(python_value.__json_values__(wrap=PendingMember))
 
     def to_python_value(self, json_value: typing.Union[JsonTypes], python_type: type) -> typing.Any:
-        python_value = python_type()
-        for member_name, member_json_value in json_value.items():
-            if member_name in python_value.__dict__:
-                member = getattr(python_value, member_name)
-                member_type = member.__class__
-                member_python_value = Bindings.to_python_value(json_value=member_json_value,
-                                                               python_type=member_type)
+        return self.to_python_projection(json_value=json_value, python_type=python_type, projection=None)
+
+    def to_python_projection(self, json_value: typing.Union[JsonTypes], python_type: type, projection: dict) -> typing.Any:
+        plan = ClassPlan.get(python_type)
+        if projection is None and getattr(python_type, "__lazy__", False):
+            python_value = plan.new_instance(json_value)
+            values = python_value.__dict__
+            if json_value:
+                # members are bound on first read, the defaults they replace are dropped. The order of an eager
+                # decode is kept too, so the encoded keys do not depend on which members were read
+                order = tuple(values) + tuple(member_name for member_name in json_value if member_name not in values)
+                for member_name in json_value:
+                    values.pop(member_name, None)
+                python_value.__pending__ = (dict(json_value), order)
+            return python_value
+        values = plan.to_python_dict(json_value, projection)
+        python_value = plan.new_instance(values, projected=projection is not None)
+        # slotted objects only take their declared members
+        schema = getattr(python_type, "__schema__", None)
+        for member_name, member_python_value in values.items():
+            if schema is None or member_name in schema:
                 setattr(python_value, member_name, member_python_value)
-            else:
-                setattr(python_value, member_name, member_json_value)
         return python_value
 
 
+# decoded objects are built without running these constructors (see ClassPlan.new_instance)
+ClassPlan.__plain_initializers__.update((Object.__init__, SlottedObject.__init__))
 Bindings.set_binding(ObjectBinding())
+Bindings.set_binding(PendingMemberBinding())
 
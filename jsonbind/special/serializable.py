@@ -1,7 +1,12 @@
+import typing
 from ..core.serialization import Serialization
+from ..core.async_serialization import AsyncSerialization
+from ..core.http import HttpClient
 
 
 class Serializable(object):
+    __slots__ = ()
+
     def __str__(self) -> str:
         """
         Returns a string representation of the JsonObject in JSON format.
@@ -12,8 +17,12 @@ class Serializable(object):
         return Serialization.serialize(self)
 
     @classmethod
-    def parse(cls, json_string: str) -> "Serializable":
-        return Serialization.deserialize(json_string=json_string, python_type=cls)
+    def parse(cls, json_string: str, projection: typing.Iterable[str] = None) -> "Serializable":
+        return Serialization.deserialize(json_string=json_string, python_type=cls, projection=projection)
+
+    @classmethod
+    def parse_lines(cls, fp, workers: int = 0) -> typing.Iterator["Serializable"]:
+        return Serialization.deserialize_lines(fp=fp, python_type=cls, workers=workers)
 
     @classmethod
     def parse_from_file(cls, file_path: str) -> "Serializable":
@@ -33,6 +42,19 @@ class Serializable(object):
         json_string = response.text
         return cls.parse(json_string=json_string)
 
+    @classmethod
+    async def aparse_from_url(cls, url: str, client: typing.Callable = None, executor=None) -> "Serializable":
+        """
+        Downloads and parses a json document without blocking the event loop.
+
+        Args:
+            url (str): address of the json document.
+            client (Callable): called with the url, returns an async iterable of body chunks. Defaults to HttpClient.get.
+            executor: executor used to bind the parsed values, the loop's default executor if None.
+        """
+        client = client or HttpClient.get
+        return await AsyncSerialization.deserialize_from(stream=client(url), python_type=cls, executor=executor)
+
 
 
 # import typing
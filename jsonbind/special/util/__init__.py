@@ -1 +1,2 @@
-from .search import bin_search, NotFoundBehavior, SearchType, SortOrder
+from .search import bin_search, bin_search_many, bin_search_range, bin_search_ranges, NotFoundBehavior, SearchType, SortOrder
+from .index import IndexType, ListIndex, HashIndex, SortedIndex
@@ -0,0 +1,117 @@
+import bisect
+import operator
+import typing
+from enum import Enum
+
+
+class IndexType(Enum):
+    Hash = 0
+    Sorted = 1
+
+
+class ListIndex(object):
+    # positions of the list values by key (an attribute name, dotted for nested members, or a function).
+    # indexes follow the list operations, changes made to the values themselves need a rebuild
+
+    def __init__(self, key: typing.Union[str, typing.Callable]):
+        self.key = key
+        self.get_key: typing.Callable = operator.attrgetter(key) if isinstance(key, str) else key
+        self.valid: bool = False
+
+    def build(self, values: list) -> None:
+        raise NotImplementedError("build() not implemented")
+
+    def add(self, position: int, value: typing.Any) -> None:
+        raise NotImplementedError("add() not implemented")
+
+    def remove(self, position: int, value: typing.Any) -> None:
+        raise NotImplementedError("remove() not implemented")
+
+    def shift(self, position: int, count: int = 1) -> None:
+        # moves the positions from position on by count: makes room for inserted values (count > 0) or closes the
+        # gap left by removed ones (count < 0, once their entries are removed)
+        raise NotImplementedError("shift() not implemented")
+
+    def find(self, key_value: typing.Any) -> typing.List[int]:
+        raise NotImplementedError("find() not implemented")
+
+
+class HashIndex(ListIndex):
+
+    def __init__(self, key: typing.Union[str, typing.Callable]):
+        super().__init__(key=key)
+        self.positions: typing.Dict[typing.Any, typing.List[int]] = dict()
+
+    def build(self, values: list) -> None:
+        positions = dict()
+        for position, key_value in enumerate(map(self.get_key, values)):
+            if key_value in positions:
+                positions[key_value].append(position)
+            else:
+                positions[key_value] = [position]
+        self.positions = positions
+        self.valid = True
+
+    def add(self, position: int, value: typing.Any) -> None:
+        key_value = self.get_key(value)
+        if key_value in self.positions:
+            bisect.insort(self.positions[key_value], position)
+        else:
+            self.positions[key_value] = [position]
+
+    def remove(self, position: int, value: typing.Any) -> None:
+        key_value = self.get_key(value)
+        key_positions = self.positions[key_value]
+        key_positions.remove(position)
+        if not key_positions:
+            del self.positions[key_value]
+
+    def shift(self, position: int, count: int = 1) -> None:
+        for key_positions in self.positions.values():
+            if key_positions[-1] >= position:
+                key_positions[:] = [p + count if p >= position else p for p in key_positions]
+
+    def find(self, key_value: typing.Any) -> typing.List[int]:
+        return self.positions.get(key_value, [])
+
+
+class SortedIndex(ListIndex):
+
+    def __init__(self, key: typing.Union[str, typing.Callable]):
+        super().__init__(key=key)
+        self.keys: list = list()
+        self.positions: typing.List[int] = list()
+
+    def build(self, values: list) -> None:
+        key_values = list(map(self.get_key, values))
+        self.positions = sorted(range(len(key_values)), key=key_values.__getitem__)
+        self.keys = [key_values[position] for position in self.positions]
+        self.valid = True
+
+    def add(self, position: int, value: typing.Any) -> None:
+        key_value = self.get_key(value)
+        i = bisect.bisect_right(self.keys, key_value)
+        self.keys.insert(i, key_value)
+        self.positions.insert(i, position)
+
+    def remove(self, position: int, value: typing.Any) -> None:
+        key_value = self.get_key(value)
+        i = bisect.bisect_left(self.keys, key_value)
+        while self.positions[i] != position:
+            i += 1
+        del self.keys[i]
+        del self.positions[i]
+
+    def shift(self, position: int, count: int = 1) -> None:
+        self.positions = [p + count if p >= position else p for p in self.positions]
+
+    def find(self, key_value: typing.Any) -> typing.List[int]:
+        lo = bisect.bisect_left(self.keys, key_value)
+        hi = bisect.bisect_right(self.keys, key_value, lo)
+        return sorted(self.positions[lo:hi])
+
+    def nearest(self, key_value: typing.Any) -> typing.Union[None, int]:
+        if not self.keys:
+            return None
+        i = min(bisect.bisect_left(self.keys, key_value), len(self.keys) - 1)
+        return self.positions[i]
@@ -1,3 +1,8 @@
+import array
+import bisect
+import importlib.util
+import math
+import typing
 from enum import Enum
 
 
@@ -9,6 +14,10 @@ class SortOrder(Enum):
 class SearchType(Enum):
     Aprox = 0
     Exact = 1
+    # first position whose value does not go before the searched one, len(l) if there is none
+    LowerBound = 2
+    # first position whose value goes after the searched one, len(l) if there is none
+    UpperBound = 3
 
 
 class NotFoundBehavior(Enum):
@@ -16,62 +25,171 @@ class NotFoundBehavior(Enum):
     ReturnNone = 1
 
 
+def __get_item__(l) -> typing.Callable:
+    # lists are read through the base class getter, so subclasses overriding __getitem__ are not involved
+    return list.__getitem__ if isinstance(l, list) else l.__class__.__getitem__
+
+
+def __not_found__(not_found_behavior: NotFoundBehavior) -> None:
+    if not_found_behavior == NotFoundBehavior.RaiseError:
+        raise RuntimeError("Value not found")
+    return None
+
+
 def bin_search(l,
                v,
                order: SortOrder = SortOrder.Ascending,
                search_type: SearchType = SearchType.Aprox,
                key=None,
                not_found_behavior: NotFoundBehavior = NotFoundBehavior.RaiseError):
+    if search_type in (SearchType.LowerBound, SearchType.UpperBound):
+        return bin_search_many(l, [v], order=order, search_type=search_type, key=key)[0]
+    get_item = __get_item__(l)
+    descending = order == SortOrder.Descending
     lo = 0
     hi = len(l) - 1
-    mi = int((hi + lo) / 2)
-    if order == SortOrder.Ascending:
-        if key is None:
-            while hi != lo and list.__getitem__(l, mi) != v:
-                if v > list.__getitem__(l, mi):
-                    lo = mi + 1
-                else:
-                    hi = mi
-                mi = (hi + lo) // 2
-            if list.__getitem__(l, mi) == v:
-                return mi
-        else:
-            cv = key(list.__getitem__(l, mi))
-            while hi != lo and cv != v:
-                if v > cv:
-                    lo = mi + 1
-                else:
-                    hi = mi
-                mi = (hi + lo) // 2
-                cv = key(list.__getitem__(l, mi))
-            if cv == v:
-                return mi
-    else:
-        if key is None:
-            while hi != lo and list.__getitem__(l, mi) != v:
-                if v < list.__getitem__(l, mi):
-                    lo = mi + 1
-                else:
-                    hi = mi
-                mi = (hi + lo) // 2
-            if list.__getitem__(l, mi) == v:
-                return mi
+    mi = (hi + lo) // 2
+    cv = get_item(l, mi) if key is None else key(get_item(l, mi))
+    while hi != lo and cv != v:
+        if (v < cv) if descending else (v > cv):
+            lo = mi + 1
         else:
-            cv = key(list.__getitem__(l, mi))
-            while hi != lo and cv != v:
-                if v < cv:
-                    lo = mi + 1
-                else:
-                    hi = mi
-                mi = (hi + lo) // 2
-                cv = key(list.__getitem__(l, mi))
-            if cv == v:
-                return mi
-
-    if search_type == SearchType.Aprox:
+            hi = mi
+        mi = (hi + lo) // 2
+        cv = get_item(l, mi) if key is None else key(get_item(l, mi))
+    if cv == v or search_type == SearchType.Aprox:
         return mi
-    else:
-        if not_found_behavior == NotFoundBehavior.RaiseError:
-            raise RuntimeError("Value not found")
+    return __not_found__(not_found_behavior)
+
+
+def bin_search_many(l,
+                    values: typing.Iterable,
+                    order: SortOrder = SortOrder.Ascending,
+                    search_type: SearchType = SearchType.LowerBound,
+                    key=None,
+                    not_found_behavior: NotFoundBehavior = NotFoundBehavior.RaiseError) -> typing.List[typing.Union[None, int]]:
+    # resolves every value in one call, computing the key of each probed element only once.
+    # Exact and Aprox return the first matching position
+    values = values if isinstance(values, list) else list(values)
+    size = len(l)
+    if not values:
+        return []
+    descending = order == SortOrder.Descending
+    keys = __SortedKeys__(l, key, descending, len(values))
+    positions = keys.bound(values, upper=search_type == SearchType.UpperBound)
+    if search_type in (SearchType.LowerBound, SearchType.UpperBound):
+        return positions
+    results = list()
+    for value, position in zip(values, positions):
+        if position < size and keys.key_at(position) == value:
+            results.append(position)
+        elif search_type == SearchType.Aprox and size:
+            results.append(min(position, size - 1))
         else:
+            results.append(__not_found__(not_found_behavior))
+    return results
+
+
+def bin_search_ranges(l,
+                      ranges: typing.Iterable[typing.Tuple[typing.Any, typing.Any]],
+                      order: SortOrder = SortOrder.Ascending,
+                      key=None) -> typing.List[typing.Tuple[int, int]]:
+    # (start, stop) for each (start_value, end_value) pair, l[start:stop] holds the values between both, included.
+    # start_value is the one that goes first in the list order
+    ranges = ranges if isinstance(ranges, list) else list(ranges)
+    if not ranges:
+        return []
+    keys = __SortedKeys__(l, key, order == SortOrder.Descending, len(ranges) * 2)
+    starts = keys.bound([start_value for start_value, _ in ranges], upper=False)
+    stops = keys.bound([end_value for _, end_value in ranges], upper=True)
+    return [(start, max(start, stop)) for start, stop in zip(starts, stops)]
+
+
+def bin_search_range(l,
+                     start_value,
+                     end_value,
+                     order: SortOrder = SortOrder.Ascending,
+                     key=None) -> typing.Tuple[int, int]:
+    return bin_search_ranges(l, [(start_value, end_value)], order=order, key=key)[0]
+
+
+class __SortedKeys__(object):
+    # keys of a sorted list as an ascending sequence. The keys of the whole list are computed once when the batch
+    # probes most of it, otherwise only the probed ones are, and cached. Numeric keys are searched with numpy
+    # when it is installed: array backed lists in place, other lists when their keys are computed anyway
+
+    def __init__(self, l, key: typing.Union[None, typing.Callable], descending: bool, batch_size: int):
+        self.l = l
+        self.key = key
+        self.get_item = __get_item__(l)
+        self.size = len(l)
+        self.descending = descending
+        self.cache: typing.Dict[int, typing.Any] = dict()
+        self.keys: typing.Any = None
+        self.array: typing.Any = None
+        full_scan = batch_size * math.log2(self.size + 1) >= self.size
+        if key is None:
+            self.array = __numeric_array__(l, full_scan)
+            if self.array is not None and descending:
+                self.array = self.array[::-1]
+        if self.array is None and full_scan:
+            self.keys = list(l) if key is None else list(map(key, l))
+            if descending:
+                self.keys.reverse()
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, index: int) -> typing.Any:
+        # index in ascending order
+        if self.keys is not None:
+            return self.keys[index]
+        if self.array is not None:
+            return self.array[index]
+        if index not in self.cache:
+            value = self.get_item(self.l, self.size - 1 - index if self.descending else index)
+            self.cache[index] = value if self.key is None else self.key(value)
+        return self.cache[index]
+
+    def key_at(self, position: int) -> typing.Any:
+        # position in list order
+        return self[self.size - 1 - position if self.descending else position]
+
+    def bound(self, values: list, upper: bool) -> typing.List[int]:
+        # lower or upper bound positions in list order
+        if self.descending:
+            # in the reversed (ascending) keys the bounds swap sides
+            upper = not upper
+        positions = None
+        if self.array is not None:
+            positions = __searchsorted__(self.array, values, "right" if upper else "left")
+        if positions is None:
+            search = bisect.bisect_right if upper else bisect.bisect_left
+            positions = [search(self, value) for value in values]
+        if self.descending:
+            positions = [self.size - position for position in positions]
+        return positions
+
+
+def __numeric_array__(l, full_scan: bool) -> typing.Any:
+    # array backed lists are viewed in place, numeric lists are converted only when their keys are computed anyway
+    if isinstance(l, array.array):
+        if l.typecode == "u":
             return None
+    elif not full_scan or getattr(l, "list_type", None) not in (int, float):
+        return None
+    if importlib.util.find_spec("numpy") is None:
+        return None
+    import numpy as np
+    keys = np.frombuffer(l, dtype=l.typecode) if isinstance(l, array.array) else np.asarray(l)
+    if keys.dtype.kind not in "iuf":
+        return None
+    return keys
+
+
+def __searchsorted__(keys, values: list, side: str) -> typing.Union[None, typing.List[int]]:
+    import numpy as np
+    probes = np.asarray(values)
+    if probes.dtype.kind not in "iuf":
+        return None
+    return np.searchsorted(keys, probes, side=side).tolist()
@@ -0,0 +1,119 @@
+import copy
+import io
+import pickle
+import sys
+import unittest
+sys.path.append('..')
+import jsonbind
+from jsonbind.core import Serialization
+from jsonbind.special import ArrayList, List, SortOrder, NotFoundBehavior, SearchType
+
+
+FloatArrayList = ArrayList.create_type(float)
+IntArrayList = ArrayList.create_type(int)
+
+
+class Samples(FloatArrayList):
+    pass
+
+
+class ArrayListTests(unittest.TestCase):
+
+    def test_serialization(self):
+        l = FloatArrayList([1, 2.5, 3])
+        self.assertEqual(Serialization.serialize(l), "[1.0,2.5,3.0]")
+        self.assertEqual(str(IntArrayList(range(3))), "[0,1,2]")
+        self.assertEqual(Serialization.deserialize("[1,2.5,3]", FloatArrayList), l)
+        self.assertIs(Serialization.deserialize("[1,2]", IntArrayList).__class__, IntArrayList)
+        self.assertRaises(TypeError, Serialization.deserialize, "[1,2.5]", IntArrayList)
+        self.assertRaises(TypeError, Serialization.deserialize, "[1,null]", FloatArrayList)
+        self.assertEqual(FloatArrayList.parse("[0.5]"), [0.5])
+        stream = io.BytesIO()
+        jsonbind.dump(List(iterable=[l, IntArrayList([4])]), stream)
+        self.assertEqual(stream.getvalue(), b"[[1.0,2.5,3.0],[4]]")
+        self.assertEqual(list(jsonbind.iterload(io.StringIO("[1, 2]"), FloatArrayList)), [1.0, 2.0])
+
+    def test_list_interface(self):
+        l = IntArrayList(range(100))
+        self.assertEqual(l.filter(lambda v: v % 2), list(range(1, 100, 2)))
+        self.assertIs(l.filter(lambda v: v % 2).__class__, IntArrayList)
+        self.assertEqual(l.map(lambda v: v * 0.5), [v * 0.5 for v in range(100)])
+        split = l.split_by(lambda v: v % 3)
+        self.assertEqual(split[2], list(range(2, 100, 3)))
+        self.assertEqual(l.find_first(lambda v: v > 10), 11)
+        self.assertEqual(l.find_first_index(20), 20)
+        self.assertIsNone(l.find_first(-1, not_found_behavior=NotFoundBehavior.ReturnNone))
+        self.assertEqual(l.find_ordered_index(42), 42)
+        self.assertEqual(IntArrayList(range(100, 0, -1)).find_ordered(42, order=SortOrder.Descending), 42)
+        self.assertRaises(RuntimeError, l.find_ordered, 1000)
+        self.assertEqual(l.find_ordered_indexes([5, 42, 1000], search_type=SearchType.UpperBound), [6, 43, 100])
+        self.assertEqual(l.find_ordered_many([5, 1000], not_found_behavior=NotFoundBehavior.ReturnNone), [5, None])
+        self.assertEqual(l.find_ordered_range(10, 12), [10, 11, 12])
+        self.assertIs(l.find_ordered_range(10, 12).__class__, IntArrayList)
+        self.assertEqual(IntArrayList(range(100, 0, -1)).find_ordered_ranges([(42, 40), (0, 0)], order=SortOrder.Descending), [[42, 41, 40], []])
+        self.assertEqual(l[10:12], [10, 11])
+        self.assertIs(l[10:12].__class__, IntArrayList)
+        l += [100, 101]
+        l.append(102)
+        self.assertEqual(len(l), 103)
+        self.assertRaises(TypeError, l.append, 1.5)
+        f = ArrayList(list_type=float, iterable=l)
+        self.assertEqual(f[-1], 102.0)
+        self.assertIs(f[-1].__class__, float)
+
+    def test_copy_and_pickle(self):
+        l = FloatArrayList([1.0, 2.0])
+        for copied in [copy.copy(l), copy.deepcopy(l), l.copy(), pickle.loads(pickle.dumps(l))]:
+            self.assertEqual(copied, l)
+            self.assertIs(copied.__class__, FloatArrayList)
+            self.assertIsNot(copied, l)
+        self.assertEqual(pickle.loads(pickle.dumps(ArrayList(list_type=int, iterable=[1]))), [1])
+        samples = pickle.loads(pickle.dumps(Samples([0.5])))
+        self.assertIs(samples.__class__, Samples)
+        self.assertEqual(samples, [0.5])
+
+    def test_overflow(self):
+        l = IntArrayList([1])
+        self.assertRaises(TypeError, l.append, 2 ** 70)
+        self.assertRaises(TypeError, l.insert, 0, 2 ** 70)
+        self.assertRaises(TypeError, l.__setitem__, 0, 2 ** 70)
+        self.assertRaises(TypeError, l.extend, [2, 2 ** 70])
+        self.assertEqual(l, [1])
+        self.assertRaises(TypeError, Serialization.deserialize, "[1,%d]" % 2 ** 70, IntArrayList)
+
+    def test_type_check(self):
+        l = IntArrayList([1, 2])
+        for value in [True, 1.5, 2.0]:
+            self.assertRaises(TypeError, l.append, value)
+            self.assertRaises(TypeError, l.insert, 0, value)
+            self.assertRaises(TypeError, l.__setitem__, 0, value)
+            self.assertRaises(TypeError, l.extend, [3, value])
+            self.assertRaises(TypeError, l.__setitem__, slice(0, 1), [value])
+        self.assertRaises(TypeError, l.extend, FloatArrayList([1.0]))
+        self.assertEqual(l, [1, 2])
+        l[0:1] = [5, 6]
+        self.assertEqual(l, [5, 6, 2])
+        f = FloatArrayList([1.5])
+        self.assertRaises(TypeError, f.append, False)
+        self.assertRaises(TypeError, f.extend, [True])
+        f.extend(IntArrayList([2]))
+        f.append(3)
+        self.assertEqual(f, [1.5, 2.0, 3.0])
+
+    def test_memory(self):
+        values = [float(v) for v in range(10000)]
+        boxed = sys.getsizeof(values) + sum(sys.getsizeof(v) for v in values)
+        self.assertLess(sys.getsizeof(FloatArrayList(values)) * 4, boxed)
+
+    def test_numpy(self):
+        from jsonbind.addons import numpy
+        l = FloatArrayList([1.0, 2.0, 3.0])
+        numpy_array = l.to_numpy_array()
+        self.assertEqual(float(numpy_array.sum()), 6.0)
+        numpy_array[0] = 10.0
+        self.assertEqual(l[0], 10.0)
+        self.assertEqual(IntArrayList.from_numpy_array(numpy_array), [10, 2, 3])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+import asyncio
+import io
+import json
+import unittest
+import urllib.parse
+import sys
+sys.path.append('..')
+import jsonbind
+from jsonbind.special import List, Object
+
+
+class Row(Object):
+    def __init__(self):
+        super(Row, self).__init__(a=0, b="", c=Object(x=0.0))
+
+
+RowList = List.create_type(Row)
+
+
+def create_rows(count: int) -> List:
+    rows = RowList()
+    for i in range(count):
+        row = Row()
+        row.a = i
+        row.b = "row %d ü" % i
+        row.c.x = i / 2
+        rows.append(row)
+    return rows
+
+
+class Writer(object):
+    def __init__(self):
+        self.data = io.BytesIO()
+        self.drained = 0
+
+    def write(self, data):
+        self.data.write(data)
+
+    async def drain(self):
+        self.drained += 1
+
+
+def feed_reader(data: bytes, chunk_size: int) -> asyncio.StreamReader:
+    reader = asyncio.StreamReader()
+    for start in range(0, len(data), chunk_size):
+        reader.feed_data(data[start:start + chunk_size])
+    reader.feed_eof()
+    return reader
+
+
+async def serve(body: bytes, chunked: bool, status: int = 200):
+    # /redirect/<n> answers with a redirect to /redirect/<n - 1>, and /redirect/0 to the rows
+    async def handle(reader, writer):
+        path = (await reader.readline()).split()[1]
+        while (await reader.readline()) not in (b"\r\n", b""):
+            pass
+        if path.startswith(b"/redirect/"):
+            hops = int(path[len(b"/redirect/"):])
+            location = b"/redirect/%d" % (hops - 1) if hops else b"../rows?page=1"
+            writer.write(b"HTTP/1.1 302 Found\r\nLocation: %s\r\nContent-Length: 0\r\n\r\n" % location)
+            await writer.drain()
+            writer.close()
+            return
+        writer.write(b"HTTP/1.1 %d OK\r\nContent-Type: application/json\r\n" % status)
+        if chunked:
+            writer.write(b"Transfer-Encoding: chunked\r\n\r\n")
+            for start in range(0, len(body), 1000):
+                chunk = body[start:start + 1000]
+                writer.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+            writer.write(b"0\r\n\r\n")
+        else:
+            writer.write(b"Content-Length: %d\r\n\r\n%s" % (len(body), body))
+        await writer.drain()
+        writer.close()
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    return server, "http://127.0.0.1:%d/rows?page=1" % server.sockets[0].getsockname()[1]
+
+
+class AsyncTests(unittest.TestCase):
+
+    def test_adump(self):
+        rows = create_rows(200)
+        writer = Writer()
+        written = asyncio.run(jsonbind.adump(rows, writer, buffer_size=512))
+        self.assertEqual(writer.data.getvalue(), jsonbind.dumps(rows).encode("utf8"))
+        self.assertEqual(written, len(writer.data.getvalue()))
+        self.assertGreater(writer.drained, 1)
+
+    def test_aload(self):
+        rows = create_rows(200)
+        data = jsonbind.dumps(rows).encode("utf8")
+
+        async def load():
+            loaded = await jsonbind.aload(feed_reader(data, 100), RowList, chunk_size=100)
+            untyped = await jsonbind.aload(feed_reader(data, 100), chunk_size=100)
+            document = await jsonbind.aload(feed_reader(b' {"a": [1, 2]}', 3))
+            items = [row async for row in jsonbind.aiterload(feed_reader(data, 100), RowList, chunk_size=100)]
+            return loaded, untyped, document, items
+
+        loaded, untyped, document, items = asyncio.run(load())
+        self.assertEqual(loaded, rows)
+        self.assertIs(loaded.__class__, RowList)
+        self.assertEqual(untyped, json.loads(data))
+        self.assertEqual(document, {"a": [1, 2]})
+        self.assertEqual(items, list(rows))
+        self.assertTrue(all(row.__class__ is Row for row in items))
+
+    def test_aparse_from_url(self):
+        rows = create_rows(300)
+        body = jsonbind.dumps(rows).encode("utf8")
+
+        async def parse(chunked: bool, status: int = 200, path: str = ""):
+            server, url = await serve(body, chunked, status)
+            async with server:
+                return await RowList.aparse_from_url(urllib.parse.urljoin(url, path))
+
+        self.assertEqual(asyncio.run(parse(chunked=False)), rows)
+        self.assertEqual(asyncio.run(parse(chunked=True)), rows)
+        self.assertRaises(ConnectionError, asyncio.run, parse(chunked=False, status=404))
+        self.assertEqual(asyncio.run(parse(chunked=False, path="/redirect/4")), rows)
+        self.assertRaises(ConnectionError, asyncio.run, parse(chunked=False, path="/redirect/5"))
+
+        async def client(url):
+            yield body[:10]
+            yield body[10:]
+
+        self.assertEqual(asyncio.run(RowList.aparse_from_url("memory://rows", client=client)), rows)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import datetime
+import pickle
+import unittest
+import sys
+sys.path.append('..')
+import jsonbind
+from jsonbind.core import Serialization, Backends, JsonBackend, StdlibBackend
+from jsonbind.special import List, Object
+
+
+class Row(Object):
+    def __init__(self):
+        super(Row, self).__init__(a=1, b="text ü / \x7f", c=[1, 2.5, None, True], d=Object(x=0.25), e=datetime.date(2020, 1, 2))
+
+
+class CountingBackend(StdlibBackend):
+    def __init__(self):
+        JsonBackend.__init__(self, name="counting")
+        self.calls = 0
+
+    def dumps(self, json_value, **kwargs):
+        self.calls += 1
+        return StdlibBackend.dumps(self, json_value, **kwargs)
+
+
+class BackendTests(unittest.TestCase):
+
+    def test_backends_match_stdlib(self):
+        value = List.create_type(Row)([Row(), Row()])
+        options = [dict(),
+                   dict(sort_keys=True),
+                   dict(ensure_ascii=False),
+                   dict(indent=2, separators=(',', ': ')),
+                   dict(indent=4),
+                   dict(skipkeys=True)]
+        for name in Backends.available_backends():
+            for kwargs in options:
+                json_string = Serialization.serialize(value, backend=name, **kwargs)
+                self.assertEqual(json_string, Serialization.serialize(value, backend="json", **kwargs))
+                self.assertEqual(Serialization.deserialize(json_string, List.create_type(Row), backend=name), value)
+            self.assertEqual(jsonbind.loads('[NaN, 123456789012345678901234567890]', backend=name)[1],
+                             123456789012345678901234567890)
+
+    def test_backends_match_stdlib_numbers(self):
+        value = [1e20, 1e-07, 2.5e-10, 1.5e+300, float("inf"), -9223372036854775809, 2 ** 70, None, "1e5"]
+        json_string = jsonbind.dumps(value, backend="json")
+        for name in Backends.available_backends():
+            self.assertEqual(jsonbind.dumps(value, backend=name), json_string)
+            self.assertEqual(Serialization.serialize_bytes(value, backend=name), json_string.encode())
+            self.assertEqual(jsonbind.dumps([float("nan")], backend=name), "[NaN]")
+            self.assertEqual(jsonbind.loads(json_string, backend=name), value)
+            self.assertEqual(jsonbind.loads(json_string.encode(), backend=name), value)
+            self.assertEqual(jsonbind.loads("[18446744073709551616, 1e-7]", backend=name), [18446744073709551616, 1e-07])
+
+    def test_nulls_use_the_backend(self):
+        if not Backends.is_available("orjson"):
+            self.skipTest("orjson is not installed")
+        backend = Backends.get_backend("orjson")
+        value = {"a": None, "b": "nullable", "c": [1.5, None], "d": "[1, null]"}
+        # None means the call fell back to the standard library
+        self.assertEqual(backend.__dumps__(value, separators=(',', ':')), jsonbind.dumps(value, backend="json").encode())
+        self.assertIsNone(backend.__dumps__({"a": None, "b": float("inf")}, separators=(',', ':')))
+
+    def test_backend_selection(self):
+        self.assertEqual(Backends.get_backend("json").name, "json")
+        self.assertIn(Backends.get_backend("auto").name, Backends.available_backends())
+        self.assertRaises(ValueError, Backends.get_backend, "missing")
+        self.assertRaises(ValueError, Backends.set_default, "missing")
+        backend = CountingBackend()
+        Backends.set_backend(backend)
+        default = Backends.get_default()
+        Backends.set_default("counting")
+        try:
+            self.assertEqual(jsonbind.dumps([1, 2]), "[1,2]")
+            self.assertEqual(Serialization.serialize([1, 2], backend="json"), "[1,2]")
+            self.assertEqual(backend.calls, 1)
+        finally:
+            Backends.set_default(default)
+        self.assertIs(pickle.loads(pickle.dumps(backend)), backend)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+import sys
+sys.path.append('..')
+import datetime
+import jsonbind
+from jsonbind.core import Serialization, BinaryEncoder, BinaryDecoder, Bindings
+from jsonbind.core.binary import Msgpack
+from jsonbind.special import List, Object, SlottedObject, ArrayList
+from jsonbind.special.list import ListBinding
+
+
+class Sample(SlottedObject):
+    id: int = 0
+    payload: bytes = b""
+    created: datetime.datetime = datetime.datetime(2020, 1, 1)
+    values: List.create_type(float)
+    counts: ArrayList.create_type(int)
+
+
+class Range(List):
+    pass
+
+
+class RangeBinding(ListBinding):
+    def to_json_value(self, python_value):
+        return {"start": python_value[0], "stop": python_value[-1]}
+
+
+Bindings.set_binding(RangeBinding(python_type=Range))
+# the pure python codec, and msgpack when it is installed
+codecs = [False] + ([None] if Msgpack.is_available() else [])
+
+
+class BinaryTests(unittest.TestCase):
+    def test_binary_format(self):
+        for compiled in codecs:
+            self.check_binary_format(BinaryEncoder(compiled=compiled), BinaryDecoder(compiled=compiled))
+
+    def check_binary_format(self, encoder, decoder):
+        # MessagePack encodings
+        self.assertEqual(encoder.encode(None), b"\xc0")
+        self.assertEqual(encoder.encode([True, False]), b"\x92\xc3\xc2")
+        self.assertEqual(encoder.encode({"a": 1}), b"\x81\xa1a\x01")
+        self.assertEqual(encoder.encode(-33), b"\xd0\xdf")
+        self.assertEqual(encoder.encode(1.5), b"\xcb\x3f\xf8\x00\x00\x00\x00\x00\x00")
+        self.assertEqual(encoder.encode(b"\x00\x01"), b"\xc4\x02\x00\x01")
+        for value in [0, 127, 128, 65536, 2 ** 64 - 1, -32, -129, -2 ** 63, "", "x" * 40, "ü" * 40000,
+                      [1.5] * 10, [2 ** 40] * 10, [1, 2.5] * 10, {str(i): [i] for i in range(20)}]:
+            self.assertEqual(decoder.decode(encoder.encode(value)), value)
+        self.assertRaises(OverflowError, encoder.encode, 2 ** 64)
+        self.assertRaises(ValueError, decoder.decode, b"\x92\x01")
+        self.assertRaises(ValueError, decoder.decode, b"\x01\x02")
+        self.assertRaises(ValueError, decoder.decode, b"\xc1")
+
+    def test_binary_serialization(self):
+        for compiled in codecs:
+            self.check_binary_serialization(compiled)
+        # both codecs read each other's documents
+        value = Object(a=[0.5] * 10, b=List.create_type(int)(range(10)), c=b"\x00")
+        json_value = {"a": [0.5] * 10, "b": list(range(10)), "c": b"\x00"}
+        for compiled in codecs:
+            self.assertEqual(jsonbind.loadb(jsonbind.dumpb(value, compiled=compiled), compiled=False), json_value)
+            self.assertEqual(jsonbind.loadb(jsonbind.dumpb(value, compiled=False), compiled=compiled), json_value)
+
+    def test_custom_list_binding(self):
+        # lists are only packed when they use the list binding
+        for compiled in codecs:
+            data = jsonbind.dumpb(Range(iterable=range(10)), compiled=compiled)
+            self.assertEqual(jsonbind.loadb(data, compiled=compiled), {"start": 0, "stop": 9})
+            self.assertEqual(jsonbind.loadb(jsonbind.dumpb([Range(iterable=range(10))], compiled=compiled), compiled=compiled),
+                             [{"start": 0, "stop": 9}])
+
+    def test_msgpack_required(self):
+        # without msgpack the binary format is only used when the pure python codec is asked for
+        available = Msgpack.__available__
+        Msgpack.__available__ = False
+        try:
+            self.assertRaises(ImportError, jsonbind.dumpb, [1, 2])
+            self.assertRaises(ImportError, jsonbind.loadb, b"\x92\x01\x02")
+            self.assertRaises(ImportError, BinaryEncoder, compiled=True)
+            self.assertEqual(jsonbind.loadb(jsonbind.dumpb([1, 2], compiled=False), compiled=False), [1, 2])
+        finally:
+            Msgpack.__available__ = available
+
+    def check_binary_serialization(self, compiled):
+        samples = List.create_type(Sample)([Sample(id=i,
+                                                   payload=bytes(range(i)),
+                                                   values=List.create_type(float)([i / 3] * 10),
+                                                   counts=ArrayList.create_type(int)(range(i))) for i in range(20)])
+        data = jsonbind.dumpb(samples, compiled=compiled)
+        self.assertLess(len(data), len(jsonbind.dumps(samples)))
+        # bytes are not base64 encoded
+        self.assertIn(bytes(range(19)), data)
+        samples2 = jsonbind.loadb(data, samples.__class__, compiled=compiled)
+        self.assertEqual(samples2, samples)
+        self.assertEqual(samples2[3].payload, b"\x00\x01\x02")
+        self.assertIs(samples2[3].counts.__class__, ArrayList.create_type(int))
+        self.assertEqual(Serialization.deserialize_binary(data, samples.__class__, projection=["id"], compiled=compiled)[5].id, 5)
+        self.assertEqual(jsonbind.loadb(jsonbind.dumpb([b"ab", 1, "c"], compiled=compiled), compiled=compiled), [b"ab", 1, "c"])
+        o = Object(a=1)
+        o.b = [o]
+        self.assertRaises(ValueError, jsonbind.dumpb, o, compiled=compiled)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,27 @@
+import io
 import unittest
 import sys
 sys.path.append('..')
-from jsonbind.core import Serialization
+import jsonbind
+from jsonbind.core import Serialization, Backends, Bindings
+from jsonbind.bindings.bytes import BytesBinding
+from jsonbind.special import Object
+
+
+class Digest(bytes):
+    pass
+
+
+class DigestBinding(BytesBinding):
+    def __init__(self):
+        super().__init__(encoding="ascii")
+        self.python_type = Digest
+
+    def to_json_value(self, python_value: bytes) -> str:
+        return python_value.hex()
+
+
+Bindings.set_binding(DigestBinding())
 
 
 class BytesTests(unittest.TestCase):
@@ -11,6 +31,30 @@ class BytesTests(unittest.TestCase):
     def test_bytes_deserialization(self):
         self.assertEqual(Serialization.deserialize('"SGVsbG8="', bytes), b"Hello")
 
+    def test_bytes_native_serialization(self):
+        value = Object(a=b"Hello", b=[b"", b"\x00\xff"], c="ü")
+        json_string = Serialization.serialize(value)
+        for name in Backends.available_backends():
+            self.assertEqual(Serialization.serialize_bytes(value, backend=name), json_string.encode("utf8"))
+            self.assertEqual(Serialization.deserialize(memoryview(json_string.encode("utf8")), backend=name)["b"], ["", "AP8="])
+            self.assertEqual(Serialization.deserialize(bytearray(b'"SGVsbG8="'), bytes, backend=name), b"Hello")
+        self.assertEqual(jsonbind.dumps_bytes(value, indent=2), jsonbind.dumps(value, indent=2).encode("utf8"))
+        binary = io.BytesIO()
+        text = io.StringIO()
+        jsonbind.dump(value, binary)
+        jsonbind.dump(value, text)
+        self.assertEqual(binary.getvalue(), json_string.encode("utf8"))
+        self.assertEqual(text.getvalue(), json_string)
+
+    def test_overridden_to_json_value(self):
+        # bindings that only override to_json_value do not inherit the token of their base
+        value = Object(a=Digest(b"\x00\xff"))
+        self.assertEqual(jsonbind.dumps(value), '{"a":"00ff"}')
+        binary = io.BytesIO()
+        jsonbind.dump(value, binary)
+        self.assertEqual(binary.getvalue(), b'{"a":"00ff"}')
+        self.assertEqual(jsonbind.dumps_bytes(Digest(b"\x01")), b'"01"')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,3 +1,5 @@
+import datetime
+import typing
 import unittest
 import sys
 sys.path.append('..')
@@ -5,6 +7,20 @@ from jsonbind.bindings import BoundClass
 from jsonbind.core import Serialization
 
 
+class Event(BoundClass):
+    name: str = ""
+    when: typing.Optional[datetime.date] = None
+
+
+class Counted(BoundClass):
+    constructed = 0
+    when: typing.Optional[datetime.date]
+
+    def __init__(self):
+        Counted.constructed += 1
+        self.when = None
+
+
 class A(BoundClass):
     def __init__(self):
         self.a = None
@@ -40,6 +56,17 @@ class ClassBindingTests(unittest.TestCase):
         ti.g = dict({"z": 5})
         self.assertEqual(Serialization.deserialize('{"a":null,"b":false,"c": 20,"d":20.5,"e":"Object","f":[4, 5, 6],"g":{"z": 5}}', A), ti)
 
+    def test_annotated_class(self):
+        event = Serialization.deserialize('{"name":"launch","when":"2021-05-05"}', Event)
+        self.assertEqual(event.when, datetime.date(2021, 5, 5))
+        self.assertEqual(vars(event), {"name": "launch", "when": datetime.date(2021, 5, 5)})
+        self.assertEqual(Serialization.serialize(event), '{"name":"launch","when":"2021-05-05"}')
+        # classes with their own constructor still run it
+        constructed = Counted.constructed
+        counted = Serialization.deserialize('{"when":"2021-05-05"}', Counted)
+        self.assertEqual(counted.when, datetime.date(2021, 5, 5))
+        self.assertGreater(Counted.constructed, constructed)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -3,7 +3,7 @@ import unittest
 import sys
 sys.path.append('..')
 from jsonbind.core import Serialization, Bindings
-from jsonbind.bindings import DateTimeBinding
+from jsonbind.bindings import DateTimeBinding, DateBinding, TimeBinding
 
 
 class DateTimeTests(unittest.TestCase):
@@ -25,6 +25,28 @@ class DateTimeTests(unittest.TestCase):
         self.assertEqual(Serialization.serialize(dt), '"20:10:35.000000"')
         self.assertEqual(Serialization.deserialize('"20:10:35.000000"', datetime.time), dt)
 
+    def test_parsers(self):
+        binding = DateTimeBinding(date_time_format=DateTimeBinding.Format.time_stamp)
+        dt = datetime.datetime(year=2020, month=1, day=1, hour=10, minute=10, second=10, microsecond=100)
+        self.assertEqual(binding.to_python_value("2020-01-01 10:10:10.000100", datetime.datetime), dt)
+        # strptime accepts values the fast path does not
+        self.assertEqual(binding.to_python_value("2020-1-1 10:10:10.0001", datetime.datetime), dt)
+        self.assertRaises(ValueError, binding.to_python_value, "2020-01-01T10:10:10.000100", datetime.datetime)
+        self.assertRaises(ValueError, binding.to_python_value, "2020-01-01 10:10:10", datetime.datetime)
+        binding = DateTimeBinding(date_time_format=DateTimeBinding.Format.http_date, cache_size=0)
+        self.assertEqual(binding.to_python_value("Wed, 01 Jan 2020 10:10:10 GMT", datetime.datetime), dt.replace(microsecond=0))
+        self.assertRaises(ValueError, binding.to_python_value, "Wed, 01 Foo 2020 10:10:10 GMT", datetime.datetime)
+        binding = DateBinding(date_format=DateBinding.Format.http_date)
+        self.assertEqual(binding.to_python_value("Wed, 01 Jan 2020 10:10:10 GMT", datetime.date), dt.date())
+        self.assertRaises(ValueError, binding.to_python_value, "Wed, 01 Jan 2020 25:10:10 GMT", datetime.date)
+        binding = TimeBinding(time_format=TimeBinding.Format.tiny_time)
+        self.assertEqual(binding.to_python_value("20:10", datetime.time), datetime.time(hour=20, minute=10))
+        self.assertRaises(ValueError, binding.to_python_value, "20:10:35", datetime.time)
+        binding = DateTimeBinding(date_time_format="%d/%m/%Y")
+        self.assertEqual(binding.to_python_value("31/12/2020", datetime.datetime), datetime.datetime(2020, 12, 31))
+        self.assertIs(binding.to_python_value("31/12/2020", datetime.datetime),
+                      binding.to_python_value("31/12/2020", datetime.datetime))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,71 @@
+import io
+import json
+import unittest
+import sys
+sys.path.append('..')
+import jsonbind
+from jsonbind.core import ArrayDecoder
+from jsonbind.special import List, Object
+
+
+class Row(Object):
+    def __init__(self):
+        super(Row, self).__init__(a=0, b=0.0, c="", d=Object(x=0))
+
+
+class IterloadTests(unittest.TestCase):
+
+    def test_array_decoder(self):
+        document = ' [1, 22 , -3.5e2,"a]\\",", [1, [2]], {"x": [true, false, null]}, 4444]  '
+        for chunk_size in [1, 2, 3, 7, 100]:
+            decoder = ArrayDecoder()
+            values = list()
+            for i in range(0, len(document), chunk_size):
+                values += decoder.feed(document[i:i + chunk_size])
+            values += decoder.close()
+            self.assertEqual(values, json.loads(document))
+        decoder = ArrayDecoder()
+        self.assertEqual(decoder.feed("[]") + decoder.close(), [])
+        self.assertRaises(json.JSONDecodeError, ArrayDecoder().feed, '{"a": 1}')
+        self.assertRaises(json.JSONDecodeError, ArrayDecoder().feed, '[1 2]')
+        decoder = ArrayDecoder()
+        decoder.feed("[1, 2")
+        self.assertRaises(json.JSONDecodeError, decoder.close)
+        decoder = ArrayDecoder()
+        decoder.feed('[{"a": [1, "\\')
+        self.assertRaises(json.JSONDecodeError, decoder.close)
+
+    def test_large_elements(self):
+        document = json.dumps([{"values": list(range(5000)), "text": 'x\\"]}' * 500}, "tail", [[[]]]])
+        for chunk_size in [1, 64, 1000]:
+            decoder = ArrayDecoder()
+            values = list()
+            for i in range(0, len(document), chunk_size):
+                values += decoder.feed(document[i:i + chunk_size])
+            values += decoder.close()
+            self.assertEqual(values, json.loads(document))
+        # malformed elements fail as soon as the chunk that breaks them arrives
+        for head, tail in [('[{"a": [1, ', '2}'), ('[tr', 'u, 1'), ('[', 'x'), ('[{"a": 1', ' "b"}, 2')]:
+            decoder = ArrayDecoder()
+            self.assertEqual(decoder.feed(head), [])
+            self.assertRaises(json.JSONDecodeError, decoder.feed, tail)
+
+    def test_iterload(self):
+        rows = List.create_type(Row)([Row() for _ in range(100)])
+        for i, row in enumerate(rows):
+            row.a = i
+            row.c = "ü%d" % i
+            row.d.x = i * 2
+        document = jsonbind.dumps(rows, indent=1)
+        loaded = list(jsonbind.iterload(io.StringIO(document), cls=List.create_type(Row), chunk_size=13))
+        self.assertEqual(loaded, list(rows))
+        self.assertTrue(all(isinstance(row, Row) for row in loaded))
+        loaded = list(jsonbind.iterload(io.BytesIO(document.encode("utf8")), cls=List.create_type(Row), chunk_size=5))
+        self.assertEqual(loaded, list(rows))
+        self.assertEqual(list(jsonbind.iterload(io.StringIO("[1, 2, [3]]"))), [1, 2, [3]])
+        self.assertRaises(TypeError, list, jsonbind.iterload(io.StringIO("[1, 2]"), cls=List.create_type(str)))
+        self.assertRaises(TypeError, list, jsonbind.iterload(io.StringIO("{}"), cls=Row))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import io
+import unittest
+import sys
+sys.path.append('..')
+import jsonbind
+from jsonbind.special import List, Object
+
+
+class Row(Object):
+    def __init__(self):
+        super(Row, self).__init__(a=0, b="", c=Object(x=0.0))
+
+
+def create_rows(count: int) -> List:
+    rows = List.create_type(Row)()
+    for i in range(count):
+        row = Row()
+        row.a = i
+        row.b = "row %d" % i
+        row.c.x = i / 2
+        rows.append(row)
+    return rows
+
+
+class LinesTests(unittest.TestCase):
+
+    def test_dump_lines(self):
+        rows = create_rows(3)
+        text = io.StringIO()
+        jsonbind.dump_lines(rows, text)
+        self.assertEqual(text.getvalue(), "".join(jsonbind.dumps(row) + "\n" for row in rows))
+        binary = io.BytesIO()
+        written = rows.to_lines(binary, buffer_size=10)
+        self.assertEqual(binary.getvalue(), text.getvalue().encode("utf8"))
+        self.assertEqual(written, len(binary.getvalue()))
+        self.assertRaises(ValueError, jsonbind.dump_lines, rows, text, indent=2)
+
+    def test_load_lines(self):
+        rows = create_rows(100)
+        text = io.StringIO()
+        rows.to_lines(text)
+        text.write("\n")
+        text.write(jsonbind.dumps(rows[0]) + "\n")
+        text.seek(0)
+        loaded = list(Row.parse_lines(text))
+        self.assertEqual(loaded, list(rows) + [rows[0]])
+        self.assertTrue(all(isinstance(row, Row) for row in loaded))
+        binary = io.BytesIO(text.getvalue().encode("utf8"))
+        loaded = List.create_type(Row).from_lines(binary)
+        self.assertEqual(loaded, list(rows) + [rows[0]])
+        self.assertEqual(list(jsonbind.load_lines(io.StringIO('1\n"a"\n[1]\n'))), [1, "a", [1]])
+
+    def test_parallel_load_lines(self):
+        rows = create_rows(1000)
+        text = io.StringIO()
+        rows.to_lines(text)
+        text.seek(0)
+        loaded = list(jsonbind.load_lines(text, cls=Row, workers=2, chunk_size=64))
+        self.assertEqual(loaded, list(rows))
+        self.assertTrue(all(isinstance(row, Row) for row in loaded))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,7 +2,42 @@ import unittest
 import sys
 sys.path.append('..')
 from jsonbind.core import Serialization
-from jsonbind.special import List, Object, NotFoundBehavior, SortOrder
+from jsonbind.core import Bindings
+from jsonbind.special import List, Object, SlottedObject, NotFoundBehavior, SortOrder, SearchType
+from jsonbind.special.util import IndexType
+from jsonbind.special.list import ListBinding, ColumnarListBinding
+
+
+class ParallelList(List):
+    def __init__(self, iterable=None):
+        List.__init__(self, iterable=iterable, list_type=List.create_type(Object))
+
+
+Bindings.set_binding(ListBinding(python_type=ParallelList, workers=2, parallel_threshold=100, chunk_size=64))
+
+
+class Scores(List.create_type(int)):
+    pass
+
+
+class Position(SlottedObject):
+    x: float = 0.0
+    y: float = 0.0
+
+
+class Reading(SlottedObject):
+    id: int = 0
+    sensor: str = ""
+    position: Position
+
+
+class ReadingLog(List):
+    def __init__(self, iterable=None):
+        List.__init__(self, iterable=iterable, list_type=Reading)
+
+
+Bindings.set_binding(ColumnarListBinding(python_type=ReadingLog))
+
 
 class ListTests(unittest.TestCase):
     def test_list_serialization(self):
@@ -88,5 +123,204 @@ class ListTests(unittest.TestCase):
         self.assertEqual(l.find_first(lambda i: False, not_found_behavior=NotFoundBehavior.ReturnNone), None)
         self.assertEqual(l.find_ordered(-10, lambda i: i.x, not_found_behavior=NotFoundBehavior.ReturnNone), None)
 
+    def test_batch_search(self):
+        l = List(list_type=Object, iterable=[Object(x=x // 2, y=x) for x in range(100)])
+        self.assertEqual(l.find_ordered_indexes([10, 3, 60], "x", search_type=SearchType.LowerBound), [20, 6, 100])
+        self.assertEqual(l.find_ordered_indexes([10, 3, 60], "x", search_type=SearchType.UpperBound), [22, 8, 100])
+        self.assertEqual(l.find_ordered_many([10, 60], "x", not_found_behavior=NotFoundBehavior.ReturnNone), [Object(x=10, y=20), None])
+        self.assertRaises(RuntimeError, l.find_ordered_many, [10, 60], "x")
+        self.assertEqual([i.y for i in l.find_ordered_range(10, 11, "x")], [20, 21, 22, 23])
+        self.assertEqual([len(r) for r in l.find_ordered_ranges([(-5, 0), (49, 70), (60, 70)], "x")], [2, 2, 0])
+        self.assertIs(l.find_ordered_range(10, 11, "x").list_type, Object)
+        # large batches compute every key once and go through numpy for numeric lists
+        l = List(list_type=int, iterable=range(0, 2000, 2))
+        probes = list(range(-1, 2001))
+        self.assertEqual(l.find_ordered_indexes(probes, search_type=SearchType.LowerBound), [min(max((p + 1) // 2, 0), 1000) for p in probes])
+        self.assertEqual(l.find_ordered_many(probes[:4], not_found_behavior=NotFoundBehavior.ReturnNone), [None, 0, None, 2])
+        l = List(list_type=int, iterable=range(2000, 0, -2))
+        self.assertEqual(l.find_ordered_indexes([2001, 2000, 1999, 1], search_type=SearchType.LowerBound, order=SortOrder.Descending), [0, 0, 1, 1000])
+
+    def test_bulk_type_check(self):
+        l = List(list_type=float, iterable=[1, 2.5])
+        self.assertEqual([v.__class__ for v in l], [float, float])
+        l.extend([3, 4.5])
+        l += (5 for _ in range(2))
+        l[0:2] = [7, 8]
+        self.assertEqual(l, [7.0, 8.0, 3.0, 4.5, 5.0, 5.0])
+        self.assertTrue(all(v.__class__ is float for v in l))
+        self.assertRaises(TypeError, l.extend, [1.0, "a"])
+        self.assertRaises(TypeError, l.extend, [None])
+        self.assertRaises(TypeError, List(list_type=Object).extend, [Object(), 1])
+        self.assertRaises(TypeError, List(iterable=[1]).extend, [set])
+        self.assertEqual(len(l), 6)
+        l = List()
+        self.assertRaises(ValueError, l.extend, [1, l])
+        l.extend(l)
+        l = List.create_type(list_type=Object, allow_empty=True)([None, Object(x=1)])
+        self.assertEqual(l, [None, Object(x=1)])
+        l = List(list_type=Object, iterable=["not checked"], trusted=True)
+        l.extend([1], trusted=True)
+        self.assertEqual(l, ["not checked", 1])
+        self.assertRaises(TypeError, Serialization.deserialize, "[1, null]", List.create_type(list_type=int))
+        self.assertEqual(Serialization.deserialize("[1, 2.5]", List.create_type(list_type=float)), [1.0, 2.5])
+
+    def test_indexes(self):
+        import pickle
+        l = List(list_type=Object, iterable=[Object(x=x % 10, y=Object(z=-x)) for x in range(100)])
+        l.add_index("x")
+        l.add_index("y.z", IndexType.Sorted)
+        key = lambda i: i.x * 2
+        l.add_index(key)
+
+        def check():
+            for x in range(-2, 12):
+                expected = [i for i in l if i.x == x]
+                self.assertEqual(l.filter_by("x", x), expected)
+                self.assertEqual(l.filter_by(key, x * 2), expected)
+                self.assertEqual(l.filter_by("x", x), l.filter(lambda i: i.x == x))
+                if expected:
+                    self.assertEqual(l.find_index_by("x", x), l.find_first_index(lambda i: i.x == x))
+                else:
+                    self.assertRaises(RuntimeError, l.find_by, "x", x)
+                    self.assertIsNone(l.find_by("x", x, not_found_behavior=NotFoundBehavior.ReturnNone))
+            for i in l:
+                self.assertIs(l.find_ordered(i.y.z, key="y.z"), l.find_first(lambda v: v.y.z == i.y.z))
+
+        check()
+        l.append(Object(x=3, y=Object(z=1000)))
+        l.extend([Object(x=11, y=Object(z=-1000))])
+        l += [Object(x=0, y=Object(z=5))]
+        l.insert(3, Object(x=4, y=Object(z=3)))
+        l.insert(-1, Object(x=5, y=Object(z=7)))
+        l[10] = Object(x=7, y=Object(z=50))
+        l[-1] = Object(x=8, y=Object(z=51))
+        check()
+        del l[0]
+        l.pop()
+        l[5:8] = [Object(x=1, y=Object(z=-7))]
+        l.remove(l[20])
+        l.sort(key=lambda i: i.y.z)
+        check()
+        self.assertEqual(l.find_ordered_index(-500, key="y.z", search_type=SearchType.Aprox), l.find_first_index(lambda i: i.y.z == -99))
+        self.assertRaises(RuntimeError, l.find_ordered, -500, key="y.z")
+        l[0].x = 100
+        l.reindex()
+        self.assertIs(l.find_by("x", 100), l[0])
+        l.drop_index("x")
+        self.assertIs(l.find_by("x", 100), l[0])
+        self.assertEqual(pickle.loads(pickle.dumps(l)), l)
+        # with a value the key is an index key
+        self.assertEqual(l.filter("x", 3), l.filter(lambda i: i.x == 3))
+        self.assertIs(l.find_first(key, value=6), l.find_first(lambda i: i.x == 3))
+        self.assertIsNone(l.find_first_index("y.z", value=10 ** 6, not_found_behavior=NotFoundBehavior.ReturnNone))
+
+    def test_index_updates(self):
+        import random
+        from jsonbind.special.util import HashIndex
+        rng = random.Random(7)
+        l = List(list_type=Object, iterable=[Object(x=rng.randrange(10)) for _ in range(50)])
+        l.add_index("x")
+        l.add_index(lambda i: -i.x, IndexType.Sorted)
+        # indexes are built on their first query
+        for list_index in l.__indexes__.values():
+            list_index.build(l)
+        operations = [lambda: l.append(Object(x=rng.randrange(10))),
+                      lambda: l.insert(rng.randrange(-5, len(l)), Object(x=rng.randrange(10))),
+                      lambda: l.__delitem__(rng.randrange(len(l))),
+                      lambda: l.__delitem__(slice(rng.randrange(len(l)), rng.randrange(len(l)))),
+                      lambda: l.pop(),
+                      lambda: l.pop(rng.randrange(-len(l), len(l))),
+                      lambda: l.remove(l[rng.randrange(len(l))]),
+                      lambda: l.__setitem__(slice(rng.randrange(len(l)), rng.randrange(len(l))),
+                                            [Object(x=rng.randrange(10)) for _ in range(rng.randrange(4))]),
+                      lambda: l.__setitem__(slice(None, None, 3), [Object(x=rng.randrange(10)) for _ in l[::3]])]
+        for _ in range(300):
+            if len(l) < 10:
+                l.extend([Object(x=rng.randrange(10)) for _ in range(20)])
+            rng.choice(operations)()
+            # deletes and slice assignments keep the indexes up to date instead of rebuilding them
+            for list_index in l.__indexes__.values():
+                self.assertTrue(list_index.valid)
+                rebuilt = list_index.__class__(key=list_index.key)
+                rebuilt.build(l)
+                if isinstance(list_index, HashIndex):
+                    self.assertEqual(list_index.positions, rebuilt.positions)
+                else:
+                    self.assertEqual(sorted(zip(list_index.keys, list_index.positions)),
+                                     sorted(zip(rebuilt.keys, rebuilt.positions)))
+
+    def test_create_type(self):
+        import gc
+        import weakref
+        # the same arguments give the same class, so what is set on it is shared
+        int_list = List.create_type(int)
+        self.assertIs(List.create_type(int), int_list)
+        int_list.label = "ints"
+        self.assertEqual(List.create_type(int).label, "ints")
+        self.assertIsNot(List.create_type(int, list_name="Ids"), int_list)
+        self.assertIsNot(List.create_type(int, allow_empty=True), int_list)
+        # unused types are not kept alive by the cache
+        complex_list = weakref.ref(List.create_type(complex))
+        gc.collect()
+        self.assertIsNone(complex_list())
+        del int_list.label
+
+    def test_pickle(self):
+        import pickle
+        l = List.create_type(list_type=Object)([Object(x=x) for x in range(3)])
+        pl = pickle.loads(pickle.dumps(l))
+        self.assertIs(pl.__class__, l.__class__)
+        self.assertEqual(pl, l)
+        pl = pickle.loads(pickle.dumps(List(iterable=[1, 2, 3])))
+        self.assertEqual(pl, [1, 2, 3])
+        pl.append(4)
+        # subclasses of created types are pickled by reference
+        pl = pickle.loads(pickle.dumps(Scores([1, 2])))
+        self.assertIs(pl.__class__, Scores)
+        self.assertEqual(pl, [1, 2])
+
+    def test_parallel_deserialization(self):
+        json_string = Serialization.serialize([[{"x": x, "y": [x, i]} for x in range(i % 3)] for i in range(500)])
+        l = Serialization.deserialize(json_string, ParallelList)
+        self.assertEqual(len(l), 500)
+        self.assertIs(l[5].__class__, List.create_type(Object))
+        self.assertEqual(l[5][1], Object(x=1, y=[1, 5]))
+        self.assertEqual(Serialization.serialize(l), json_string)
+        self.assertEqual(len(Serialization.deserialize("[[]]", ParallelList)), 1)
+
+    def test_columnar(self):
+        readings = List.create_type(Reading, columnar=True)
+        l = readings([Reading(id=i, sensor="s%d" % i, position=Position(x=i / 2, y=-i)) for i in range(3)])
+        json_string = Serialization.serialize(l)
+        self.assertEqual(json_string, '{"columns":["id","sensor","position.x","position.y"],'
+                                      '"data":[[0,1,2],["s0","s1","s2"],[0.0,0.5,1.0],[0,-1,-2]]}')
+        l2 = Serialization.deserialize(json_string, readings)
+        self.assertIs(l2.__class__, readings)
+        self.assertEqual(l2, l)
+        self.assertIs(l2[1].position.y.__class__, float)
+        # both layouts are accepted
+        self.assertEqual(Serialization.deserialize(Serialization.serialize(List.create_type(Reading)(l)), readings), l)
+        l3 = Serialization.deserialize(json_string, readings, projection=["position.x"])
+        self.assertEqual([r.position.x for r in l3], [0.0, 0.5, 1.0])
+        self.assertEqual(l3[2].id, 0)
+        # elements with different members are written as an array
+        objects = List.create_type(Object, columnar=True)
+        l4 = objects([Object(a=1, b=Object(c=2)), Object(a=3, b=Object(c=4))])
+        self.assertEqual(Serialization.serialize(l4), '{"columns":["a","b.c"],"data":[[1,3],[2,4]]}')
+        self.assertEqual(Serialization.deserialize(Serialization.serialize(l4), objects), l4)
+        l4.append(Object(a=5))
+        self.assertEqual(Serialization.serialize(l4), '[{"a":1,"b":{"c":2}},{"a":3,"b":{"c":4}},{"a":5}]')
+        self.assertEqual(Serialization.serialize(objects()), '[]')
+        # subclasses with their own constructor
+        log = ReadingLog(Reading(id=i, position=Position(x=i)) for i in range(3))
+        json_string = Serialization.serialize(log)
+        self.assertTrue(json_string.startswith('{"columns":'))
+        log2 = Serialization.deserialize(json_string, ReadingLog)
+        self.assertIs(log2.__class__, ReadingLog)
+        self.assertEqual(log2, log)
+        log3 = Serialization.deserialize(json_string, ReadingLog, projection=["missing"])
+        self.assertEqual((log3.__class__, log3.list_type, len(log3)), (ReadingLog, Reading, 3))
+
+
 if __name__ == '__main__':
     unittest.main()
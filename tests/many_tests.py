@@ -0,0 +1,59 @@
+import datetime
+import unittest
+import sys
+sys.path.append('..')
+import jsonbind
+from jsonbind.core import Serialization, Backends
+from jsonbind.special import Object
+
+
+class Record(Object):
+    def __init__(self):
+        super(Record, self).__init__(a=0, b="", c=[0.0], d=datetime.date(2000, 1, 1), e=Object(x=0))
+
+
+class Child(Record):
+    pass
+
+
+def create_records(count: int) -> list:
+    records = list()
+    for i in range(count):
+        record = Record() if i % 10 else Child()
+        record.a = i
+        record.b = "record %d" % i
+        record.c = [i / 4, -i]
+        record.d = datetime.date(2000, 1, 1 + i % 28)
+        records.append(record)
+    return records
+
+
+class ManyTests(unittest.TestCase):
+
+    def test_dumps_many(self):
+        records = create_records(50)
+        for name in Backends.available_backends():
+            for kwargs in [dict(), dict(sort_keys=True), dict(indent=2)]:
+                self.assertEqual(jsonbind.dumps_many(records, Record, backend=name, **kwargs),
+                                 [jsonbind.dumps(record, **kwargs) for record in records])
+        self.assertEqual(jsonbind.dumps_many([1, "a", None, Record()]),
+                         [jsonbind.dumps(value) for value in [1, "a", None, Record()]])
+
+    def test_loads_many(self):
+        records = create_records(50)
+        json_strings = jsonbind.dumps_many(records, Record)
+        for name in Backends.available_backends():
+            loaded = jsonbind.loads_many(json_strings, Record, backend=name)
+            self.assertEqual(loaded, [jsonbind.loads(json_string, Record) for json_string in json_strings])
+            self.assertTrue(all(record.__class__ is Record for record in loaded))
+        self.assertEqual(jsonbind.loads_many(['1', '"a"', b'[1, 2]', '{"x": null}']), [1, "a", [1, 2], {"x": None}])
+
+    def test_parallel_loads_many(self):
+        json_strings = Serialization.serialize_many(create_records(500), Record)
+        loaded = jsonbind.loads_many(json_strings, Record, workers=2, chunk_size=64)
+        self.assertEqual(loaded, jsonbind.loads_many(json_strings, Record))
+        self.assertEqual(len(loaded), 500)
+
+
+if __name__ == '__main__':
+    unittest.main()
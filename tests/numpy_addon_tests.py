@@ -1,9 +1,20 @@
 import unittest
 import sys
 sys.path.append('..')
-from jsonbind.special import List, Object
+from jsonbind.special import List, Object, SlottedObject
 from jsonbind.addons import numpy, pandas
 
+
+class Position(SlottedObject):
+    x: float = 0.0
+    y: float = 0.0
+
+
+class Sample(SlottedObject):
+    a: int = 0
+    p: Position
+
+
 class NumpyAddonTests(unittest.TestCase):
     def test_to_numpy_array(self):
         l = List(list_type=Object, iterable=[Object(a=i,
@@ -31,6 +42,47 @@ class NumpyAddonTests(unittest.TestCase):
         l2 = List.create_type(list_type=Object).from_numpy_array(numpy_array)
         self.assertEqual(l2,l)
 
+    def test_slotted_numpy_array(self):
+        l = List(list_type=Sample, iterable=[Sample(a=i, p=Position(x=i / 2, y=-i)) for i in range(10)])
+        numpy_array = l.to_numpy_array()
+        self.assertEqual(numpy_array.dtype.names, ("a", "p.x", "p.y"))
+        l2 = List.create_type(list_type=Sample).from_numpy_array(numpy_array)
+        self.assertEqual(l2, l)
+        l3 = List.create_type(list_type=Sample).from_data_frame(l.to_data_frame())
+        self.assertEqual(l3, l)
+        empty_array = List(list_type=Sample).to_numpy_array()
+        self.assertEqual(empty_array.shape, (0,))
+        self.assertEqual(empty_array.dtype.names, ("a", "p.x", "p.y"))
+
+    def test_columns(self):
+        l = List(list_type=Sample, iterable=[Sample(a=i, p=Position(x=i / 2, y=-i)) for i in range(10)])
+        columns = l.to_columns()
+        self.assertEqual(list(columns), ["a", "p.x", "p.y"])
+        self.assertEqual(columns["p.x"], [i / 2 for i in range(10)])
+        l2 = List.create_type(list_type=Sample).from_columns(columns)
+        self.assertEqual(l2, l)
+        # integer columns are cast to the member type
+        l3 = List.create_type(list_type=Sample).from_columns({"a": [1, 2], "p.x": [1, 2], "p.y": [3, 4]})
+        self.assertEqual(l3[1].p.x.__class__, float)
+        # missing parents are created as objects
+        l4 = List.create_type(list_type=Object).from_columns({"name": ["a", "b"], "d.x": [1, 2]})
+        self.assertEqual(l4[1].d.x, 2)
+        self.assertEqual(l4[0].name, "a")
+
+    def test_numpy_str_columns(self):
+        l = List(list_type=Object, iterable=[Object(name="name %d" % i, value=i) for i in range(10)])
+        numpy_array = l.to_numpy_array()
+        self.assertEqual(numpy_array["name"][3], "name 3")
+        l2 = List.create_type(list_type=Object).from_numpy_array(numpy_array)
+        self.assertEqual(l2, l)
+
+    def test_numpy_simple_list(self):
+        import numpy as np
+        values = np.arange(10, dtype=float)
+        float_list = List.create_type(list_type=float)
+        self.assertEqual(float_list.from_numpy_array(values), values.tolist())
+        self.assertEqual(float_list.from_numpy_array(values.reshape(-1, 1)), values.tolist())
+
 
 if __name__ == '__main__':
     unittest.main()
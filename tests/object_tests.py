@@ -1,8 +1,22 @@
+import datetime
+import typing
 import unittest
 import sys
 sys.path.append('..')
-from jsonbind.core import Serialization
-from jsonbind.special import Object
+from jsonbind.core import Serialization, Bindings, TypeBinding, ClassPlan
+from jsonbind.special import Object, SlottedObject, List
+
+
+class Point(SlottedObject):
+    x: float = 0.0
+    y: float = 0.0
+    label: str
+
+
+class Segment(SlottedObject):
+    start: Point
+    end: Point = Point(x=1.0, y=1.0)
+    tags: List = List(list_type=str)
 
 
 class A(Object):
@@ -20,6 +34,36 @@ class C(Object):
         super(C, self).__init__(a=None, b=False, c=60, d=6.7, e="CONTROL", f=[9, 8, 7], g=Object(x=22, y=33.3, z="CONTROL"))
 
 
+class LazyA(A):
+    __lazy__ = True
+
+
+class Meta(Object):
+    created: datetime.datetime
+    tags: typing.List[str]
+
+
+class Message(Object):
+    id: int = 0
+    meta: typing.Optional[Meta] = None
+    history: typing.List[datetime.date]
+    scores: typing.Dict[str, typing.Optional[datetime.time]]
+
+
+class Track(SlottedObject):
+    start: typing.Optional[datetime.date] = None
+    points: typing.List[Point]
+
+
+class Note(Object):
+    when: datetime.date = None
+    tags: List = None
+
+
+class Stamp(SlottedObject):
+    when: datetime.date = None
+
+
 class BoundObjectTests(unittest.TestCase):
 
     def test_serialization(self):
@@ -33,6 +77,16 @@ class BoundObjectTests(unittest.TestCase):
         self.assertEqual(Serialization.deserialize('{"a":10,"b":20,"c":30,"d":[1,2,3],"e":{"x":20,"y":30}}', A), A())
         self.assertEqual(A.parse('{"a":10,"b":20,"c":30,"d":[1,2,3],"e":{"x":20,"y":30}}'), A())
 
+    def test_serialization_plan(self):
+        a = A()
+        a.a = "TEXT"
+        a.c = Object(x=1)
+        a._hidden = 5
+        self.assertEqual(Serialization.serialize(a), '{"a":"TEXT","b":20,"c":{"x":1},"d":[1,2,3],"e":{"x":20,"y":30}}')
+        a = Serialization.deserialize('{"a":10,"e":{"x":1,"y":2},"f":[1,2]}', A)
+        self.assertEqual(a.e.__class__, Object)
+        self.assertEqual(a.f, [1, 2])
+
     def test_get_and_set_item(self):
         ti = B()
         self.assertEqual(ti["c"], 30)
@@ -67,6 +121,120 @@ class BoundObjectTests(unittest.TestCase):
         self.assertEqual(c, cc)
 
 
+    def test_slotted_object(self):
+        import copy
+        import pickle
+        segment = Segment()
+        self.assertFalse(hasattr(segment, "__dict__"))
+        self.assertRaises(AttributeError, setattr, segment, "z", 1)
+        self.assertRaises(AttributeError, Point, z=1)
+        self.assertIsNot(segment.end, Segment().end)
+        self.assertIsNot(segment.tags, Segment().tags)
+        segment.tags.append("a")
+        json_string = '{"start":{"x":0.0,"y":0.0,"label":""},"end":{"x":1.0,"y":1.0,"label":""},"tags":["a"]}'
+        self.assertEqual(Serialization.serialize(segment), json_string)
+        self.assertEqual(str(segment), json_string)
+        parsed = Segment.parse('{"start":{"x":2.5,"label":"s"},"tags":["b"],"extra":1}')
+        self.assertEqual(parsed.start.x, 2.5)
+        self.assertIs(parsed.start.__class__, Point)
+        self.assertEqual(parsed.end, Point(x=1.0, y=1.0))
+        self.assertEqual(parsed["start.label"], "s")
+        parsed["start.y"] = 3
+        self.assertEqual(parsed.start.y, 3.0)
+        self.assertRaises(KeyError, parsed.__getitem__, "start.z")
+        self.assertEqual(parsed.get_values()[:3], [("start.x", 2.5), ("start.y", 3.0), ("start.label", "s")])
+        other = Segment()
+        other.set_values(parsed.get_values())
+        self.assertEqual(other, parsed)
+        for copied in [copy.copy(parsed), copy.deepcopy(parsed), pickle.loads(pickle.dumps(parsed))]:
+            self.assertEqual(copied, parsed)
+            self.assertIs(copied.__class__, Segment)
+        self.assertIsNot(copy.deepcopy(parsed).start, parsed.start)
+        Vector = SlottedObject.create_type("Vector", dx=0.0, dy=0.0)
+        self.assertEqual(Serialization.deserialize('{"dx":1,"dy":2}', Vector), Vector(dx=1, dy=2))
+        self.assertEqual(Point(x=1.0, y=2.0).convert_to(Object), Object(x=1.0, y=2.0, label=""))
+
+    def test_lazy_object(self):
+        import pickle
+        json_string = '{"a":1,"d":[4,5],"e":{"x":1,"y":2},"f":{"g":[1]}}'
+        lazy = Serialization.deserialize(json_string, LazyA)
+        self.assertEqual(set(vars(lazy)), {"b", "c"})
+        eager_string = Serialization.serialize(Serialization.deserialize(json_string, A))
+        self.assertEqual(Serialization.serialize(lazy), '{"a":1,"b":20,"c":30,"d":[4,5],"e":{"x":1,"y":2},"f":{"g":[1]}}')
+        self.assertEqual(Serialization.serialize(lazy), eager_string)
+        self.assertEqual(lazy.a, 1)
+        self.assertEqual(lazy["e.x"], 1)
+        self.assertIs(lazy.e.__class__, Object)
+        self.assertNotIn("d", vars(lazy))
+        self.assertRaises(AttributeError, getattr, lazy, "z")
+        self.assertRaises(KeyError, lazy.__getitem__, "z")
+        lazy.d = [6]
+        self.assertEqual(lazy.d, [6])
+        self.assertEqual(Serialization.serialize(lazy), eager_string.replace("[4,5]", "[6]"))
+        self.assertEqual(pickle.loads(pickle.dumps(lazy)).f, {"g": [1]})
+        eager = Serialization.deserialize(json_string, A)
+        eager.d = [6]
+        self.assertEqual(lazy, eager)
+        self.assertEqual(list(vars(pickle.loads(pickle.dumps(Serialization.deserialize(json_string, LazyA))))),
+                         list(vars(eager)))
+        self.assertEqual(list(vars(lazy)), list(vars(eager)))
+        self.assertEqual(Serialization.deserialize("{}", LazyA), A())
+
+    def test_annotated_members(self):
+        json_string = ('{"id":1,"meta":{"created":"2020-01-02 03:04:05.000000","tags":["a"]},'
+                       '"history":["2020-01-01"],"scores":{"a":"10:00:00.000000","b":null}}')
+        message = Serialization.deserialize(json_string, Message)
+        self.assertIs(message.meta.__class__, Meta)
+        self.assertEqual(message.meta.created, datetime.datetime(2020, 1, 2, 3, 4, 5))
+        self.assertEqual(message.history, [datetime.date(2020, 1, 1)])
+        self.assertEqual(message.scores, {"a": datetime.time(10), "b": None})
+        self.assertEqual(Serialization.serialize(message), json_string)
+        self.assertIsNone(Serialization.deserialize('{"meta":null}', Message).meta)
+        # objects are built without their constructor, members missing from the json get the declared defaults
+        track = Serialization.deserialize('{"start":"2020-01-01","points":[{"x":1.5}]}', Track)
+        self.assertEqual(track.start, datetime.date(2020, 1, 1))
+        self.assertEqual(track.points[0], Point(x=1.5))
+        self.assertEqual(Serialization.deserialize('{}', Track).points, [])
+        self.assertEqual(Serialization.deserialize('{"points":[{"y":2}]}', Track).points[0].label, "")
+
+    def test_none_default_members(self):
+        # members declared as x: X = None take null
+        note = Serialization.deserialize(Serialization.serialize(Note()), Note)
+        self.assertIsNone(note.when)
+        self.assertIsNone(note.tags)
+        note = Serialization.deserialize('{"when":"2021-05-05","tags":[1,2]}', Note)
+        self.assertEqual(note.when, datetime.date(2021, 5, 5))
+        self.assertEqual(note.tags, [1, 2])
+        self.assertEqual(Serialization.serialize(note), '{"when":"2021-05-05","tags":[1,2]}')
+        self.assertIsNone(Serialization.deserialize(Serialization.serialize(Stamp()), Stamp).when)
+
+    def test_plan_invalidation(self):
+        class Celsius(float):
+            pass
+
+        class Reading(Object):
+            value: Celsius = Celsius(0)
+
+        class CelsiusBinding(TypeBinding):
+            def __init__(self):
+                super().__init__(json_type=str, python_type=Celsius)
+
+            def to_json_value(self, python_value: Celsius) -> str:
+                return "%gC" % python_value
+
+            def to_python_value(self, json_value: str, python_type: type) -> Celsius:
+                return Celsius(json_value[:-1])
+
+        reading_plan = ClassPlan.get(Reading)
+        a_plan = ClassPlan.get(A)
+        self.assertEqual(Serialization.serialize(Reading(value=Celsius(20))), '{"value":20.0}')
+        Bindings.set_binding(CelsiusBinding())
+        # only the plans that use the new binding are compiled again
+        self.assertIs(ClassPlan.get(A), a_plan)
+        self.assertIsNot(ClassPlan.get(Reading), reading_plan)
+        self.assertEqual(Serialization.serialize(Reading(value=Celsius(20))), '{"value":"20C"}')
+        self.assertEqual(Serialization.deserialize('{"value":"21C"}', Reading).value, 21.0)
+
 
 if __name__ == '__main__':
     unittest.main()
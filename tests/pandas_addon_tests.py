@@ -1,9 +1,16 @@
 import unittest
 import sys
 sys.path.append('..')
-from jsonbind.special import List, Object
+from jsonbind.special import List, Object, SlottedObject
 from jsonbind.addons import pandas
 
+
+class Reading(SlottedObject):
+    sensor: str = ""
+    value: float = 0.0
+    count: int = 0
+
+
 class PandasAddonTests(unittest.TestCase):
     def test_pandas_to_data_series(self):
         o = Object(a=123,
@@ -56,6 +63,27 @@ class PandasAddonTests(unittest.TestCase):
         l2 = List.create_type(list_type=Object).from_data_frame(df)
         self.assertEqual(l2,l)
 
+    def test_pandas_dtypes(self):
+        readings = List.create_type(list_type=Reading)
+        data_frame = readings().to_data_frame()
+        self.assertEqual(list(data_frame.columns), ["sensor", "value", "count"])
+        self.assertEqual(str(data_frame["value"].dtype), "float64")
+        self.assertEqual(str(data_frame["count"].dtype), "int64")
+        l = readings([Reading(sensor="s%d" % i, value=i, count=i) for i in range(10)])
+        data_frame = l.to_data_frame(dtypes={"count": "int32"})
+        self.assertEqual(str(data_frame["count"].dtype), "int32")
+        self.assertEqual(data_frame["sensor"][3], "s3")
+        self.assertEqual(readings.from_data_frame(data_frame), l)
+
+    def test_pandas_chunks(self):
+        readings = List.create_type(list_type=Reading)
+        l = readings([Reading(sensor="s%d" % i, value=i / 2, count=i) for i in range(25)])
+        data_frames = list(l.to_data_frames(chunk_size=10))
+        self.assertEqual([len(data_frame) for data_frame in data_frames], [10, 10, 5])
+        self.assertEqual(data_frames[2].index[0], 20)
+        self.assertEqual(readings.from_data_frame(data_frames, chunk_size=3), l)
+        self.assertEqual(readings.from_data_frame(l.to_data_frame(), chunk_size=4), l)
+
 
 if __name__ == '__main__':
     unittest.main()
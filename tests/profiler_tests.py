@@ -0,0 +1,72 @@
+import unittest
+import sys
+sys.path.append('..')
+import datetime
+from jsonbind.core import Serialization, Bindings, Profiler, TypeBinding, ClassPlan
+from jsonbind.special import Object, List
+
+
+class Event(Object):
+    def __init__(self):
+        super().__init__(id=0, time=datetime.datetime(2020, 1, 1))
+
+
+class ProfilerTests(unittest.TestCase):
+
+    def test_profile(self):
+        events = List.create_type(Event)([Event() for _ in range(10)])
+        json_string = Serialization.serialize(events)
+        plan = ClassPlan.get(Event)
+        with Profiler.profile():
+            self.assertTrue(Profiler.is_enabled())
+            self.assertEqual(Serialization.deserialize(json_string, List.create_type(Event)), events)
+            Serialization.serialize(events)
+        self.assertFalse(Profiler.is_enabled())
+        stats = Profiler.stats()
+        conversions = {(c["method"], c["binding"], c["python_type"]): c["calls"] for c in stats["conversions"]}
+        self.assertEqual(conversions[("to_python_value", "ObjectBinding", "Event")], 10)
+        self.assertEqual(conversions[("to_json_value", "DateTimeBinding", "datetime")], 10)
+        # plans are not compiled again, they call the wrapped conversions of the bindings they keep
+        self.assertIs(ClassPlan.get(Event), plan)
+        self.assertGreater(stats["resolutions"]["get_binding"]["hits"], 0)
+        self.assertEqual(stats["serialization"]["deserialize"], {"calls": 1, "length_in": len(json_string), "length_out": 0})
+        self.assertEqual(stats["serialization"]["serialize"]["length_out"], len(json_string))
+        self.assertIn("DateTimeBinding", Profiler.report())
+        # disabled, the bindings and the registry are back to their originals
+        self.assertNotIn("to_json_value", vars(Bindings.get_binding(Event)))
+        self.assertEqual(vars(Bindings)["get_binding"].__func__.__name__, "get_binding")
+        Serialization.serialize(events)
+        self.assertEqual(Profiler.stats()["serialization"]["serialize"]["calls"], 1)
+
+    def test_bindings_set_while_profiling(self):
+        class Flag(object):
+            pass
+
+        class FlagBinding(TypeBinding):
+            def __init__(self):
+                super().__init__(json_type=bool, python_type=Flag)
+
+            def to_json_value(self, python_value: Flag) -> bool:
+                return True
+
+            def to_python_value(self, json_value: bool, python_type: type) -> Flag:
+                return Flag()
+
+        with Profiler.profile():
+            Bindings.set_binding(FlagBinding())
+            Serialization.serialize(Flag())
+        self.assertEqual([c["calls"] for c in Profiler.stats()["conversions"] if c["binding"] == "FlagBinding"], [1])
+        self.assertNotIn("to_json_value", vars(Bindings.get_binding(Flag)))
+
+    def test_unbound_lookups_are_misses(self):
+        class Unbound(object):
+            pass
+
+        with Profiler.profile():
+            self.assertIsNone(Bindings.find_binding(Unbound))
+            self.assertIsNone(Bindings.find_binding(Unbound))
+        self.assertEqual(Profiler.stats()["resolutions"]["find_binding"], {"hits": 0, "misses": 2})
+
+
+if __name__ == '__main__':
+    unittest.main()
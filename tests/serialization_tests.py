@@ -2,6 +2,17 @@ import unittest
 import sys
 sys.path.append('..')
 from jsonbind.core import Serialization
+from jsonbind.special import Object, List
+
+
+class Meta(Object):
+    def __init__(self):
+        super().__init__(id=0, tags=List(list_type=str))
+
+
+class Message(Object):
+    def __init__(self):
+        super().__init__(meta=Meta(), payload=Object(), history=List.create_type(Meta)(), size=0)
 
 
 class SerializationTests(unittest.TestCase):
@@ -26,6 +37,18 @@ class SerializationTests(unittest.TestCase):
         self.assertEqual(Serialization.deserialize('{"a":1,"b":2}'), {"a": 1, "b": 2})
         self.assertEqual(Serialization.deserialize('[1,2,2.3]'), [1, 2, 2.3])
 
+    def test_projection(self):
+        json_string = '{"meta":{"id":5,"tags":["a"]},"payload":{"ts":3,"data":[1,2]},"history":[{"id":1},{"id":2,"tags":["b"]}],"size":9}'
+        message = Serialization.deserialize(json_string, Message, projection=["meta.id", "payload.ts", "history.id"])
+        # members left out of the projection are not built, defaults included
+        self.assertEqual(Serialization.serialize(message), '{"meta":{"id":5},"payload":{"ts":3},"history":[{"id":1},{"id":2}]}')
+        self.assertIs(message.history[0].__class__, Meta)
+        message = Message.parse(json_string, projection=["meta", "meta.id"])
+        self.assertEqual(message.meta.tags, ["a"])
+        self.assertNotIn("payload", vars(message))
+        self.assertEqual(Serialization.deserialize(json_string, projection=["payload.ts", "history.tags", "size"]),
+                         {"payload": {"ts": 3}, "history": [{}, {"tags": ["b"]}], "size": 9})
+
 
 if __name__ == '__main__':
     unittest.main()
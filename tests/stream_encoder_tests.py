@@ -0,0 +1,98 @@
+import datetime
+import io
+import unittest
+import sys
+sys.path.append('..')
+import jsonbind
+from jsonbind.core import Serialization, StreamEncoder, Bindings
+from jsonbind.bindings import BoundClass
+from jsonbind.special import List, Object
+from jsonbind.special.list import ListBinding
+from jsonbind.special.object import ObjectBinding
+
+
+class A(Object):
+    def __init__(self):
+        super(A, self).__init__(a=10, b="Ünicode", c=datetime.datetime(2020, 1, 1, 10, 10, 10, 100), d=(1, 2),
+                                e=Object(x=20.5, y=[Object(z=None)]), f={"k": {2, 3}}, _g=5)
+
+
+class B(BoundClass):
+    def __init__(self):
+        self.a = [A(), A()]
+        self.b = b"Hello"
+
+
+class Pair(List):
+    pass
+
+
+class PairBinding(ListBinding):
+    def to_json_value(self, python_value):
+        return {"first": python_value[0], "second": python_value[1]}
+
+
+class Point(Object):
+    pass
+
+
+class PointBinding(ObjectBinding):
+    def __init__(self):
+        super().__init__()
+        self.python_type = Point
+
+    def to_json_value(self, python_value):
+        return [python_value.x, python_value.y]
+
+
+Bindings.set_binding(PairBinding(python_type=Pair))
+Bindings.set_binding(PointBinding())
+
+
+class StreamEncoderTests(unittest.TestCase):
+
+    def assert_same_encoding(self, value, **kwargs):
+        expected = Serialization.serialize(value, **kwargs)
+        text = io.StringIO()
+        Serialization.serialize_to(value, text, **kwargs)
+        self.assertEqual(text.getvalue(), expected)
+        self.assertEqual("".join(StreamEncoder(separators=(',', ':'), **kwargs).iterencode(value)), expected)
+
+    def test_stream_encoding(self):
+        values = [None, 1, 1.5, True, "Hello", [], {}, [1, [2, {"a": [3]}]], A(), B(),
+                  List(list_type=A, iterable=[A(), A()]), List(), {1: A(), 2: None}]
+        for value in values:
+            self.assert_same_encoding(value)
+            self.assert_same_encoding(value, indent=2)
+            self.assert_same_encoding(value, indent="\t", sort_keys=True, ensure_ascii=False)
+
+    def test_overridden_to_json_value(self):
+        # bindings that only override to_json_value do not inherit the item hooks of their base
+        for value in [Pair(iterable=[1, 2]), Point(x=1, y=2), [Pair(iterable=[1, 2]), Object(p=Point(x=1, y=2))]]:
+            self.assert_same_encoding(value)
+        self.assertEqual(jsonbind.dumps(Point(x=1, y=2)), "[1,2]")
+
+    def test_dump(self):
+        value = List(list_type=A, iterable=[A() for _ in range(1000)])
+        expected = jsonbind.dumps(value)
+        binary = io.BytesIO()
+        written = jsonbind.dump(value, binary)
+        self.assertEqual(binary.getvalue(), expected.encode("utf8"))
+        self.assertEqual(written, len(binary.getvalue()))
+        text = io.StringIO()
+        jsonbind.dump(value, text)
+        self.assertEqual(text.getvalue(), expected)
+
+    def test_errors(self):
+        value = [1]
+        value.append(value)
+        self.assertRaises(ValueError, Serialization.serialize_to, value, io.StringIO())
+        self.assertRaises(ValueError, Serialization.serialize_to, float("nan"), io.StringIO(), allow_nan=False)
+        self.assertRaises(TypeError, Serialization.serialize_to, {(1, 2): 1}, io.StringIO())
+        text = io.StringIO()
+        Serialization.serialize_to({(1, 2): 1, "a": 2}, text, skipkeys=True)
+        self.assertEqual(text.getvalue(), '{"a":2}')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -65,6 +65,34 @@ class BindingManagerTests(unittest.TestCase):
         self.assertEqual(Bindings.to_python_value([1,2,3,4]), [1, 2, 3, 4])
         self.assertEqual(Bindings.to_python_value({"a": 10, "b": 20}), {"a": 10, "b": 20})
 
+    def test_binding_cache(self):
+        class Parent(object):
+            pass
+
+        class Child(Parent):
+            pass
+
+        class ParentBinding(CustomBinding):
+            def __init__(self):
+                TypeBinding.__init__(self, json_type=int, python_type=Parent)
+
+        class ChildBinding(CustomBinding):
+            def __init__(self):
+                TypeBinding.__init__(self, json_type=int, python_type=Child)
+
+        self.assertFalse(Bindings.is_bonded(Child))
+        self.assertNotIn(Child, Bindings.__bonds__)
+        parent_binding = ParentBinding()
+        Bindings.set_binding(parent_binding)
+        self.assertTrue(Bindings.is_bonded(Child))
+        self.assertIs(Bindings.get_binding(Child), parent_binding)
+        int_binding = Bindings.get_binding(int)
+        child_binding = ChildBinding()
+        Bindings.set_binding(child_binding)
+        self.assertIs(Bindings.get_binding(Child), child_binding)
+        self.assertIs(Bindings.get_binding(Parent), parent_binding)
+        self.assertIs(Bindings.__bonds__[int], int_binding)
+
 
 if __name__ == '__main__':
     unittest.main()